@@ -369,7 +369,9 @@ users:
             "DROP TASK IF EXISTS TASK_MONITOR_GITHUB_HEALTH",
             "DROP PROCEDURE IF EXISTS SP_SUBMIT_PR_REQUEST(STRING, STRING, STRING, STRING, STRING, STRING, STRING, INTEGER)",
             "DROP PROCEDURE IF EXISTS SP_GET_NEXT_PENDING_REQUEST(STRING)",
+            "DROP PROCEDURE IF EXISTS SP_GET_PENDING_BATCH(STRING, INTEGER)",
             "DROP PROCEDURE IF EXISTS SP_UPDATE_REQUEST_STATUS(STRING, STRING, STRING, STRING, INTEGER, STRING, STRING)",
+            "DROP PROCEDURE IF EXISTS SP_UPDATE_REQUEST_STATUS_BATCH(STRING)",
             "DROP PROCEDURE IF EXISTS SP_CLEANUP_OLD_REQUESTS(INTEGER)",
             "DROP PROCEDURE IF EXISTS SP_GET_REQUEST_STATUS(STRING, STRING)",
             "DROP PROCEDURE IF EXISTS SP_PROCESS_GITHUB_REQUESTS()",
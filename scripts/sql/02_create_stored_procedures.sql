@@ -217,6 +217,91 @@ EXCEPTION
 END;
 $$;
 
+-- ================================================================
+-- 2b. Procedure: Get Pending Request Batch
+-- ================================================================
+
+CREATE OR REPLACE PROCEDURE SP_GET_PENDING_BATCH(
+    P_PROCESSOR_ID STRING,
+    P_LIMIT INTEGER DEFAULT 10
+)
+RETURNS VARIANT
+LANGUAGE SQL
+EXECUTE AS CALLER
+COMMENT = 'Claim up to P_LIMIT pending PR requests and return them in one call'
+AS
+$$
+DECLARE
+    v_request_ids ARRAY;
+    v_requests ARRAY;
+BEGIN
+    -- Find the highest priority, oldest pending requests
+    SELECT ARRAY_AGG(REQUEST_ID)
+    INTO v_request_ids
+    FROM (
+        SELECT REQUEST_ID
+        FROM SNOWDDL_CONFIG_REQUESTS
+        WHERE STATUS = 'PENDING'
+          AND RETRY_COUNT < MAX_RETRIES
+        ORDER BY PRIORITY DESC, CREATED_AT ASC
+        LIMIT :P_LIMIT
+    );
+
+    -- Claim them (skipping any another processor picked up in the meantime)
+    UPDATE SNOWDDL_CONFIG_REQUESTS
+    SET STATUS = 'PROCESSING',
+        PROCESSOR_ID = :P_PROCESSOR_ID,
+        PROCESSED_AT = CURRENT_TIMESTAMP()
+    WHERE STATUS = 'PENDING'
+      AND ARRAY_CONTAINS(REQUEST_ID::VARIANT, :v_request_ids);
+
+    -- Collect only the requests this call claimed, not earlier claims still
+    -- held by the same processor
+    SELECT ARRAY_AGG(OBJECT_CONSTRUCT(
+        'REQUEST_ID', REQUEST_ID,
+        'BRANCH_NAME', BRANCH_NAME,
+        'PR_TITLE', PR_TITLE,
+        'PR_DESCRIPTION', PR_DESCRIPTION,
+        'TARGET_BRANCH', TARGET_BRANCH,
+        'FILE_NAME', FILE_NAME,
+        -- Base64 encoded here so the monitor can pass it straight to GitHub
+        'FILE_CONTENT_B64', BASE64_ENCODE(FILE_CONTENT:content::STRING),
+        'STAGE_PATH', STAGE_PATH,
+        'CREATED_BY', CREATED_BY,
+        'PRIORITY', PRIORITY,
+        'CREATED_AT', CREATED_AT
+    )) WITHIN GROUP (ORDER BY PRIORITY DESC, CREATED_AT ASC)
+    INTO v_requests
+    FROM SNOWDDL_CONFIG_REQUESTS
+    WHERE STATUS = 'PROCESSING'
+      AND PROCESSOR_ID = :P_PROCESSOR_ID
+      AND ARRAY_CONTAINS(REQUEST_ID::VARIANT, :v_request_ids);
+
+    IF (v_requests IS NULL OR ARRAY_SIZE(v_requests) = 0) THEN
+        RETURN PARSE_JSON('{"status": "SUCCESS", "requests": []}');
+    END IF;
+
+    -- Log the processing start for each claimed request
+    INSERT INTO SNOWDDL_CONFIG_PROCESSING_LOG (
+        REQUEST_ID,
+        LEVEL,
+        MESSAGE,
+        PROCESSOR_ID
+    )
+    SELECT value:REQUEST_ID::STRING,
+           'INFO',
+           'Request picked up for processing',
+           :P_PROCESSOR_ID
+    FROM TABLE(FLATTEN(INPUT => :v_requests));
+
+    RETURN OBJECT_CONSTRUCT('status', 'SUCCESS', 'requests', v_requests);
+
+EXCEPTION
+    WHEN OTHER THEN
+        RETURN PARSE_JSON('{"status": "ERROR", "message": "' || SQLERRM || '"}');
+END;
+$$;
+
 -- ================================================================
 -- 3. Procedure: Update Request Status
 -- ================================================================
@@ -320,6 +405,61 @@ EXCEPTION
 END;
 $$;
 
+-- ================================================================
+-- 3b. Procedure: Update Request Status Batch
+-- ================================================================
+
+CREATE OR REPLACE PROCEDURE SP_UPDATE_REQUEST_STATUS_BATCH(
+    P_UPDATES STRING
+)
+RETURNS VARIANT
+LANGUAGE SQL
+EXECUTE AS CALLER
+COMMENT = 'Apply a JSON array of status updates in one call'
+AS
+$$
+DECLARE
+    v_update VARIANT;
+    v_request_id STRING;
+    v_result STRING;
+    v_results ARRAY DEFAULT ARRAY_CONSTRUCT();
+BEGIN
+    -- Each element carries the SP_UPDATE_REQUEST_STATUS arguments by name
+    LET rs RESULTSET := (
+        SELECT value AS UPDATE_ROW
+        FROM TABLE(FLATTEN(INPUT => PARSE_JSON(:P_UPDATES)))
+        ORDER BY index
+    );
+    LET c_updates CURSOR FOR rs;
+
+    FOR rec IN c_updates DO
+        v_update := rec.UPDATE_ROW;
+        v_request_id := v_update:request_id::STRING;
+
+        CALL SP_UPDATE_REQUEST_STATUS(
+            :v_request_id,
+            v_update:status::STRING,
+            v_update:github_branch_url::STRING,
+            v_update:github_pr_url::STRING,
+            v_update:github_pr_number::INTEGER,
+            v_update:error_message::STRING,
+            v_update:processor_id::STRING
+        ) INTO :v_result;
+
+        v_results := ARRAY_APPEND(
+            v_results,
+            OBJECT_CONSTRUCT('request_id', v_request_id, 'result', v_result)
+        );
+    END FOR;
+
+    RETURN OBJECT_CONSTRUCT('status', 'SUCCESS', 'results', v_results);
+
+EXCEPTION
+    WHEN OTHER THEN
+        RETURN PARSE_JSON('{"status": "ERROR", "message": "' || SQLERRM || '"}');
+END;
+$$;
+
 -- ================================================================
 -- 4. Procedure: Cleanup Old Requests
 -- ================================================================
@@ -473,7 +613,9 @@ $$;
 
 GRANT USAGE ON PROCEDURE SP_SUBMIT_PR_REQUEST(STRING, STRING, STRING, STRING, STRING, STRING, STRING, INTEGER) TO ROLE SNOWDDL_CONFIG_MANAGER;
 GRANT USAGE ON PROCEDURE SP_GET_NEXT_PENDING_REQUEST(STRING) TO ROLE SNOWDDL_CONFIG_MANAGER;
+GRANT USAGE ON PROCEDURE SP_GET_PENDING_BATCH(STRING, INTEGER) TO ROLE SNOWDDL_CONFIG_MANAGER;
 GRANT USAGE ON PROCEDURE SP_UPDATE_REQUEST_STATUS(STRING, STRING, STRING, STRING, INTEGER, STRING, STRING) TO ROLE SNOWDDL_CONFIG_MANAGER;
+GRANT USAGE ON PROCEDURE SP_UPDATE_REQUEST_STATUS_BATCH(STRING) TO ROLE SNOWDDL_CONFIG_MANAGER;
 GRANT USAGE ON PROCEDURE SP_CLEANUP_OLD_REQUESTS(INTEGER) TO ROLE SNOWDDL_CONFIG_MANAGER;
 GRANT USAGE ON PROCEDURE SP_GET_REQUEST_STATUS(STRING, STRING) TO ROLE SNOWDDL_CONFIG_READER;
 
@@ -499,4 +641,10 @@ CALL SP_GET_REQUEST_STATUS(NULL, 'feature/test-branch');
 
 -- Test getting next pending request
 CALL SP_GET_NEXT_PENDING_REQUEST('test_processor');
+
+-- Test claiming a batch of pending requests
+CALL SP_GET_PENDING_BATCH('test_processor', 10);
+
+-- Test updating several request statuses at once
+CALL SP_UPDATE_REQUEST_STATUS_BATCH('[{"request_id": "<id>", "status": "CANCELLED", "processor_id": "test_processor"}]');
 */
@@ -12,15 +12,16 @@ Usage:
 
 import os
 import subprocess
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 try:
     from env_loader import (
         load_snowflake_env,
         get_connection_info,
-        EnvironmentError,
-        AuthenticationError,
+        SnowEnvError,
+        SnowAuthError,
     )
     from rich.console import Console
     from rich.panel import Panel
@@ -46,7 +47,7 @@ def load_environment() -> Dict[str, Any]:
             "password": env_vars.get("SNOWFLAKE_PASSWORD"),
             "passphrase": env_vars.get("SNOWFLAKE_PRIVATE_KEY_PASSPHRASE"),
         }
-    except (EnvironmentError, AuthenticationError) as e:
+    except (SnowEnvError, SnowAuthError) as e:
         console = Console()
         console.print(f"[red]Environment configuration error: {str(e)}[/red]")
         console.print("[yellow]Run 'uv run test-env' for detailed diagnostics[/yellow]")
@@ -68,32 +69,44 @@ def check_snow_cli_auth() -> Tuple[bool, str, str]:
         return False, "", str(e)
 
 
-def check_private_key_file(key_path: str) -> Dict[str, Any]:
+@dataclass(slots=True)
+class KeyCheck:
+    """Result of a private key file check"""
+
+    exists: bool = False
+    readable: bool = False
+    permissions: str = "unknown"
+    size: int = 0
+    warning: Optional[str] = None
+    error: Optional[str] = None
+
+
+def check_private_key_file(key_path: str) -> KeyCheck:
     """Check private key file validity."""
     if not key_path:
-        return {"exists": False, "error": "No private key path specified"}
+        return KeyCheck(error="No private key path specified")
 
     key_file = Path(key_path)
     if not key_file.exists():
-        return {"exists": False, "error": f"Private key file not found: {key_path}"}
+        return KeyCheck(error=f"Private key file not found: {key_path}")
 
     if not key_file.is_file():
-        return {"exists": False, "error": f"Private key path is not a file: {key_path}"}
+        return KeyCheck(error=f"Private key path is not a file: {key_path}")
 
     # Check file permissions
     stat_info = key_file.stat()
     permissions = oct(stat_info.st_mode)[-3:]
 
-    result = {
-        "exists": True,
-        "readable": os.access(key_file, os.R_OK),
-        "permissions": permissions,
-        "size": stat_info.st_size,
-    }
+    result = KeyCheck(
+        exists=True,
+        readable=os.access(key_file, os.R_OK),
+        permissions=permissions,
+        size=stat_info.st_size,
+    )
 
     # Check if permissions are secure
     if permissions not in ["600", "400"]:
-        result["warning"] = f"Insecure permissions {permissions} - should be 600 or 400"
+        result.warning = f"Insecure permissions {permissions} - should be 600 or 400"
 
     return result
 
@@ -101,13 +114,13 @@ def check_private_key_file(key_path: str) -> Dict[str, Any]:
 def suggest_fixes(
     env_config: Dict[str, Any],
     auth_status: Tuple[bool, str, str],
-    key_check: Dict[str, Any],
+    key_check: KeyCheck,
 ) -> List[str]:
     """Generate specific fix suggestions based on diagnostics."""
     fixes = []
 
     # Check authentication method
-    has_private_key = env_config["private_key_path"] and key_check.get("exists", False)
+    has_private_key = env_config["private_key_path"] and key_check.exists
     has_password = bool(env_config["password"])
 
     if not has_private_key and not has_password:
@@ -117,15 +130,13 @@ def suggest_fixes(
         )
 
     # Private key issues
-    if env_config["private_key_path"] and not key_check.get("exists", False):
-        fixes.append(
-            f"🔧 **Private Key Issue**: {key_check.get('error', 'Unknown error')}"
-        )
+    if env_config["private_key_path"] and not key_check.exists:
+        fixes.append(f"🔧 **Private Key Issue**: {key_check.error or 'Unknown error'}")
         fixes.append("   → Check the path in SNOWFLAKE_PRIVATE_KEY_PATH")
         fixes.append("   → Ensure the file exists and is readable")
 
-    if key_check.get("warning"):
-        fixes.append(f"🔧 **Security Warning**: {key_check['warning']}")
+    if key_check.warning:
+        fixes.append(f"🔧 **Security Warning**: {key_check.warning}")
         fixes.append(f"   → Run: chmod 600 {env_config['private_key_path']}")
 
     # Snow CLI connection issues
@@ -208,7 +219,7 @@ def main():
     console.print(env_table)
 
     # Check private key if specified
-    key_check = {}
+    key_check = KeyCheck()
     if env_config["private_key_path"]:
         console.print("\n[bold blue]Checking Private Key File...[/bold blue]")
         key_check = check_private_key_file(env_config["private_key_path"])
@@ -217,14 +228,14 @@ def main():
         key_table.add_column("Check", style="bold")
         key_table.add_column("Result")
 
-        key_table.add_row("File Exists", "✓" if key_check.get("exists") else "❌")
-        if key_check.get("exists"):
-            key_table.add_row("Readable", "✓" if key_check.get("readable") else "❌")
+        key_table.add_row("File Exists", "✓" if key_check.exists else "❌")
+        if key_check.exists:
+            key_table.add_row("Readable", "✓" if key_check.readable else "❌")
             key_table.add_row(
                 "Permissions",
-                f"{key_check.get('permissions', 'unknown')} {'⚠️' if key_check.get('warning') else '✓'}",
+                f"{key_check.permissions} {'⚠️' if key_check.warning else '✓'}",
             )
-            key_table.add_row("Size", f"{key_check.get('size', 0)} bytes")
+            key_table.add_row("Size", f"{key_check.size} bytes")
 
         console.print(key_table)
 
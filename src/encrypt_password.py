@@ -29,7 +29,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from user_management.encryption import FernetEncryption, FernetEncryptionError
-from env_loader import validate_auth, EnvironmentError
+from env_loader import validate_auth, SnowEnvError
 from rich.console import Console
 from rich.prompt import Prompt
 
@@ -83,7 +83,7 @@ def main():
 
         load_snowflake_env(validate_auth=False)  # Only validate required vars, not auth
         console.print("✓ [green]Environment configuration validated[/green]")
-    except EnvironmentError as e:
+    except SnowEnvError as e:
         if "SNOWFLAKE_CONFIG_FERNET_KEYS" in str(e):
             console.print(
                 "❌ [red]Missing SNOWFLAKE_CONFIG_FERNET_KEYS environment variable[/red]"
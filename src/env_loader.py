@@ -28,8 +28,10 @@ Usage:
 """
 
 import os
+import re
 import sys
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Tuple, List
 from dotenv import load_dotenv
@@ -41,29 +43,29 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-class EnvironmentError(Exception):
+class SnowEnvError(Exception):
     """Custom exception for environment variable issues."""
 
-    pass
+    __slots__ = ()
 
 
-class AuthenticationError(EnvironmentError):
+class SnowAuthError(SnowEnvError):
     """Custom exception for authentication configuration issues."""
 
-    pass
+    __slots__ = ()
 
 
 # Required environment variables for Snowflake connection
-REQUIRED_VARS = [
+REQUIRED_VARS = (
     "SNOWFLAKE_ACCOUNT",
     "SNOWFLAKE_USER",
     "SNOWFLAKE_ROLE",
     "SNOWFLAKE_WAREHOUSE",
     "SNOWFLAKE_CONFIG_FERNET_KEYS",
-]
+)
 
 # Optional variables that may be needed based on configuration
-OPTIONAL_VARS = [
+OPTIONAL_VARS = (
     "SNOWFLAKE_DATABASE",
     "SNOWFLAKE_SCHEMA",
     "SNOWFLAKE_PASSWORD",
@@ -72,47 +74,63 @@ OPTIONAL_VARS = [
     "SNOWFLAKE_REGION",
     "SNOWFLAKE_CONNECT_TIMEOUT",
     "SNOWFLAKE_NETWORK_TIMEOUT",
-]
+)
 
 # Authentication methods (at least one required)
-AUTH_VARS = ["SNOWFLAKE_PRIVATE_KEY_PATH", "SNOWFLAKE_PASSWORD"]
+AUTH_VARS = ("SNOWFLAKE_PRIVATE_KEY_PATH", "SNOWFLAKE_PASSWORD")
+
+# Variable names whose values are masked in connection info output
+_SENSITIVE_RE = re.compile(r"PASSWORD|KEY|SECRET", re.IGNORECASE)
+
+
+# Files/directories that mark a project root when walking up from the cwd
+PROJECT_INDICATORS = frozenset({"pyproject.toml", "setup.py", ".git", "uv.lock"})
+
+# Resolved .env paths, keyed by the working directory they were found from
+_ENV_PATH_CACHE: Dict[str, Path] = {}
+
+# Result of loading a .env file, keyed by (path, mtime_ns) so edits reload it
+_ENV_LOAD_CACHE: Dict[Tuple[Path, int], bool] = {}
+
+
+def _scan_names(directory: str) -> frozenset:
+    """Return the entry names of a directory in a single scandir pass."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
 
 
 def find_env_file() -> Optional[Path]:
     """
     Find the .env file in the project hierarchy.
 
-    Searches from current directory up to project root.
+    Searches from current directory up to project root. The walk runs on
+    plain strings, each directory is listed once with ``os.scandir`` rather
+    than probed per indicator, and the result is cached per working
+    directory.
 
     Returns:
         Path to .env file if found, None otherwise
     """
-    current_dir = Path.cwd()
+    current_dir = os.getcwd()
 
-    # First try current directory
-    env_path = current_dir / ".env"
-    if env_path.exists():
-        logger.debug(f"Found .env file at: {env_path}")
-        return env_path
-
-    # Try to find project root indicators
-    project_indicators = ["pyproject.toml", "setup.py", ".git", "uv.lock"]
+    cached = _ENV_PATH_CACHE.get(current_dir)
+    if cached is not None and os.path.exists(cached):
+        return cached
 
-    # Walk up the directory tree
-    for parent in [current_dir] + list(current_dir.parents):
-        # Check if this looks like project root
-        if any((parent / indicator).exists() for indicator in project_indicators):
-            env_path = parent / ".env"
-            if env_path.exists():
-                logger.debug(f"Found .env file at project root: {env_path}")
-                return env_path
+    env_path = _find_project_env_file(current_dir)
+    if env_path is not None:
+        _ENV_PATH_CACHE[current_dir] = env_path
+        return env_path
 
     # Allow environment variable override for custom .env location
     env_override = os.environ.get("SNOWTOWER_ENV_PATH")
     if env_override:
         override_path = Path(env_override)
         if override_path.exists():
-            logger.debug(f"Found .env file at environment override: {override_path}")
+            logger.debug("Found .env file at environment override: %s", override_path)
             return override_path
         else:
             logger.warning(
@@ -122,6 +140,29 @@ def find_env_file() -> Optional[Path]:
     return None
 
 
+def _find_project_env_file(current_dir: str) -> Optional[Path]:
+    """Walk up from current_dir looking for a .env file."""
+    directory = current_dir
+    while True:
+        names = _scan_names(directory)
+        if ".env" in names:
+            # The current directory wins outright; ancestors must look like a root
+            if directory == current_dir:
+                env_path = Path(directory, ".env")
+                logger.debug("Found .env file at: %s", env_path)
+                return env_path
+
+            if PROJECT_INDICATORS & names:
+                env_path = Path(directory, ".env")
+                logger.debug("Found .env file at project root: %s", env_path)
+                return env_path
+
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
 def load_env_file() -> bool:
     """
     Load environment variables from .env file.
@@ -130,27 +171,36 @@ def load_env_file() -> bool:
         True if .env file was found and loaded, False otherwise
 
     Raises:
-        EnvironmentError: If .env file cannot be found
+        SnowEnvError: If .env file cannot be found
     """
     env_path = find_env_file()
 
     if env_path is None:
-        raise EnvironmentError(
+        raise SnowEnvError(
             "No .env file found. Please ensure .env file exists in:\n"
             "  - Current directory\n"
             "  - Project root directory\n"
             "  - /Users/ssciortino/Projects/snowtower-workspace/snowtower-snowddl/"
         )
 
+    try:
+        cache_key = (env_path, env_path.stat().st_mtime_ns)
+    except OSError as e:
+        raise SnowEnvError(f"Error loading .env file {env_path}: {str(e)}")
+
+    if cache_key in _ENV_LOAD_CACHE:
+        return _ENV_LOAD_CACHE[cache_key]
+
     try:
         success = load_dotenv(env_path, override=True)
         if success:
             logger.info(f"Successfully loaded environment variables from: {env_path}")
         else:
             logger.warning(f"Failed to load environment variables from: {env_path}")
+        _ENV_LOAD_CACHE[cache_key] = success
         return success
     except Exception as e:
-        raise EnvironmentError(f"Error loading .env file {env_path}: {str(e)}")
+        raise SnowEnvError(f"Error loading .env file {env_path}: {str(e)}")
 
 
 def validate_required_vars() -> Tuple[List[str], List[str]]:
@@ -162,19 +212,31 @@ def validate_required_vars() -> Tuple[List[str], List[str]]:
     """
     present_vars = []
     missing_vars = []
+    environ = os.environ
 
     for var in REQUIRED_VARS:
-        value = os.getenv(var)
+        value = environ.get(var)
         if value and value.strip():
             present_vars.append(var)
-            logger.debug(f"✓ {var}: {'*' * min(len(value), 8)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("✓ %s: %s", var, "*" * min(len(value), 8))
         else:
             missing_vars.append(var)
-            logger.warning(f"✗ {var}: Missing or empty")
+            logger.warning("✗ %s: Missing or empty", var)
 
     return present_vars, missing_vars
 
 
+def _missing_required() -> Optional[str]:
+    """Return the first missing required variable, or None if all are set."""
+    environ = os.environ
+    for var in REQUIRED_VARS:
+        value = environ.get(var)
+        if not value or not value.strip():
+            return var
+    return None
+
+
 def validate_auth_config() -> Tuple[bool, List[str], str]:
     """
     Validate authentication configuration.
@@ -191,12 +253,11 @@ def validate_auth_config() -> Tuple[bool, List[str], str]:
     # Check RSA key authentication
     key_path = os.getenv("SNOWFLAKE_PRIVATE_KEY_PATH")
     if key_path and key_path.strip():
-        key_file = Path(key_path)
-        if key_file.exists() and key_file.is_file():
+        if os.path.isfile(key_path):
             available_methods.append("RSA_KEY")
-            logger.debug(f"✓ RSA Key found at: {key_path}")
+            logger.debug("✓ RSA Key found at: %s", key_path)
         else:
-            logger.warning(f"✗ RSA Key path specified but file not found: {key_path}")
+            logger.warning("✗ RSA Key path specified but file not found: %s", key_path)
 
     # Check password authentication
     password = os.getenv("SNOWFLAKE_PASSWORD")
@@ -227,25 +288,24 @@ def load_snowflake_env(validate_auth: bool = True) -> Dict[str, str]:
         Dictionary containing all loaded environment variables
 
     Raises:
-        EnvironmentError: If required variables are missing
-        AuthenticationError: If authentication configuration is invalid
+        SnowEnvError: If required variables are missing
+        SnowAuthError: If authentication configuration is invalid
     """
     logger.info("Loading Snowflake environment configuration...")
 
     # Load .env file
     load_env_file()
 
-    # Validate required variables
-    present_vars, missing_vars = validate_required_vars()
-
-    if missing_vars:
+    # Validate required variables, building the detailed report only on failure
+    if _missing_required() is not None:
+        present_vars, missing_vars = validate_required_vars()
         error_msg = (
             f"Missing required environment variables: {', '.join(missing_vars)}\n\n"
             "Required variables:\n"
             + "\n".join(f"  - {var}" for var in REQUIRED_VARS)
             + "\n\nPlease check your .env file configuration."
         )
-        raise EnvironmentError(error_msg)
+        raise SnowEnvError(error_msg)
 
     # Validate authentication if requested
     if validate_auth:
@@ -259,23 +319,15 @@ def load_snowflake_env(validate_auth: bool = True) -> Dict[str, str]:
                 "  - SNOWFLAKE_PASSWORD (fallback)\n\n"
                 "For RSA key setup, see: docs/RSA_KEY_SETUP.md"
             )
-            raise AuthenticationError(error_msg)
+            raise SnowAuthError(error_msg)
 
         logger.info(f"Authentication methods available: {', '.join(auth_methods)}")
         logger.info(f"Recommended method: {recommended}")
 
-    # Collect all environment variables
-    env_vars = {}
-
-    # Add required variables
-    for var in REQUIRED_VARS:
-        env_vars[var] = os.getenv(var, "")
-
-    # Add optional variables if present
-    for var in OPTIONAL_VARS:
-        value = os.getenv(var)
-        if value is not None:
-            env_vars[var] = value
+    # Collect required variables, then optional variables if present
+    environ = os.environ
+    env_vars = {var: environ.get(var, "") for var in REQUIRED_VARS}
+    env_vars.update((var, environ[var]) for var in OPTIONAL_VARS if var in environ)
 
     logger.info(f"Successfully loaded {len(env_vars)} environment variables")
     return env_vars
@@ -304,32 +356,43 @@ def validate_auth() -> bool:
         return False
 
 
-def get_connection_info() -> Dict[str, str]:
+def get_connection_info(env_vars: Optional[Dict[str, str]] = None) -> Dict[str, str]:
     """
     Get formatted connection information for debugging.
 
+    Args:
+        env_vars: Already-loaded environment from load_snowflake_env(); loaded
+            on demand when omitted
+
     Returns:
         Dictionary with connection details (sensitive values masked)
     """
     try:
-        env_vars = load_snowflake_env()
-
-        # Mask sensitive values
-        masked_vars = {}
-        for key, value in env_vars.items():
-            if any(
-                sensitive in key.upper() for sensitive in ["PASSWORD", "KEY", "SECRET"]
-            ):
-                masked_vars[key] = "*" * min(len(str(value)), 8) if value else "Not set"
-            else:
-                masked_vars[key] = value or "Not set"
+        if env_vars is None:
+            env_vars = load_snowflake_env()
 
-        return masked_vars
+        # Mask sensitive values (cached; callers get their own dict)
+        return dict(_masked_view(tuple(env_vars.items())))
 
     except Exception as e:
         return {"error": str(e)}
 
 
+@lru_cache(maxsize=4)
+def _masked_view(items: Tuple[Tuple[str, str], ...]) -> Tuple[Tuple[str, str], ...]:
+    """Mask sensitive values in a snapshot of environment items."""
+    is_sensitive = _SENSITIVE_RE.search
+    masked_items = []
+    for key, value in items:
+        if is_sensitive(key):
+            masked_items.append(
+                (key, "*" * min(len(str(value)), 8) if value else "Not set")
+            )
+        else:
+            masked_items.append((key, value or "Not set"))
+    return tuple(masked_items)
+
+
 def test_environment() -> None:
     """
     Test environment configuration and print detailed results.
@@ -355,7 +418,7 @@ def test_environment() -> None:
         # Show connection information
         print("\n📋 Connection Configuration:")
         print("-" * 30)
-        conn_info = get_connection_info()
+        conn_info = get_connection_info(env_vars)
         for key, value in sorted(conn_info.items()):
             if key != "error":
                 print(f"  {key}: {value}")
@@ -10,25 +10,57 @@ Usage:
     uv run fix-auth
 """
 
+import json
 import os
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
 
 try:
     from dotenv import load_dotenv
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-    from rich.prompt import Prompt, Confirm
 except ImportError as e:
     print(f"ERROR: Missing required dependencies: {e}")
     print("Please run: uv sync")
     exit(1)
 
+# Rich is only needed by the interactive wizard, so it is imported inside the
+# functions that render output rather than when the module is loaded
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# First cell of a `snow connection list` table row, skipping border lines
+_CONNECTION_ROW_RE = re.compile(r"^[|│]\s*([^\s|│+\-─][^|│]*?)\s*[|│]")
+
+# Fallback .env location when no project .env is found from the cwd
+_DEFAULT_ENV_PATH = Path(__file__).resolve().parents[1] / ".env"
+
+
+def _find_env_file() -> Optional[Path]:
+    """Locate the project .env with env_loader, if it can be imported"""
+    try:
+        from env_loader import find_env_file
+    except ImportError:
+        try:
+            # Installed entry point: the source tree is the `src` package
+            from src.env_loader import find_env_file
+        except ImportError:
+            return None
+    return find_env_file()
+
 
 def main():
     """Main authentication fix function."""
+    try:
+        from rich.console import Console
+        from rich.panel import Panel
+        from rich.prompt import Confirm
+    except ImportError as e:
+        print(f"ERROR: Missing required dependencies: {e}")
+        print("Please run: uv sync")
+        exit(1)
+
     console = Console()
 
     console.print(
@@ -41,7 +73,7 @@ def main():
     )
 
     # Load current environment
-    env_path = Path(__file__).parent.parent / ".env"
+    env_path = _find_env_file() or _DEFAULT_ENV_PATH
     load_dotenv(env_path)
 
     current_config = {
@@ -64,40 +96,33 @@ def main():
     # Check snow CLI connections
     console.print("\n[bold blue]Checking Snow CLI Connections...[/bold blue]")
     try:
-        result = subprocess.run(
-            ["snow", "connection", "list"], capture_output=True, text=True, timeout=10
-        )
-        if result.returncode == 0:
+        list_ok, connections, list_stderr = list_connections()
+        if list_ok:
             console.print("[green]Available Connections:[/green]")
-            console.print(result.stdout)
+            for conn_name in connections:
+                console.print(f"  - {conn_name}")
 
-            # Test each connection
+            # Test each connection; the probes are network-bound so run them
+            # concurrently and report in list order
             console.print("\n[bold blue]Testing Connections...[/bold blue]")
-            connections = parse_connections(result.stdout)
             working_connections = []
 
-            for conn_name in connections:
+            test_results = []
+            if connections:
+                with ThreadPoolExecutor(
+                    max_workers=min(8, len(connections))
+                ) as executor:
+                    test_results = list(executor.map(_test_connection, connections))
+
+            for conn_name, works, detail in test_results:
                 console.print(f"Testing connection: {conn_name}")
-                test_result = subprocess.run(
-                    [
-                        "snow",
-                        "sql",
-                        "-c",
-                        conn_name,
-                        "-q",
-                        "SELECT CURRENT_USER(), CURRENT_ROLE()",
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=15,
-                )
-                if test_result.returncode == 0:
+                if works:
                     console.print(f"[green]✓[/green] {conn_name} - Working")
                     working_connections.append(conn_name)
-                    console.print(f"  Result: {test_result.stdout.strip()}")
+                    console.print(f"  Result: {detail}")
                 else:
                     console.print(f"[red]✗[/red] {conn_name} - Failed")
-                    console.print(f"  Error: {test_result.stderr.strip()}")
+                    console.print(f"  Error: {detail}")
 
             # Provide recommendations
             if working_connections:
@@ -139,7 +164,7 @@ def main():
 
         else:
             console.print("[red]Failed to list snow CLI connections[/red]")
-            console.print(f"Error: {result.stderr}")
+            console.print(f"Error: {list_stderr}")
 
     except Exception as e:
         console.print(f"[red]Error checking snow CLI: {e}[/red]")
@@ -160,21 +185,84 @@ def main():
 
 
 def parse_connections(output: str) -> list:
-    """Parse connection names from snow connection list output."""
-    connections = []
-    lines = output.split("\n")
-    for line in lines:
-        if "|" in line and "connection_name" not in line and line.strip():
-            parts = line.split("|")
-            if len(parts) > 0:
-                conn_name = parts[0].strip()
-                if conn_name and conn_name not in ["-", "+"]:
-                    connections.append(conn_name)
-    return connections
-
-
-def create_snowddl_connection(console: Console, current_config: Dict[str, Any]) -> None:
+    """
+    Parse connection names from `snow connection list` output.
+
+    JSON output is expected; older snow CLI versions that ignore
+    ``--format json`` and print a table, or JSON that is not a list of
+    connection objects, are handled by a regex fallback.
+    """
+    try:
+        return [conn["connection_name"] for conn in json.loads(output)]
+    except (ValueError, KeyError, TypeError):
+        return [
+            match.group(1)
+            for line in output.splitlines()
+            if (match := _CONNECTION_ROW_RE.match(line))
+            and match.group(1) != "connection_name"
+        ]
+
+
+def list_connections(timeout: int = 10) -> Tuple[bool, list, str]:
+    """
+    List snow CLI connection names.
+
+    Returns:
+        Tuple of (success, connection_names, stderr or timeout message)
+    """
+    try:
+        result = subprocess.run(
+            ["snow", "connection", "list", "--format", "json"],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired as e:
+        return False, [], f"Timed out: {e}"
+
+    return result.returncode == 0, parse_connections(result.stdout), result.stderr
+
+
+def _test_connection(conn_name: str) -> Tuple[str, bool, str]:
+    """
+    Run a trivial query through a snow CLI connection.
+
+    Output is captured as bytes and only the stream that will be shown is
+    decoded: stdout on success, stderr on failure.
+
+    Returns:
+        Tuple of (connection_name, success, output_or_error)
+    """
+    try:
+        result = subprocess.run(
+            [
+                "snow",
+                "sql",
+                "-c",
+                conn_name,
+                "-q",
+                "SELECT CURRENT_USER(), CURRENT_ROLE()",
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=15,
+            check=False,
+        )
+    except subprocess.TimeoutExpired as e:
+        return conn_name, False, f"Timed out: {e}"
+
+    if result.returncode == 0:
+        return conn_name, True, result.stdout.decode(errors="replace").strip()
+    return conn_name, False, result.stderr.decode(errors="replace").strip()
+
+
+def create_snowddl_connection(
+    console: "Console", current_config: Dict[str, Any]
+) -> None:
     """Guide user through creating a SnowDDL-specific connection."""
+    from rich.prompt import Prompt
+
     console.print("\n[bold blue]Creating SnowDDL Connection...[/bold blue]")
 
     console.print("This will create a new snow CLI connection called 'snowddl'")
@@ -242,31 +330,26 @@ def create_snowddl_connection(console: Console, current_config: Dict[str, Any])
     console.print(f"\nRunning: {' '.join(cmd[:8])}... [hidden credentials]")
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        result = subprocess.run(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=30,
+            check=False,
+        )
         if result.returncode == 0:
             console.print("[green]✓[/green] Connection created successfully!")
             console.print("Testing new connection...")
 
-            test_result = subprocess.run(
-                [
-                    "snow",
-                    "sql",
-                    "-c",
-                    "snowddl",
-                    "-q",
-                    "SELECT CURRENT_USER(), CURRENT_ROLE()",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=15,
-            )
-
-            if test_result.returncode == 0:
+            _, works, detail = _test_connection("snowddl")
+
+            if works:
                 console.print("[green]✓[/green] New connection works!")
-                console.print(f"Result: {test_result.stdout.strip()}")
+                console.print(f"Result: {detail}")
             else:
                 console.print("[red]✗[/red] New connection failed")
-                console.print(f"Error: {test_result.stderr}")
+                console.print(f"Error: {detail}")
         else:
             console.print("[red]✗[/red] Failed to create connection")
             console.print(f"Error: {result.stderr}")
@@ -275,7 +358,7 @@ def create_snowddl_connection(console: Console, current_config: Dict[str, Any])
         console.print(f"[red]Error creating connection: {e}[/red]")
 
 
-def test_snowddl_connectivity(console: Console) -> None:
+def test_snowddl_connectivity(console: "Console") -> None:
     """Test SnowDDL connectivity using the investigation script."""
     console.print("\n[bold blue]Testing SnowDDL Connectivity...[/bold blue]")
 
@@ -290,7 +373,9 @@ def test_snowddl_connectivity(console: Console) -> None:
                 "--output-format",
                 "human",
             ],
+            stdin=subprocess.DEVNULL,
             timeout=60,
+            check=False,
         )
 
         if result.returncode == 0:
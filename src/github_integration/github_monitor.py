@@ -12,19 +12,43 @@ Date: 2025-01-14
 import os
 import sys
 import json
+import base64
 import time
+import queue
+import random
 import logging
+import threading
 import argparse
 import traceback
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
 import snowflake.connector
 import requests
+from urllib3.util.request import ACCEPT_ENCODING
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
 from dotenv import load_dotenv
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ciso8601
+
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
@@ -52,6 +76,8 @@ class GitHubConfig:
     auto_merge: bool = False
     reviewer_teams: List[str] = None
     max_files_per_pr: int = 10
+    # Most requests handled by one run_once; the rest wait for the next cycle
+    batch_max: int = 50
 
     def __post_init__(self):
         if self.reviewer_teams is None:
@@ -83,11 +109,13 @@ class PRRequest:
     pr_description: str
     target_branch: str
     file_name: str
-    file_content: str
+    file_content: Optional[str]
     created_by: str
     priority: int
     created_at: datetime
     stage_path: str
+    # Base64 content from SP_GET_PENDING_BATCH; used as-is instead of file_content
+    file_content_b64: Optional[str] = None
 
 
 class GitHubIntegrationError(Exception):
@@ -96,15 +124,167 @@ class GitHubIntegrationError(Exception):
     pass
 
 
+# Connections held by a shared SnowflakePool, and how long to wait for one
+POOL_SIZE = 4
+POOL_TIMEOUT_SECONDS = 120
+
+# Number of pending requests claimed per Snowflake round-trip
+DEFAULT_BATCH_SIZE = 10
+
+# PRs processed in parallel; kept low to stay under GitHub's secondary rate limits
+MAX_CONCURRENT_REQUESTS = 10
+
+# Buffered status updates are flushed once this many are queued
+STATUS_FLUSH_SIZE = 50
+
+# Wait before the next cycle when run_once stopped at batch_max with work left
+BACKLOG_POLL_SECONDS = 5
+
+# Idle polling backs off up to this multiple of the configured interval
+MAX_BACKOFF_FACTOR = 4
+
+# Number of GET responses kept for ETag revalidation
+ETAG_CACHE_SIZE = 256
+
+# How long a resolved base branch SHA is reused when creating branches
+BASE_SHA_TTL_SECONDS = 30
+
+# How long a branch_exists answer (or a branch we created) is trusted
+BRANCH_CACHE_TTL_SECONDS = 60
+
+# Pull request body; the request description is followed by its metadata
+PR_DESCRIPTION_TEMPLATE = """{description}
+
+---
+**Automated PR Details:**
+- Created by: {created_by}
+- Request ID: `{request_id}`
+- Priority: {priority}
+- Created: {created_at:%Y-%m-%d %H:%M:%S} UTC
+- File: `{file_name}`
+
+This PR was automatically created by the SnowDDL GitHub integration system.
+"""
+
+# Resolves the repository node, base branch tip and head branch in one query
+PR_CONTEXT_QUERY = """
+query($owner: String!, $name: String!, $baseRef: String!, $headRef: String!) {
+  repository(owner: $owner, name: $name) {
+    id
+    base: ref(qualifiedName: $baseRef) { target { oid } }
+    head: ref(qualifiedName: $headRef) { id }
+  }
+}
+"""
+
+# Creates the branch, commits the file and opens the PR in one request.
+# Mutation fields run in order, so each step sees the previous one's result.
+OPEN_PR_MUTATION = """
+mutation(
+  $repositoryId: ID!
+  $headRef: String!
+  $baseOid: GitObjectID!
+  $branch: CommittableBranch!
+  $fileChanges: FileChanges!
+  $message: CommitMessage!
+  $baseRefName: String!
+  $headRefName: String!
+  $title: String!
+  $body: String!
+) {
+  createRef(input: {repositoryId: $repositoryId, name: $headRef, oid: $baseOid}) {
+    ref { id }
+  }
+  createCommitOnBranch(input: {
+    branch: $branch
+    expectedHeadOid: $baseOid
+    fileChanges: $fileChanges
+    message: $message
+  }) {
+    commit { oid }
+  }
+  createPullRequest(input: {
+    repositoryId: $repositoryId
+    baseRefName: $baseRefName
+    headRefName: $headRefName
+    title: $title
+    body: $body
+  }) {
+    pullRequest { number url }
+  }
+}
+"""
+
+
+def _json_loads(data: Any) -> Any:
+    """Parse JSON text or bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to a JSON string, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, using ciso8601 when it is installed"""
+    if CISO8601_AVAILABLE:
+        return ciso8601.parse_datetime(value)
+    # fromisoformat only accepts a trailing "Z" from Python 3.11
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=4)
+def _load_private_key_der(path: str, passphrase: Optional[str], mtime_ns: int) -> bytes:
+    """
+    Load a PEM private key as unencrypted PKCS8 DER bytes.
+
+    Cached so reconnects skip the file read and key parsing; the file's
+    mtime is part of the key so a rotated key is picked up.
+    """
+    with open(path, "rb") as key_file:
+        private_key = key_file.read()
+
+    pkey = load_pem_private_key(
+        private_key, password=passphrase.encode() if passphrase else None
+    )
+    return pkey.private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+
+
 class SnowflakeConnector:
     """Handle Snowflake database operations"""
 
-    def __init__(self, config: SnowflakeConfig):
+    def __init__(self, config: SnowflakeConfig, pool: "SnowflakePool" = None):
         self.config = config
+        self.pool = pool
         self.connection = None
 
     def connect(self) -> None:
-        """Establish connection to Snowflake"""
+        """Establish connection to Snowflake, or check one out of the pool"""
+        if self.pool is not None:
+            self.connection = self.pool.acquire()
+        else:
+            self.connection = self._open_connection()
+
+    def _open_connection(self):
+        """Open a new Snowflake connection"""
         try:
             connection_params = {
                 "account": self.config.account,
@@ -113,6 +293,9 @@ class SnowflakeConnector:
                 "warehouse": self.config.warehouse,
                 "database": self.config.database,
                 "schema": self.config.schema,
+                # Keep the session alive between polling cycles
+                "client_session_keep_alive": True,
+                "client_session_keep_alive_heartbeat_frequency": 900,
             }
 
             # Use RSA key authentication if available, otherwise password
@@ -120,26 +303,11 @@ class SnowflakeConnector:
                 self.config.private_key_path
             ):
                 logger.info("Using RSA key authentication")
-                with open(self.config.private_key_path, "rb") as key_file:
-                    private_key = key_file.read()
-
-                from cryptography.hazmat.primitives import serialization
-                from cryptography.hazmat.primitives.serialization import (
-                    load_pem_private_key,
-                )
-
-                if self.config.private_key_passphrase:
-                    passphrase = self.config.private_key_passphrase.encode()
-                else:
-                    passphrase = None
-
-                pkey = load_pem_private_key(private_key, password=passphrase)
-                pkb = pkey.private_bytes(
-                    encoding=serialization.Encoding.DER,
-                    format=serialization.PrivateFormat.PKCS8,
-                    encryption_algorithm=serialization.NoEncryption(),
+                connection_params["private_key"] = _load_private_key_der(
+                    self.config.private_key_path,
+                    self.config.private_key_passphrase,
+                    os.stat(self.config.private_key_path).st_mtime_ns,
                 )
-                connection_params["private_key"] = pkb
             elif self.config.password:
                 logger.info("Using password authentication")
                 connection_params["password"] = self.config.password
@@ -148,19 +316,47 @@ class SnowflakeConnector:
                     "No valid authentication method configured"
                 )
 
-            self.connection = snowflake.connector.connect(**connection_params)
+            connection = snowflake.connector.connect(**connection_params)
             logger.info("Successfully connected to Snowflake")
+            return connection
 
         except Exception as e:
-            logger.error(f"Failed to connect to Snowflake: {e}")
+            logger.error("Failed to connect to Snowflake: %s", e)
             raise GitHubIntegrationError(f"Snowflake connection failed: {e}")
 
     def disconnect(self) -> None:
-        """Close Snowflake connection"""
+        """Close Snowflake connection, or return it to the pool"""
         if self.connection:
-            self.connection.close()
-            self.connection = None
-            logger.info("Disconnected from Snowflake")
+            connection, self.connection = self.connection, None
+            if self.pool is not None:
+                self.pool.release(connection)
+            else:
+                connection.close()
+                logger.info("Disconnected from Snowflake")
+
+    @staticmethod
+    def _ping(connection) -> None:
+        """Raise if the connection no longer answers queries"""
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+        finally:
+            cursor.close()
+
+    def ensure_connected(self) -> None:
+        """Connect, or reuse the open connection if it still answers a ping"""
+        if self.connection is not None:
+            try:
+                self._ping(self.connection)
+                return
+            except Exception as e:
+                logger.warning("Snowflake connection lost, reconnecting: %s", e)
+                try:
+                    self.disconnect()
+                except Exception:
+                    self.connection = None
+
+        self.connect()
 
     def execute_procedure(self, procedure_name: str, params: List[Any] = None) -> Any:
         """Execute a stored procedure"""
@@ -181,54 +377,64 @@ class SnowflakeConnector:
             return result[0] if result else None
 
         except Exception as e:
-            logger.error(f"Failed to execute procedure {procedure_name}: {e}")
+            logger.error("Failed to execute procedure %s: %s", procedure_name, e)
             raise GitHubIntegrationError(f"Procedure execution failed: {e}")
 
     def get_next_pending_request(self, processor_id: str) -> Optional[PRRequest]:
-        """Get the next pending PR request"""
+        """Get the next pending PR request (a batch of one)"""
+        batch = self.get_pending_batch(processor_id, 1)
+        return batch[0] if batch else None
+
+    def get_pending_batch(
+        self, processor_id: str, limit: int = DEFAULT_BATCH_SIZE
+    ) -> List[PRRequest]:
+        """Claim up to `limit` pending PR requests in a single round-trip"""
         try:
             result = self.execute_procedure(
-                "SP_GET_NEXT_PENDING_REQUEST", [processor_id]
+                "SP_GET_PENDING_BATCH", [processor_id, limit]
             )
 
             if not result:
-                return None
+                return []
 
             # Parse the JSON result
             if isinstance(result, str):
-                data = json.loads(result)
+                data = _json_loads(result)
             else:
                 data = result
 
             if data.get("status") != "SUCCESS":
-                if data.get("status") == "NO_PENDING_REQUESTS":
-                    return None
-                else:
-                    logger.warning(
-                        f"Get next request returned: {data.get('message', 'Unknown error')}"
-                    )
-                    return None
-
-            # Create PRRequest object
-            return PRRequest(
-                request_id=data["REQUEST_ID"],
-                branch_name=data["BRANCH_NAME"],
-                pr_title=data["PR_TITLE"],
-                pr_description=data.get("PR_DESCRIPTION", ""),
-                target_branch=data["TARGET_BRANCH"],
-                file_name=data["FILE_NAME"],
-                file_content=data["FILE_CONTENT"]["content"],
-                created_by=data["CREATED_BY"],
-                priority=data["PRIORITY"],
-                created_at=datetime.fromisoformat(
-                    data["CREATED_AT"].replace("Z", "+00:00")
-                ),
-                stage_path=data["STAGE_PATH"],
-            )
+                logger.warning(
+                    "Get pending batch returned: %s",
+                    data.get("message", "Unknown error"),
+                )
+                return []
+
+            return [self._parse_request(item) for item in data.get("requests") or []]
 
         except Exception as e:
-            logger.error(f"Failed to get next pending request: {e}")
-            raise GitHubIntegrationError(f"Failed to get pending request: {e}")
+            logger.error("Failed to get pending request batch: %s", e)
+            raise GitHubIntegrationError(f"Failed to get pending requests: {e}")
+
+    @staticmethod
+    def _parse_request(data: Dict[str, Any]) -> PRRequest:
+        """Build a PRRequest from a procedure result object"""
+        return PRRequest(
+            request_id=data["REQUEST_ID"],
+            branch_name=data["BRANCH_NAME"],
+            pr_title=data["PR_TITLE"],
+            pr_description=data.get("PR_DESCRIPTION", ""),
+            target_branch=data["TARGET_BRANCH"],
+            file_name=data["FILE_NAME"],
+            file_content=(
+                data["FILE_CONTENT"]["content"] if "FILE_CONTENT" in data else None
+            ),
+            file_content_b64=data.get("FILE_CONTENT_B64"),
+            created_by=data["CREATED_BY"],
+            priority=data["PRIORITY"],
+            created_at=_parse_timestamp(data["CREATED_AT"]),
+            stage_path=data["STAGE_PATH"],
+        )
 
     def update_request_status(
         self,
@@ -257,12 +463,117 @@ class SnowflakeConnector:
             if not result or not result.startswith("SUCCESS"):
                 raise GitHubIntegrationError(f"Status update failed: {result}")
 
-            logger.info(f"Updated request {request_id} status to {status}")
+            logger.info("Updated request %s status to %s", request_id, status)
 
         except Exception as e:
-            logger.error(f"Failed to update request status: {e}")
+            logger.error("Failed to update request status: %s", e)
             raise GitHubIntegrationError(f"Status update failed: {e}")
 
+    def update_request_statuses_batch(self, updates: List[Dict[str, Any]]) -> List[str]:
+        """
+        Apply several status updates in a single round-trip.
+
+        Each update holds SP_UPDATE_REQUEST_STATUS arguments by name
+        (request_id, status, github_pr_url, ...). Returns the ids of the
+        requests whose update was not applied.
+        """
+        if not updates:
+            return []
+
+        try:
+            result = self.execute_procedure(
+                "SP_UPDATE_REQUEST_STATUS_BATCH", [_json_dumps(updates)]
+            )
+
+            if isinstance(result, str):
+                data = _json_loads(result)
+            else:
+                data = result or {}
+
+            if data.get("status") != "SUCCESS":
+                raise GitHubIntegrationError(
+                    f"Batch status update failed: {data.get('message', 'Unknown error')}"
+                )
+
+            results = {r["request_id"]: r["result"] for r in data.get("results") or []}
+            failed = []
+            for update in updates:
+                request_id = update["request_id"]
+                message = results.get(request_id)
+                if message and message.startswith("SUCCESS"):
+                    logger.info("Updated request %s: %s", request_id, message)
+                else:
+                    logger.error(
+                        "Failed to update request %s status: %s", request_id, message
+                    )
+                    failed.append(request_id)
+
+            return failed
+
+        except Exception as e:
+            logger.error("Failed to update request statuses: %s", e)
+            raise GitHubIntegrationError(f"Batch status update failed: {e}")
+
+
+class SnowflakePool:
+    """Bounded pool of Snowflake connections shared between connectors"""
+
+    def __init__(
+        self,
+        config: SnowflakeConfig,
+        size: int = POOL_SIZE,
+        timeout: float = POOL_TIMEOUT_SECONDS,
+    ):
+        self.config = config
+        self.timeout = timeout
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def acquire(self):
+        """Check out an idle connection that answers a ping, or open a new one"""
+        if not self._slots.acquire(timeout=self.timeout):
+            raise GitHubIntegrationError(
+                f"Timed out after {self.timeout}s waiting for a Snowflake connection"
+            )
+
+        try:
+            while True:
+                try:
+                    connection = self._idle.get_nowait()
+                except queue.Empty:
+                    return SnowflakeConnector(self.config)._open_connection()
+
+                try:
+                    SnowflakeConnector._ping(connection)
+                    return connection
+                except Exception as e:
+                    logger.warning("Discarding dead pooled Snowflake connection: %s", e)
+                    self._close_quietly(connection)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, connection) -> None:
+        """Return a checked-out connection for reuse"""
+        self._idle.put(connection)
+        self._slots.release()
+
+    def close(self) -> None:
+        """Close every idle connection"""
+        while True:
+            try:
+                self._close_quietly(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    @staticmethod
+    def _close_quietly(connection) -> None:
+        """Close a connection, ignoring errors from an already dead session"""
+        try:
+            connection.close()
+        except Exception:
+            pass
+
 
 class GitHubClient:
     """Handle GitHub API operations"""
@@ -275,40 +586,198 @@ class GitHubClient:
                 "Authorization": f"token {config.token}",
                 "Accept": "application/vnd.github.v3+json",
                 "User-Agent": "SnowDDL-GitHub-Monitor/1.0",
+                # Every encoding urllib3 can decode here (br/zstd when installed)
+                "Accept-Encoding": ACCEPT_ENCODING,
             }
         )
 
+        # url -> (etag, response) for conditional GETs, least recently used first
+        self._etag_cache: OrderedDict = OrderedDict()
+        self._etag_lock = threading.Lock()
+
+        # (repo, base_branch) -> (sha, resolved_at) for branches created in a batch
+        self._base_sha_cache: Dict[Tuple[str, str], Tuple[str, float]] = {}
+
+        # branch name -> (exists, checked_at) for branch_exists lookups
+        self._branch_cache: Dict[str, Tuple[bool, float]] = {}
+
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
-        """Make an API request to GitHub"""
-        url = f"{self.config.api_url}/{endpoint}"
+        """
+        Make an API request to GitHub.
+
+        GETs are sent with If-None-Match when a previous response carried an
+        ETag; a 304 returns the cached response and does not count against
+        the rate limit. A json= body is serialized once here and sent as
+        data= so large file payloads skip requests' own encoder.
+        """
+        url = endpoint if "://" in endpoint else f"{self.config.api_url}/{endpoint}"
+        if "json" in kwargs:
+            kwargs["data"] = _json_bytes(kwargs.pop("json"))
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                "Content-Type": "application/json",
+            }
+
+        with self._etag_lock:
+            cached = self._etag_cache.get(url) if method == "GET" else None
+        if cached:
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                "If-None-Match": cached[0],
+            }
 
         try:
             response = self.session.request(method, url, **kwargs)
+            if cached and response.status_code == 304:
+                with self._etag_lock:
+                    if url in self._etag_cache:
+                        self._etag_cache.move_to_end(url)
+                return cached[1]
+
             response.raise_for_status()
+
+            if method == "GET" and "ETag" in response.headers:
+                with self._etag_lock:
+                    self._etag_cache[url] = (response.headers["ETag"], response)
+                    self._etag_cache.move_to_end(url)
+                    if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                        self._etag_cache.popitem(last=False)
+
             return response
         except requests.exceptions.RequestException as e:
-            logger.error(f"GitHub API request failed: {e}")
+            logger.error("GitHub API request failed: %s", e)
             if hasattr(e, "response") and e.response is not None:
-                logger.error(f"Response content: {e.response.text}")
-            raise GitHubIntegrationError(f"GitHub API error: {e}")
+                logger.error("Response content: %s", e.response.text)
+            raise GitHubIntegrationError(f"GitHub API error: {e}") from e
+
+    def graphql(self, query: str, variables: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Run a GraphQL (v4 API) query or mutation and return its data"""
+        # GitHub Enterprise serves REST under /api/v3 and GraphQL under /api/graphql
+        url = self.config.api_url.removesuffix("/v3") + "/graphql"
+        response = self._make_request(
+            "POST", url, json={"query": query, "variables": variables or {}}
+        )
+        result = self._json(response)
+
+        if result.get("errors"):
+            messages = "; ".join(e.get("message", str(e)) for e in result["errors"])
+            raise GitHubIntegrationError(f"GitHub GraphQL error: {messages}")
+
+        return result["data"]
+
+    def open_pull_request(
+        self,
+        branch_name: str,
+        file_path: str,
+        content: str,
+        commit_message: str,
+        title: str,
+        description: str,
+        base_branch: str = None,
+        content_b64: str = None,
+    ) -> Dict[str, Any]:
+        """
+        Create a branch with a single file commit and open a PR for it.
+
+        Uses two GraphQL round-trips instead of the five REST calls made by
+        branch_exists/create_branch/create_or_update_file/create_pull_request.
+        Pass already base64-encoded content as content_b64 to skip encoding.
+        Returns the PR number and html_url like the REST pulls endpoint.
+        """
+        if base_branch is None:
+            base_branch = self.config.base_branch
+
+        context = self.graphql(
+            PR_CONTEXT_QUERY,
+            {
+                "owner": self.config.repo_owner,
+                "name": self.config.repo_name,
+                "baseRef": f"refs/heads/{base_branch}",
+                "headRef": f"refs/heads/{branch_name}",
+            },
+        )
+        repository = context["repository"]
+
+        if repository["head"]:
+            self._remember_branch(branch_name, True)
+            raise GitHubIntegrationError(f"Branch {branch_name} already exists")
+        if not repository["base"]:
+            raise GitHubIntegrationError(f"Base branch {base_branch} not found")
+
+        headline, _, body = commit_message.partition("\n")
+        encoded_content = content_b64 or self._encode_content(content)
+
+        result = self.graphql(
+            OPEN_PR_MUTATION,
+            {
+                "repositoryId": repository["id"],
+                "headRef": f"refs/heads/{branch_name}",
+                "baseOid": repository["base"]["target"]["oid"],
+                "branch": {
+                    "repositoryNameWithOwner": f"{self.config.repo_owner}/{self.config.repo_name}",
+                    "branchName": branch_name,
+                },
+                "fileChanges": {
+                    "additions": [{"path": file_path, "contents": encoded_content}]
+                },
+                "message": {"headline": headline, "body": body.strip()},
+                "baseRefName": base_branch,
+                "headRefName": branch_name,
+                "title": title,
+                "body": description,
+            },
+        )
+        pull_request = result["createPullRequest"]["pullRequest"]
+        self._remember_branch(branch_name, True)
+
+        logger.info(
+            "Created branch %s from %s and PR #%s: %s",
+            branch_name,
+            base_branch,
+            pull_request["number"],
+            title,
+        )
+        return {"number": pull_request["number"], "html_url": pull_request["url"]}
+
+    @staticmethod
+    def _json(response: requests.Response) -> Any:
+        """Decode a JSON response body"""
+        return _json_loads(response.content)
+
+    @staticmethod
+    def _encode_content(content: str) -> str:
+        """Base64-encode file content for the GitHub contents and commit APIs"""
+        # base64 output is pure ASCII, which decodes faster than UTF-8
+        return base64.b64encode(content.encode("utf-8")).decode("ascii")
 
     def get_repository_info(self) -> Dict[str, Any]:
         """Get repository information"""
         response = self._make_request(
             "GET", f"repos/{self.config.repo_owner}/{self.config.repo_name}"
         )
-        return response.json()
+        return self._json(response)
 
     def branch_exists(self, branch_name: str) -> bool:
-        """Check if a branch exists"""
+        """Check if a branch exists, reusing answers for BRANCH_CACHE_TTL_SECONDS"""
+        cached = self._branch_cache.get(branch_name)
+        if cached and time.monotonic() - cached[1] < BRANCH_CACHE_TTL_SECONDS:
+            return cached[0]
+
         try:
             self._make_request(
                 "GET",
                 f"repos/{self.config.repo_owner}/{self.config.repo_name}/branches/{branch_name}",
             )
-            return True
+            exists = True
         except GitHubIntegrationError:
-            return False
+            exists = False
+
+        self._remember_branch(branch_name, exists)
+        return exists
+
+    def _remember_branch(self, branch_name: str, exists: bool) -> None:
+        """Record whether a branch exists for later branch_exists calls"""
+        self._branch_cache[branch_name] = (exists, time.monotonic())
 
     def create_branch(
         self, branch_name: str, base_branch: str = None
@@ -318,33 +787,65 @@ class GitHubClient:
             base_branch = self.config.base_branch
 
         # Get the SHA of the base branch
-        response = self._make_request(
-            "GET",
-            f"repos/{self.config.repo_owner}/{self.config.repo_name}/git/refs/heads/{base_branch}",
-        )
-        base_sha = response.json()["object"]["sha"]
+        base_sha = self._resolve_base_sha(base_branch)
 
         # Create the new branch
         data = {"ref": f"refs/heads/{branch_name}", "sha": base_sha}
 
-        response = self._make_request(
-            "POST",
-            f"repos/{self.config.repo_owner}/{self.config.repo_name}/git/refs",
-            json=data,
-        )
-        result = response.json()
+        try:
+            response = self._make_request(
+                "POST",
+                f"repos/{self.config.repo_owner}/{self.config.repo_name}/git/refs",
+                json=data,
+            )
+        except GitHubIntegrationError as e:
+            # The cached SHA may be stale; resolve it again next time
+            self._base_sha_cache.pop(self._base_sha_key(base_branch), None)
+
+            # GitHub answers 422 "Reference already exists" for an existing branch
+            response = getattr(e.__cause__, "response", None)
+            if response is not None and response.status_code == 422:
+                self._remember_branch(branch_name, True)
+                raise GitHubIntegrationError(
+                    f"Branch {branch_name} already exists"
+                ) from e
+            raise
+        result = self._json(response)
+        self._remember_branch(branch_name, True)
 
-        logger.info(f"Created branch {branch_name} from {base_branch}")
+        logger.info("Created branch %s from %s", branch_name, base_branch)
         return result
 
+    def _base_sha_key(self, base_branch: str) -> Tuple[str, str]:
+        """Cache key for a base branch of the configured repository"""
+        return (f"{self.config.repo_owner}/{self.config.repo_name}", base_branch)
+
+    def _resolve_base_sha(self, base_branch: str) -> str:
+        """Get the SHA of a base branch, reusing it for BASE_SHA_TTL_SECONDS"""
+        key = self._base_sha_key(base_branch)
+        cached = self._base_sha_cache.get(key)
+        if cached and time.monotonic() - cached[1] < BASE_SHA_TTL_SECONDS:
+            return cached[0]
+
+        response = self._make_request(
+            "GET",
+            f"repos/{self.config.repo_owner}/{self.config.repo_name}/git/refs/heads/{base_branch}",
+        )
+        base_sha = self._json(response)["object"]["sha"]
+        self._base_sha_cache[key] = (base_sha, time.monotonic())
+        return base_sha
+
     def create_or_update_file(
-        self, branch_name: str, file_path: str, content: str, commit_message: str
+        self,
+        branch_name: str,
+        file_path: str,
+        content: str,
+        commit_message: str,
+        content_b64: str = None,
     ) -> Dict[str, Any]:
         """Create or update a file in the repository"""
-        import base64
-
-        # Encode content to base64
-        encoded_content = base64.b64encode(content.encode("utf-8")).decode("utf-8")
+        # Encode content to base64 unless it arrived pre-encoded
+        encoded_content = content_b64 or self._encode_content(content)
 
         # Check if file exists to get its SHA
         file_sha = None
@@ -353,7 +854,7 @@ class GitHubClient:
                 "GET",
                 f"repos/{self.config.repo_owner}/{self.config.repo_name}/contents/{file_path}?ref={branch_name}",
             )
-            file_sha = response.json()["sha"]
+            file_sha = self._json(response)["sha"]
         except GitHubIntegrationError:
             # File doesn't exist, which is fine for creation
             pass
@@ -374,10 +875,13 @@ class GitHubClient:
             f"repos/{self.config.repo_owner}/{self.config.repo_name}/contents/{file_path}",
             json=data,
         )
-        result = response.json()
+        result = self._json(response)
 
         logger.info(
-            f"{'Updated' if file_sha else 'Created'} file {file_path} in branch {branch_name}"
+            "%s file %s in branch %s",
+            "Updated" if file_sha else "Created",
+            file_path,
+            branch_name,
         )
         return result
 
@@ -400,9 +904,9 @@ class GitHubClient:
             f"repos/{self.config.repo_owner}/{self.config.repo_name}/pulls",
             json=data,
         )
-        result = response.json()
+        result = self._json(response)
 
-        logger.info(f"Created PR #{result['number']}: {title}")
+        logger.info("Created PR #%s: %s", result["number"], title)
         return result
 
     def add_reviewers_to_pr(
@@ -423,64 +927,186 @@ class GitHubClient:
                 f"repos/{self.config.repo_owner}/{self.config.repo_name}/pulls/{pr_number}/requested_reviewers",
                 json=data,
             )
-            logger.info(f"Added team reviewers {reviewer_teams} to PR #{pr_number}")
+            logger.info("Added team reviewers %s to PR #%s", reviewer_teams, pr_number)
         except GitHubIntegrationError as e:
-            logger.warning(f"Failed to add reviewers to PR #{pr_number}: {e}")
+            logger.warning("Failed to add reviewers to PR #%s: %s", pr_number, e)
 
 
 class GitHubMonitor:
     """Main monitor class that processes PR requests"""
 
-    def __init__(self, snowflake_config: SnowflakeConfig, github_config: GitHubConfig):
+    def __init__(
+        self,
+        snowflake_config: SnowflakeConfig,
+        github_config: GitHubConfig,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+        pool: SnowflakePool = None,
+    ):
         self.snowflake_config = snowflake_config
         self.github_config = github_config
         self.processor_id = f"github-monitor-{os.getpid()}-{int(time.time())}"
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
 
-        self.snowflake = SnowflakeConnector(snowflake_config)
+        # Monitors sharing a pool reuse its connections instead of each connecting
+        self.snowflake = SnowflakeConnector(snowflake_config, pool=pool)
         self.github = GitHubClient(github_config)
 
+        # Requests already claimed from Snowflake but not yet processed
+        self._pending_queue: deque = deque()
+
+        # When set, the Snowflake connection is kept open between run_once calls
+        self._persistent = False
+
+        # Status updates waiting to be written in one batched call
+        self._pending_updates: List[Dict[str, Any]] = []
+        self._updates_lock = threading.Lock()
+
+        # Ids of requests whose status update Snowflake rejected, for run_once to report
+        self._failed_updates: List[str] = []
+
+        # Set to wake run_continuous out of its sleep and stop it
+        self._stop_event = threading.Event()
+
+    def __enter__(self) -> "GitHubMonitor":
+        """Keep the Snowflake connection open across run_once cycles"""
+        self._persistent = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb) -> None:
+        """Close the persistent Snowflake connection"""
+        self._persistent = False
+        try:
+            self.snowflake.disconnect()
+        except Exception as e:
+            logger.warning("Error disconnecting from Snowflake: %s", e)
+
+    def _next_batch(self, limit: int) -> List[PRRequest]:
+        """Take all claimed requests, fetching up to `limit` when none are queued"""
+        if not self._pending_queue:
+            self._pending_queue.extend(
+                self.snowflake.get_pending_batch(
+                    self.processor_id, min(self.batch_size, limit)
+                )
+            )
+        batch = list(self._pending_queue)
+        self._pending_queue.clear()
+        return batch
+
+    def _queue_status_update(self, request_id: str, status: str, **fields) -> None:
+        """Buffer a status update, flushing when the buffer is full"""
+        with self._updates_lock:
+            self._pending_updates.append(
+                {
+                    "request_id": request_id,
+                    "status": status,
+                    "processor_id": self.processor_id,
+                    **fields,
+                }
+            )
+            full = len(self._pending_updates) >= STATUS_FLUSH_SIZE
+
+        if full:
+            try:
+                self._flush_status_updates()
+            except GitHubIntegrationError as e:
+                # The updates stay buffered for the end-of-batch flush
+                logger.warning("Deferring buffered status updates: %s", e)
+
+    def _flush_status_updates(self) -> None:
+        """Write all buffered status updates to Snowflake
+
+        If the call fails the updates are put back in the buffer for the next
+        flush. Updates the procedure rejected are recorded in _failed_updates.
+        """
+        with self._updates_lock:
+            updates, self._pending_updates = self._pending_updates, []
+
+        if not updates:
+            return
+
+        try:
+            failed = self.snowflake.update_request_statuses_batch(updates)
+        except Exception:
+            with self._updates_lock:
+                self._pending_updates[:0] = updates
+            raise
+
+        if failed:
+            with self._updates_lock:
+                self._failed_updates.extend(failed)
+
+    def _process_batch(
+        self, batch: List[PRRequest]
+    ) -> Iterator[Tuple[PRRequest, Optional[BaseException]]]:
+        """Process requests in parallel, yielding each with its error (if any)"""
+        workers = max(1, min(self.max_concurrency, len(batch)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for request in batch:
+                logger.info(
+                    "Processing request %s: %s", request.request_id, request.pr_title
+                )
+                futures[executor.submit(self._process_request, request)] = request
+
+            for future in as_completed(futures):
+                yield futures[future], future.exception()
+
     def run_once(self) -> Dict[str, Any]:
         """Process one batch of pending requests"""
-        stats = {"processed": 0, "succeeded": 0, "failed": 0, "errors": []}
+        stats = {
+            "processed": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "errors": [],
+            "capped": False,
+        }
+        batch_max = self.github_config.batch_max
 
         try:
-            # Connect to Snowflake
-            self.snowflake.connect()
+            # Connect to Snowflake (reusing a persistent connection if open)
+            self.snowflake.ensure_connected()
 
-            # Process requests until no more pending
+            # Process batches until no more pending or batch_max is reached
             while True:
-                request = self.snowflake.get_next_pending_request(self.processor_id)
+                if stats["processed"] >= batch_max:
+                    logger.info(
+                        "Reached batch_max of %s requests, deferring the rest",
+                        batch_max,
+                    )
+                    stats["capped"] = True
+                    break
+
+                batch = self._next_batch(batch_max - stats["processed"])
 
-                if not request:
+                if not batch:
                     logger.debug("No more pending requests")
                     break
 
-                stats["processed"] += 1
-                logger.info(
-                    f"Processing request {request.request_id}: {request.pr_title}"
-                )
+                for request, error in self._process_batch(batch):
+                    stats["processed"] += 1
 
-                try:
-                    self._process_request(request)
-                    stats["succeeded"] += 1
-                    logger.info(f"Successfully processed request {request.request_id}")
+                    if error is None:
+                        stats["succeeded"] += 1
+                        logger.info(
+                            "Successfully processed request %s", request.request_id
+                        )
+                        continue
 
-                except Exception as e:
                     stats["failed"] += 1
-                    error_msg = f"Failed to process request {request.request_id}: {e}"
+                    error_msg = (
+                        f"Failed to process request {request.request_id}: {error}"
+                    )
                     logger.error(error_msg)
                     stats["errors"].append(error_msg)
 
                     # Update request status to failed
-                    try:
-                        self.snowflake.update_request_status(
-                            request.request_id,
-                            "FAILED",
-                            error_message=str(e),
-                            processor_id=self.processor_id,
-                        )
-                    except Exception as update_error:
-                        logger.error(f"Failed to update request status: {update_error}")
+                    self._queue_status_update(
+                        request.request_id, "FAILED", error_message=str(error)
+                    )
+
+                self._flush_status_updates()
 
         except Exception as e:
             error_msg = f"Monitor execution failed: {e}"
@@ -488,46 +1114,48 @@ class GitHubMonitor:
             stats["errors"].append(error_msg)
 
         finally:
-            # Ensure Snowflake connection is closed
+            # Write any status updates left over from a failed cycle
             try:
-                self.snowflake.disconnect()
+                self._flush_status_updates()
             except Exception as e:
-                logger.warning(f"Error disconnecting from Snowflake: {e}")
+                error_msg = f"Failed to update request statuses: {e}"
+                logger.error(error_msg)
+                stats["errors"].append(error_msg)
+
+            with self._updates_lock:
+                failed, self._failed_updates = self._failed_updates, []
+            for request_id in failed:
+                stats["errors"].append(
+                    f"Failed to update status of request {request_id}"
+                )
+
+            # Close the connection unless it is held open for continuous runs
+            if not self._persistent:
+                try:
+                    self.snowflake.disconnect()
+                except Exception as e:
+                    logger.warning("Error disconnecting from Snowflake: %s", e)
 
         return stats
 
     def _process_request(self, request: PRRequest) -> None:
         """Process a single PR request"""
         try:
-            # Validate branch name
-            if self.github.branch_exists(request.branch_name):
-                raise GitHubIntegrationError(
-                    f"Branch {request.branch_name} already exists"
-                )
-
-            # Create the branch
-            branch_result = self.github.create_branch(
-                request.branch_name, request.target_branch
-            )
             branch_url = f"https://github.com/{self.github_config.repo_owner}/{self.github_config.repo_name}/tree/{request.branch_name}"
 
-            # Create or update the file
+            # Create the branch, commit the file and open the pull request
             commit_message = f"Add {request.file_name} for SnowDDL configuration\n\nCreated by: {request.created_by}\nRequest ID: {request.request_id}"
+            pr_description = self._build_pr_description(request)
 
-            self.github.create_or_update_file(
+            pr_result = self.github.open_pull_request(
                 request.branch_name,
                 request.file_name,
                 request.file_content,
                 commit_message,
-            )
-
-            # Create the pull request
-            pr_description = self._build_pr_description(request)
-            pr_result = self.github.create_pull_request(
-                request.branch_name,
                 request.pr_title,
                 pr_description,
                 request.target_branch,
+                content_b64=request.file_content_b64,
             )
 
             # Add reviewers if configured
@@ -536,62 +1164,85 @@ class GitHubMonitor:
                     pr_result["number"], self.github_config.reviewer_teams
                 )
 
-            # Update request status to completed
-            self.snowflake.update_request_status(
+            # Queue the completed status for the end-of-batch update
+            self._queue_status_update(
                 request.request_id,
                 "COMPLETED",
                 github_branch_url=branch_url,
                 github_pr_url=pr_result["html_url"],
                 github_pr_number=pr_result["number"],
-                processor_id=self.processor_id,
             )
 
         except Exception as e:
-            logger.error(f"Error processing request {request.request_id}: {e}")
+            logger.error("Error processing request %s: %s", request.request_id, e)
             raise
 
     def _build_pr_description(self, request: PRRequest) -> str:
         """Build the pull request description"""
-        description = request.pr_description or "Automated SnowDDL configuration update"
-
-        description += f"""
-
----
-**Automated PR Details:**
-- Created by: {request.created_by}
-- Request ID: `{request.request_id}`
-- Priority: {request.priority}
-- Created: {request.created_at.strftime('%Y-%m-%d %H:%M:%S UTC')}
-- File: `{request.file_name}`
-
-This PR was automatically created by the SnowDDL GitHub integration system.
-"""
-        return description
+        return PR_DESCRIPTION_TEMPLATE.format(
+            description=request.pr_description
+            or "Automated SnowDDL configuration update",
+            created_by=request.created_by,
+            request_id=request.request_id,
+            priority=request.priority,
+            created_at=request.created_at,
+            file_name=request.file_name,
+        )
 
     def run_continuous(self, interval_seconds: int = 300) -> None:
         """Run the monitor continuously"""
-        logger.info(f"Starting continuous monitoring with {interval_seconds}s interval")
+        logger.info(
+            "Starting continuous monitoring with %ss interval", interval_seconds
+        )
 
-        while True:
-            try:
-                stats = self.run_once()
+        idle_cycles = 0
 
-                if stats["processed"] > 0:
-                    logger.info(
-                        f"Batch completed: {stats['succeeded']} succeeded, {stats['failed']} failed"
-                    )
-                else:
-                    logger.debug("No requests processed this cycle")
+        with self:
+            while not self._stop_event.is_set():
+                try:
+                    stats = self.run_once()
 
-                time.sleep(interval_seconds)
+                    if stats["processed"] > 0:
+                        logger.info(
+                            "Batch completed: %s succeeded, %s failed",
+                            stats["succeeded"],
+                            stats["failed"],
+                        )
+                        idle_cycles = 0
+                    else:
+                        logger.debug("No requests processed this cycle")
+                        idle_cycles += 1
+
+                    if stats["capped"]:
+                        # More requests are waiting; come back for them soon
+                        wait = min(interval_seconds, BACKLOG_POLL_SECONDS)
+                    else:
+                        wait = self._backoff_interval(interval_seconds, idle_cycles)
+                    self._stop_event.wait(wait)
+
+                except KeyboardInterrupt:
+                    logger.info("Received interrupt signal, shutting down...")
+                    break
+                except Exception as e:
+                    logger.error("Unexpected error in continuous run: %s", e)
+                    logger.error(traceback.format_exc())
+                    self._stop_event.wait(interval_seconds)
 
-            except KeyboardInterrupt:
-                logger.info("Received interrupt signal, shutting down...")
-                break
-            except Exception as e:
-                logger.error(f"Unexpected error in continuous run: {e}")
-                logger.error(traceback.format_exc())
-                time.sleep(interval_seconds)
+    def stop(self) -> None:
+        """Ask run_continuous to exit after the current cycle"""
+        self._stop_event.set()
+
+    @staticmethod
+    def _backoff_interval(interval_seconds: int, idle_cycles: int) -> float:
+        """
+        Sleep time before the next poll, with +/-20% jitter.
+
+        The first empty poll waits the configured interval; each further
+        consecutive empty poll doubles it, up to MAX_BACKOFF_FACTOR.
+        """
+        exponent = min(max(idle_cycles - 1, 0), 8)
+        factor = min(2**exponent, MAX_BACKOFF_FACTOR)
+        return interval_seconds * factor * random.uniform(0.8, 1.2)
 
 
 def load_config() -> tuple[SnowflakeConfig, GitHubConfig]:
@@ -626,6 +1277,7 @@ def load_config() -> tuple[SnowflakeConfig, GitHubConfig]:
         auto_merge=os.getenv("GITHUB_AUTO_MERGE", "false").lower() == "true",
         reviewer_teams=reviewer_teams,
         max_files_per_pr=int(os.getenv("GITHUB_MAX_FILES_PER_PR", "10")),
+        batch_max=int(os.getenv("GITHUB_BATCH_MAX", "50")),
     )
 
     # Validate required configuration
@@ -684,7 +1336,7 @@ def main():
             monitor.run_continuous(args.interval)
 
     except Exception as e:
-        logger.error(f"Failed to start monitor: {e}")
+        logger.error("Failed to start monitor: %s", e)
         sys.exit(1)
 
 
@@ -5,258 +5,222 @@ SnowTower Command Help System
 Provides categorized command listing and discovery for all UV commands.
 """
 
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.style import Style
+
+# Rich is imported on first use so importing CATEGORIES stays cheap
+console: Optional["Console"] = None
+
+
+@dataclass(frozen=True, slots=True)
+class Category:
+    """A group of related commands in the help listing"""
+
+    title: str
+    description: str
+    commands: Tuple[Tuple[str, str], ...]  # (command, description) pairs
+
+
+# Command categories shown by show_commands
+CATEGORIES = (
+    Category(
+        title="SnowDDL Core Operations",
+        description="Infrastructure deployment and validation",
+        commands=(
+            ("snowddl-plan", "Preview infrastructure changes (always run first!)"),
+            ("snowddl-apply", "Apply infrastructure changes to Snowflake"),
+            ("snowddl-validate", "Validate YAML configuration files"),
+            ("snowddl-diff", "Show differences between local and Snowflake"),
+            ("deploy-safe", "Deploy SnowDDL + apply schema grants"),
+        ),
+    ),
+    Category(
+        title="User Management",
+        description="User lifecycle and access control",
+        commands=(
+            ("manage-users", "Complete user management CLI"),
+            ("  create", "Create new user (interactive or batch)"),
+            ("  list", "List all users with filters"),
+            ("  update", "Update user attributes"),
+            ("  delete", "Delete a user"),
+            ("  show", "Show detailed user info"),
+            ("  generate-password", "Generate password for user"),
+            ("  validate", "Validate user configuration"),
+        ),
+    ),
+    Category(
+        title="Resource Management",
+        description="Warehouses, costs, and resource optimization",
+        commands=(
+            ("manage-warehouses", "Warehouse management and optimization"),
+            ("  list", "List all warehouses"),
+            ("  resize", "Resize warehouses"),
+            ("  auto-suspend", "Set auto-suspend times"),
+            ("  optimize", "Cost optimization analysis"),
+            ("manage-costs", "Cost analysis and optimization"),
+            ("  analyze", "Analyze current costs"),
+            ("  apply", "Apply optimizations"),
+            ("manage-security", "Security auditing and compliance"),
+            ("manage-backup", "Configuration backup/restore"),
+        ),
+    ),
+    Category(
+        title="Schema Grants",
+        description="Manage schema-level permissions (SnowDDL limitation workaround)",
+        commands=(
+            ("apply-schema-grants", "Apply schema USAGE grants"),
+            ("validate-schema-grants", "Validate schema grants consistency"),
+        ),
+    ),
+    Category(
+        title="Monitoring & Observability",
+        description="System health and operational metrics",
+        commands=(
+            ("monitor-health", "System health checks"),
+            ("monitor-audit", "Audit trail analysis"),
+            ("monitor-metrics", "Operational metrics dashboard"),
+        ),
+    ),
+    Category(
+        title="Utilities",
+        description="Helper tools and utilities",
+        commands=(
+            ("util-generate-key", "Generate Fernet encryption key"),
+            ("util-diagnose-auth", "Diagnose authentication issues"),
+            ("util-fix-auth", "Fix authentication problems"),
+            ("generate-rsa-batch", "Generate RSA keys for multiple users"),
+        ),
+    ),
+    Category(
+        title="Documentation",
+        description="Documentation tools",
+        commands=(
+            ("docs-serve", "Serve documentation locally"),
+            ("docs-build", "Build documentation"),
+        ),
+    ),
+)
+
+# Title panel text, in Rich markup
+_HEADER_MARKUP = (
+    "[bold cyan]SnowTower[/bold cyan] - Snowflake Infrastructure Management\n"
+    "Enterprise-grade infrastructure as code for Snowflake"
+)
+
+# Rule between the command tables and the footer
+_SEPARATOR = "\n" + "-" * 80
+
+# Footer tips, in Rich markup, joined so it renders as a single Text
+_FOOTER_MARKUP = "\n".join(
+    (
+        _SEPARATOR,
+        "\n[bold]Tips:[/bold]",
+        "  - Use [cyan]uv run <command> --help[/cyan] for detailed options",
+        "  - Always run [cyan]uv run snowddl-plan[/cyan] before [cyan]snowddl-apply[/cyan]",
+        "  - Use [cyan]uv run manage-users[/cyan] for all user operations",
+        "  - View full docs: [cyan]docs/guide/MANAGEMENT_COMMANDS.md[/cyan]",
+        "\n[bold]Quick Start:[/bold]",
+        "  1. Check health: [cyan]uv run monitor-health[/cyan]",
+        "  2. List users: [cyan]uv run manage-users list[/cyan]",
+        "  3. Preview changes: [cyan]uv run snowddl-plan[/cyan]",
+        "  4. Apply changes: [cyan]uv run snowddl-apply[/cyan]",
+        "",
+    )
+)
 
-console = Console()
 
+def _make_table(command_style: "Style", description_style: "Style"):
+    """Create an empty command table with the shared column layout"""
+    from rich.table import Table
 
-def show_commands():
-    """Display all available SnowTower commands organized by category"""
+    table = Table(show_header=False, box=None, padding=(0, 2))
+    table.add_column("Command", style=command_style, no_wrap=True)
+    table.add_column("Description", style=description_style)
+    return table
 
-    console.print(
-        Panel(
-            "[bold cyan]SnowTower[/bold cyan] - Snowflake Infrastructure Management\n"
-            "Enterprise-grade infrastructure as code for Snowflake",
-            border_style="cyan",
-        )
-    )
 
-    # Create tables for each category
-    categories = [
-        {
-            "title": "SnowDDL Core Operations",
-            "description": "Infrastructure deployment and validation",
-            "commands": [
-                (
-                    "snowddl-plan",
-                    "Preview infrastructure changes (always run first!)",
-                    "uv run snowddl-plan",
-                ),
-                (
-                    "snowddl-apply",
-                    "Apply infrastructure changes to Snowflake",
-                    "uv run snowddl-apply",
-                ),
-                (
-                    "snowddl-validate",
-                    "Validate YAML configuration files",
-                    "uv run snowddl-validate",
-                ),
-                (
-                    "snowddl-diff",
-                    "Show differences between local and Snowflake",
-                    "uv run snowddl-diff",
-                ),
-                (
-                    "deploy-safe",
-                    "Deploy SnowDDL + apply schema grants",
-                    "uv run deploy-safe",
-                ),
-            ],
-        },
-        {
-            "title": "User Management",
-            "description": "User lifecycle and access control",
-            "commands": [
-                (
-                    "manage-users",
-                    "Complete user management CLI",
-                    "uv run manage-users --help",
-                ),
-                (
-                    "  create",
-                    "Create new user (interactive or batch)",
-                    "uv run manage-users create",
-                ),
-                (
-                    "  list",
-                    "List all users with filters",
-                    "uv run manage-users list",
-                ),
-                (
-                    "  update",
-                    "Update user attributes",
-                    "uv run manage-users update USERNAME",
-                ),
-                (
-                    "  delete",
-                    "Delete a user",
-                    "uv run manage-users delete USERNAME",
-                ),
-                (
-                    "  show",
-                    "Show detailed user info",
-                    "uv run manage-users show USERNAME",
-                ),
-                (
-                    "  generate-password",
-                    "Generate password for user",
-                    "uv run manage-users generate-password USERNAME",
-                ),
-                (
-                    "  validate",
-                    "Validate user configuration",
-                    "uv run manage-users validate USERNAME",
-                ),
-            ],
-        },
-        {
-            "title": "Resource Management",
-            "description": "Warehouses, costs, and resource optimization",
-            "commands": [
-                (
-                    "manage-warehouses",
-                    "Warehouse management and optimization",
-                    "uv run manage-warehouses list",
-                ),
-                (
-                    "  list",
-                    "List all warehouses",
-                    "uv run manage-warehouses list",
-                ),
-                (
-                    "  resize",
-                    "Resize warehouses",
-                    "uv run manage-warehouses resize X-Small --all",
-                ),
-                (
-                    "  auto-suspend",
-                    "Set auto-suspend times",
-                    "uv run manage-warehouses auto-suspend 60",
-                ),
-                (
-                    "  optimize",
-                    "Cost optimization analysis",
-                    "uv run manage-warehouses optimize --apply",
-                ),
-                (
-                    "manage-costs",
-                    "Cost analysis and optimization",
-                    "uv run manage-costs analyze",
-                ),
-                (
-                    "  analyze",
-                    "Analyze current costs",
-                    "uv run manage-costs analyze",
-                ),
-                (
-                    "  apply",
-                    "Apply optimizations",
-                    "uv run manage-costs apply --mode balanced",
-                ),
-                (
-                    "manage-security",
-                    "Security auditing and compliance",
-                    "uv run manage-security full",
-                ),
-                (
-                    "manage-backup",
-                    "Configuration backup/restore",
-                    "uv run manage-backup create",
-                ),
-            ],
-        },
-        {
-            "title": "Schema Grants",
-            "description": "Manage schema-level permissions (SnowDDL limitation workaround)",
-            "commands": [
-                (
-                    "apply-schema-grants",
-                    "Apply schema USAGE grants",
-                    "uv run apply-schema-grants",
-                ),
-                (
-                    "validate-schema-grants",
-                    "Validate schema grants consistency",
-                    "uv run validate-schema-grants",
-                ),
-            ],
-        },
-        {
-            "title": "Monitoring & Observability",
-            "description": "System health and operational metrics",
-            "commands": [
-                ("monitor-health", "System health checks", "uv run monitor-health"),
-                ("monitor-audit", "Audit trail analysis", "uv run monitor-audit"),
-                (
-                    "monitor-metrics",
-                    "Operational metrics dashboard",
-                    "uv run monitor-metrics",
-                ),
-            ],
-        },
-        {
-            "title": "Utilities",
-            "description": "Helper tools and utilities",
-            "commands": [
-                (
-                    "util-generate-key",
-                    "Generate Fernet encryption key",
-                    "uv run util-generate-key",
-                ),
-                (
-                    "util-diagnose-auth",
-                    "Diagnose authentication issues",
-                    "uv run util-diagnose-auth",
-                ),
-                (
-                    "util-fix-auth",
-                    "Fix authentication problems",
-                    "uv run util-fix-auth",
-                ),
-                (
-                    "generate-rsa-batch",
-                    "Generate RSA keys for multiple users",
-                    "uv run generate-rsa-batch",
-                ),
-            ],
-        },
-        {
-            "title": "Documentation",
-            "description": "Documentation tools",
-            "commands": [
-                ("docs-serve", "Serve documentation locally", "uv run docs-serve"),
-                ("docs-build", "Build documentation", "uv run docs-build"),
-            ],
-        },
-    ]
-
-    # Display each category
-    for category in categories:
-        console.print(f"\n[bold]{category['title']}[/bold]")
-        console.print(f"[dim]{category['description']}[/dim]\n")
-
-        table = Table(show_header=False, box=None, padding=(0, 2))
-        table.add_column("Command", style="cyan", no_wrap=True)
-        table.add_column("Description", style="white")
-
-        for cmd, desc, _ in category["commands"]:
-            table.add_row(cmd, desc)
-
-        console.print(table)
+@lru_cache(maxsize=1)
+def _build_renderables():
+    """Build the header, category tables and footer of the listing once"""
+    from rich.panel import Panel
+    from rich.style import Style
+    from rich.text import Text
+
+    # Parse each style once instead of once per table and text
+    cyan = Style.parse("cyan")
+    white = Style.parse("white")
+    bold = Style.parse("bold")
+    dim = Style.parse("dim")
+
+    renderables = [Panel(_HEADER_MARKUP, border_style=cyan)]
+
+    # Each category: title, description, command table
+    for category in CATEGORIES:
+        table = _make_table(cyan, white)
+        for command in category.commands:
+            table.add_row(*command)
+
+        title = Text.assemble("\n", (category.title, bold))
+        description = Text.assemble((category.description, dim), "\n")
+        renderables.extend((title, description, table))
 
     # Footer with helpful tips
-    console.print("\n" + "-" * 80)
-    console.print("\n[bold]Tips:[/bold]")
-    console.print("  - Use [cyan]uv run <command> --help[/cyan] for detailed options")
-    console.print(
-        "  - Always run [cyan]uv run snowddl-plan[/cyan] before [cyan]snowddl-apply[/cyan]"
-    )
-    console.print("  - Use [cyan]uv run manage-users[/cyan] for all user operations")
-    console.print("  - View full docs: [cyan]docs/guide/MANAGEMENT_COMMANDS.md[/cyan]")
-    console.print("\n[bold]Quick Start:[/bold]")
-    console.print("  1. Check health: [cyan]uv run monitor-health[/cyan]")
-    console.print("  2. List users: [cyan]uv run manage-users list[/cyan]")
-    console.print("  3. Preview changes: [cyan]uv run snowddl-plan[/cyan]")
-    console.print("  4. Apply changes: [cyan]uv run snowddl-apply[/cyan]")
-    console.print()
+    renderables.append(Text.from_markup(_FOOTER_MARKUP))
+
+    return tuple(renderables)
+
+
+@lru_cache(maxsize=1)
+def _build_plain_text() -> str:
+    """Build the listing as plain text, laid out like the Rich tables"""
+    strip_markup = re.compile(r"\[/?[a-z ]+\]").sub
+
+    lines = [strip_markup("", _HEADER_MARKUP)]
+    for category in CATEGORIES:
+        width = max(len(cmd) for cmd, _ in category.commands)
+        lines.append(f"\n{category.title}")
+        lines.append(f"{category.description}\n")
+        lines.extend(f"  {cmd:<{width}}    {desc}" for cmd, desc in category.commands)
+    lines.append(strip_markup("", _FOOTER_MARKUP))
+
+    return "\n".join(lines) + "\n"
+
+
+def show_commands(plain: Optional[bool] = None):
+    """
+    Display all available SnowTower commands organized by category
+
+    Args:
+        plain: Write unstyled text straight to stdout, bypassing Rich.
+            Defaults to True when stdout is not a terminal.
+    """
+    if plain is None:
+        plain = not sys.stdout.isatty()
+
+    if plain:
+        sys.stdout.write(_build_plain_text())
+        return
+
+    global console
+    from rich.console import Console, Group
+
+    if console is None:
+        console = Console()
+
+    # One print call renders and writes the whole listing at once
+    console.print(Group(*_build_renderables()))
 
 
 def main():
     """Main entry point"""
-    show_commands()
+    show_commands(plain=True if "--plain" in sys.argv[1:] else None)
 
 
 if __name__ == "__main__":
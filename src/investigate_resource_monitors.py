@@ -3,7 +3,7 @@
 Resource Monitor Investigation Script for SnowTower SnowDDL
 
 This script investigates critical resource monitor deployment safety issues by:
-1. Testing Snowflake CLI connectivity
+1. Testing Snowflake connectivity (Python connector, falling back to snow CLI)
 2. Analyzing existing resource monitors and warehouse configurations
 3. Assessing credit usage patterns and safety of proposed limits
 4. Providing actionable deployment recommendations
@@ -18,39 +18,270 @@ import argparse
 import json
 import logging
 import os
+import queue
+import re
 import subprocess
 import sys
-from datetime import datetime, timedelta
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import date, datetime, timedelta
+from functools import cached_property, lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 try:
     from env_loader import (
         load_snowflake_env,
         validate_auth,
-        EnvironmentError,
-        AuthenticationError,
+        SnowEnvError,
+        SnowAuthError,
     )
     from rich.console import Console
     from rich.panel import Panel
-    from rich.table import Table
-    from rich.text import Text
     from rich.logging import RichHandler
-    from rich.progress import Progress, SpinnerColumn, TextColumn
 except ImportError as e:
     print(f"ERROR: Missing required dependencies: {e}")
     print("Please run: uv sync")
     sys.exit(1)
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Basic query used to prove the session works
+CONNECTIVITY_SQL = (
+    "SELECT CURRENT_VERSION() as VERSION, CURRENT_USER() as USER, "
+    "CURRENT_ROLE() as ROLE"
+)
+
+# Analysis queries; they read disjoint ACCOUNT_USAGE views and are fetched
+# together. Each selects only the columns its display table reads, so keep
+# the SELECT lists and the _display_*_table methods in step.
+
+# Columns shown by _display_monitor_table, in display order
+MONITORS_SQL = """
+    SELECT
+        NAME,
+        CREDIT_QUOTA,
+        USED_CREDITS,
+        REMAINING_CREDITS,
+        LEVEL,
+        FREQUENCY
+    FROM SNOWFLAKE.ACCOUNT_USAGE.RESOURCE_MONITORS
+    WHERE DELETED IS NULL
+    ORDER BY CREATED_ON DESC
+"""
+
+# Columns read by _display_warehouse_table
+WAREHOUSES_SQL = """
+    SELECT
+        w.NAME,
+        w.STATE,
+        w.SIZE,
+        w.AUTO_SUSPEND,
+        w.RESOURCE_MONITOR
+    FROM SNOWFLAKE.ACCOUNT_USAGE.WAREHOUSES w
+    WHERE w.DELETED IS NULL
+    ORDER BY w.CREATED_ON DESC
+    LIMIT 100
+"""
+
+# Columns read by _display_credit_usage_table. Bound with the start and end
+# dates of the analysis window, so the query text is identical between runs
+# and Snowflake's result cache can answer it. 300 rows covers 30 days of
+# ten warehouses.
+CREDIT_USAGE_SQL = """
+    SELECT
+        DATE_TRUNC('day', START_TIME)::DATE AS USAGE_DATE,
+        WAREHOUSE_NAME,
+        SUM(CREDITS_USED) as DAILY_CREDITS,
+        COUNT(*) as QUERY_COUNT,
+        AVG(CREDITS_USED) as AVG_CREDITS_PER_QUERY
+    FROM SNOWFLAKE.ACCOUNT_USAGE.WAREHOUSE_METERING_HISTORY
+    WHERE START_TIME >= %(start)s
+      AND START_TIME < %(end)s
+    GROUP BY USAGE_DATE, WAREHOUSE_NAME
+    ORDER BY USAGE_DATE DESC, DAILY_CREDITS DESC
+    LIMIT 300
+"""
+
+# Analysis queries keyed by the test they feed, and the same statements as
+# one multi-statement batch. Built once so the batch text is byte-identical
+# between runs and Snowflake can reuse its compiled plan and cached results.
+ANALYSIS_QUERIES = {
+    "existing_monitors": MONITORS_SQL,
+    "warehouse_analysis": WAREHOUSES_SQL,
+    "credit_usage": CREDIT_USAGE_SQL,
+}
+ANALYSIS_BATCH_SQL = ";\n".join(ANALYSIS_QUERIES.values())
+
+# Days of credit usage history analyzed
+CREDIT_USAGE_DAYS = 30
+
+# (success, rows keyed by column name, error) from one query
+QueryResult = Tuple[bool, List[Dict[str, Any]], str]
+
+# Troubleshooting for authentication errors, keyed by the message text that
+# identifies them. Shared between calls, so treat them as read-only.
+_AUTH_TROUBLESHOOTING = {
+    "JWT token is invalid": {
+        "error_type": "jwt_authentication",
+        "likely_cause": "RSA private key authentication failure",
+        "recommended_actions": (
+            "Verify RSA private key file exists and is readable",
+            "Check if private key passphrase is required",
+            "Ensure public key is properly registered in Snowflake user settings",
+            "Regenerate RSA key pair if needed",
+            "Try password authentication as fallback",
+        ),
+    },
+    "Incorrect username or password": {
+        "error_type": "password_authentication",
+        "likely_cause": "Invalid username/password combination",
+        "recommended_actions": (
+            "Verify SNOWFLAKE_USER and authentication method in .env",
+            "Check if user account is locked or disabled",
+            "Verify account name (SNOWFLAKE_ACCOUNT) is correct",
+            "Test login through Snowflake web interface",
+            "Switch to RSA key authentication for service accounts",
+        ),
+    },
+    "Failed to connect": {
+        "error_type": "connection_failure",
+        "likely_cause": "Network or account configuration issue",
+        "recommended_actions": (
+            "Verify SNOWFLAKE_ACCOUNT value is correct",
+            "Check network connectivity to Snowflake",
+            "Verify account is active and not suspended",
+            "Check for regional-specific account URLs",
+        ),
+    },
+}
+
+_UNKNOWN_AUTH_TROUBLESHOOTING = {
+    "error_type": "unknown",
+    "likely_cause": "Unknown authentication issue",
+    "recommended_actions": (),
+}
+
+# Alternatives are tried in the order above, so the first listed error wins
+# when a message contains more than one
+_AUTH_ERROR_RE = re.compile(
+    r"\A(?:"
+    + "|".join(f".*?({re.escape(text)})" for text in _AUTH_TROUBLESHOOTING)
+    + ")",
+    re.DOTALL,
+)
+
+
+# Authentication troubleshooting panel text around the numbered actions
+_TROUBLESHOOTING_HEADER = """
+🔍 **Error Type:** {error_type}
+
+🎯 **Likely Cause:** {likely_cause}
+
+🔧 **Recommended Actions:**
+"""
+
+_TROUBLESHOOTING_FOOTER = """
+
+📋 **Quick Fixes to Try:**
+   • Run: uv run diagnose-auth (for detailed auth analysis)
+   • Check: snow connection list (see available connections)
+   • Test: snow sql -c [connection_name] -q "SELECT 1" (test specific connection)
+   • Verify: uv run test-env (check environment configuration)
+"""
+
+# Summary markers for test status and recommendation priority
+_STATUS_EMOJI = {"success": "✓", "failed": "✗"}
+_PRIORITY_EMOJI = {"critical": "🚨", "high": "🔥", "medium": "💡", "low": "📝"}
+_PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+# Process exit code for investigation statuses that end the run abnormally;
+# a completed run exits 2 when deployment is not approved, else 0
+_EXIT_CODES = {"error": 1, "interrupted": 130}
+# Summary verdict for each assess_deployment_safety outcome
+_DEPLOY_VERDICT = {
+    True: "🟢 **APPROVED** - Deployment appears safe",
+    "conditional": "🟡 **CONDITIONAL** - Address warnings before deployment",
+    False: "🔴 **NOT APPROVED** - Fix critical issues before deployment",
+}
+# Summary line prefix for each recommendation priority
+_PRIORITY_PREFIX = {
+    priority: f"- {emoji} **{priority.upper()}:**"
+    for priority, emoji in _PRIORITY_EMOJI.items()
+}
+
+# Log records buffered for the terminal listener before the oldest are dropped
+LOG_QUEUE_SIZE = 1024
+
+
+def _results_json(results: Dict[str, Any]) -> bytes:
+    """
+    Serialize investigation results as indented UTF-8 JSON.
+
+    Uses orjson when it is installed. Values JSON has no type for, such as
+    the Decimal credit amounts the connector returns, are written as strings.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(results, indent=2, default=str).encode("utf-8")
+
+
+class _DropOldestQueueHandler(QueueHandler):
+    """Queue handler that drops the oldest record when the queue is full."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Pass the record through untouched; the listener's RichHandler does
+        # the formatting, including rich tracebacks
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+
+@lru_cache(maxsize=32)
+def _auth_troubleshooting(error_msg: str) -> Dict[str, Any]:
+    """Look up troubleshooting steps for an authentication error message."""
+    match = _AUTH_ERROR_RE.match(error_msg)
+    if match is None:
+        return _UNKNOWN_AUTH_TROUBLESHOOTING
+    return _AUTH_TROUBLESHOOTING[match.group(match.lastindex)]
+
 
 class ResourceMonitorInvestigator:
     """Comprehensive resource monitor safety investigation tool."""
 
     def __init__(self, console: Console):
         self.console = console
+        self.conn = None  # Snowflake connector session, None when using snow CLI
+        self._lock = threading.Lock()  # Guards results lists across query threads
+        # Failed test names in failure order (dict as an ordered set), and
+        # warnings about failures, tallied as they are added
+        self._failed_tests: Dict[str, None] = {}
+        self._critical_warning_count = 0
+        # Recommendations in priority order, rebuilt after each addition
+        self._sorted_recs: Optional[List[Dict[str, Any]]] = None
+        self._conn_name: Optional[str] = None  # snow CLI connection known to work
+        self._snow_env: Optional[Dict[str, str]] = None  # snow CLI environment
+        self._log_listener: Optional[QueueListener] = None  # terminal log thread
+        started = datetime.now()
         self.results: Dict[str, Any] = {
-            "timestamp": datetime.now().isoformat(),
-            "investigation_id": f"rm_investigation_{int(datetime.now().timestamp())}",
+            "timestamp": started.isoformat(),
+            "investigation_id": f"rm_investigation_{int(started.timestamp())}",
             "status": "started",
             "tests": {},
             "warnings": [],
@@ -62,16 +293,26 @@ class ResourceMonitorInvestigator:
         self.load_environment()
 
     def setup_logging(self) -> None:
-        """Setup structured logging with rich formatting."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(message)s",
-            datefmt="[%X]",
-            handlers=[
-                RichHandler(console=self.console, rich_tracebacks=True, show_path=False)
-            ],
-        )
+        """Setup structured logging with rich formatting.
+
+        On a terminal, records are queued and rendered by a single listener
+        thread so query threads never wait on the Rich render lock. Otherwise
+        they propagate to the plain stream handler env_loader configures.
+        """
         self.logger = logging.getLogger("resource_monitor_investigator")
+        self.logger.setLevel(logging.INFO)
+        if not self.console.is_terminal:
+            return
+
+        emitter = RichHandler(
+            console=self.console, rich_tracebacks=True, show_path=False
+        )
+        emitter.setFormatter(logging.Formatter("%(message)s", datefmt="[%X]"))
+        log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._log_listener = QueueListener(log_queue, emitter)
+        self.logger.handlers = [_DropOldestQueueHandler(log_queue)]
+        self.logger.propagate = False
+        self._log_listener.start()
 
     def load_environment(self) -> None:
         """Load and validate environment configuration using env_loader utility."""
@@ -96,7 +337,19 @@ class ResourceMonitorInvestigator:
             )
             self.logger.info(f"Authentication method: {self.env_config['auth_method']}")
 
-        except (EnvironmentError, AuthenticationError) as e:
+            # Have every snow CLI call use the same key-pair login instead of
+            # each one resolving (or prompting for) its own authentication
+            private_key_path = env_vars.get("SNOWFLAKE_PRIVATE_KEY_PATH")
+            if private_key_path:
+                self._snow_env = {
+                    **os.environ,
+                    "SNOWFLAKE_AUTHENTICATOR": "SNOWFLAKE_JWT",
+                    "SNOWFLAKE_PRIVATE_KEY_FILE": private_key_path,
+                }
+
+            self._connect(env_vars)
+
+        except (SnowEnvError, SnowAuthError) as e:
             self.add_error("Environment configuration error", str(e))
             self.logger.error(f"Failed to load environment: {str(e)}")
         except Exception as e:
@@ -105,294 +358,360 @@ class ResourceMonitorInvestigator:
             )
             self.logger.error(f"Unexpected error in environment loading: {str(e)}")
 
-    def add_error(self, error_type: str, details: str) -> None:
-        """Add error to results with logging."""
+    def _connect(self, env_vars: Dict[str, str]) -> None:
+        """
+        Open one Snowflake connector session for all investigation queries.
+
+        Leaves self.conn as None, so queries go through the snow CLI, when
+        the connector is not installed or the connection fails.
+        """
+        try:
+            import snowflake.connector
+        except ImportError:
+            self.logger.info("snowflake-connector not available, using snow CLI")
+            return
+
+        connection_params = {
+            "account": self.env_config["account"],
+            "user": self.env_config["user"],
+            "role": self.env_config["role"],
+            "warehouse": self.env_config["warehouse"],
+            # Let repeat investigations reuse earlier ACCOUNT_USAGE results
+            "session_parameters": {"USE_CACHED_RESULT": True},
+        }
+
+        try:
+            private_key_path = env_vars.get("SNOWFLAKE_PRIVATE_KEY_PATH")
+            if private_key_path:
+                from cryptography.hazmat.primitives import serialization
+
+                passphrase = env_vars.get("SNOWFLAKE_PRIVATE_KEY_PASSPHRASE")
+                with open(private_key_path, "rb") as key_file:
+                    private_key = serialization.load_pem_private_key(
+                        key_file.read(),
+                        password=passphrase.encode() if passphrase else None,
+                    )
+                connection_params["private_key"] = private_key.private_bytes(
+                    encoding=serialization.Encoding.DER,
+                    format=serialization.PrivateFormat.PKCS8,
+                    encryption_algorithm=serialization.NoEncryption(),
+                )
+            else:
+                connection_params["password"] = env_vars.get("SNOWFLAKE_PASSWORD")
+
+            self.conn = snowflake.connector.connect(**connection_params)
+            self.logger.info("Connected with snowflake-connector")
+
+        except Exception as e:
+            self.logger.warning(f"Connector session failed, using snow CLI: {str(e)}")
+
+    def close(self) -> None:
+        """Close the connector session and flush queued log records."""
+        if self.conn is not None:
+            conn, self.conn = self.conn, None
+            conn.close()
+        if self._log_listener is not None:
+            listener, self._log_listener = self._log_listener, None
+            listener.stop()
+            # Records logged after close render directly instead of queueing
+            self.logger.handlers = list(listener.handlers)
+
+    def __enter__(self) -> "ResourceMonitorInvestigator":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def add_error(
+        self, error_type: str, details: str, test_name: Optional[str] = None
+    ) -> None:
+        """
+        Add error to results with logging.
+
+        Args:
+            error_type: Short error category
+            details: Error message
+            test_name: Test the error failed, if any
+        """
         error_entry = {
             "type": error_type,
             "details": details,
             "timestamp": datetime.now().isoformat(),
         }
-        self.results["error_details"].append(error_entry)
+        with self._lock:
+            self.results["error_details"].append(error_entry)
+            if test_name:
+                self._failed_tests[test_name] = None
         self.logger.error(f"[red]{error_type}:[/red] {details}")
 
     def add_warning(self, warning: str) -> None:
         """Add warning to results with logging."""
-        self.results["warnings"].append(
-            {"message": warning, "timestamp": datetime.now().isoformat()}
-        )
+        with self._lock:
+            self.results["warnings"].append(
+                {"message": warning, "timestamp": datetime.now().isoformat()}
+            )
+            if "failed" in warning.lower():
+                self._critical_warning_count += 1
         self.logger.warning(f"[yellow]WARNING:[/yellow] {warning}")
 
     def add_recommendation(self, recommendation: str, priority: str = "medium") -> None:
         """Add recommendation to results."""
-        self.results["recommendations"].append(
-            {
-                "message": recommendation,
-                "priority": priority,
-                "timestamp": datetime.now().isoformat(),
-            }
-        )
+        with self._lock:
+            self.results["recommendations"].append(
+                {
+                    "message": recommendation,
+                    "priority": priority,
+                    "timestamp": datetime.now().isoformat(),
+                }
+            )
+            self._sorted_recs = None
 
     def execute_snow_command(
-        self, command: List[str], timeout: int = 30
-    ) -> Tuple[bool, str, str]:
+        self,
+        command: List[str],
+        timeout: int = 30,
+        *,
+        capture: Tuple[str, ...] = ("stdout", "stderr"),
+    ) -> Tuple[bool, bytes, str]:
         """
         Safely execute snow CLI command with proper error handling.
 
+        Args:
+            command: snow CLI arguments
+            timeout: Seconds before the command is abandoned
+            capture: Streams to keep; the others are sent to DEVNULL
+
         Returns:
-            Tuple of (success, stdout, stderr)
+            Tuple of (success, raw stdout bytes, decoded stderr)
         """
         try:
             full_command = ["snow"] + command
             self.logger.debug(f"Executing: {' '.join(full_command)}")
 
+            # Keep stdout as bytes; json.loads decodes it in one pass
             result = subprocess.run(
                 full_command,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE if "stdout" in capture else subprocess.DEVNULL,
+                stderr=subprocess.PIPE if "stderr" in capture else subprocess.DEVNULL,
                 timeout=timeout,
                 cwd=Path(__file__).parent.parent,
+                env=self._snow_env,
             )
+            stderr = (result.stderr or b"").decode("utf-8", "replace")
 
             success = result.returncode == 0
             if not success:
                 self.logger.debug(f"Command failed with code {result.returncode}")
-                self.logger.debug(f"STDERR: {result.stderr}")
+                self.logger.debug(f"STDERR: {stderr}")
 
-            return success, result.stdout, result.stderr
+            return success, result.stdout or b"", stderr
 
         except subprocess.TimeoutExpired:
             error_msg = f"Command timed out after {timeout} seconds"
             self.add_error("Command timeout", error_msg)
-            return False, "", error_msg
+            return False, b"", error_msg
         except FileNotFoundError:
             error_msg = "snow CLI not found in PATH"
             self.add_error("CLI not found", error_msg)
-            return False, "", error_msg
+            return False, b"", error_msg
         except Exception as e:
             error_msg = f"Unexpected error executing command: {str(e)}"
             self.add_error("Command execution error", error_msg)
-            return False, "", error_msg
+            return False, b"", error_msg
+
+    def _exec_sql(
+        self,
+        sql: str,
+        params: Optional[Dict[str, Any]] = None,
+        connection_name: Optional[str] = None,
+    ) -> QueryResult:
+        """
+        Run a query on the connector session, or through snow CLI without one.
+
+        Args:
+            sql: Query text, with %(name)s placeholders for params
+            params: Bind values for the query
+            connection_name: snow CLI connection to use; defaults to the one
+                the connectivity test found working
+
+        Returns:
+            Tuple of (success, rows as dicts keyed by column name, error)
+        """
+        if self.conn is None:
+            success, stdout, stderr = self.execute_snow_command(
+                self._snow_sql_command(sql, params, connection_name)
+            )
+            if not success:
+                return False, [], stderr
+            try:
+                return True, self._load_cli_json(stdout), ""
+            except ValueError as e:
+                return False, [], f"Could not parse snow CLI output: {str(e)}"
+
+        from snowflake.connector import DictCursor
+
+        cursor = self.conn.cursor(DictCursor)
+        try:
+            cursor.execute(sql, params)
+            return True, cursor.fetchall(), ""
+        except Exception as e:
+            self.logger.debug(f"Query failed: {str(e)}")
+            return False, [], str(e)
+        finally:
+            cursor.close()
+
+    def _snow_sql_command(
+        self,
+        sql: str,
+        params: Optional[Dict[str, Any]] = None,
+        connection_name: Optional[str] = None,
+    ) -> List[str]:
+        """Build the snow sql arguments for a query with JSON output."""
+        if params:
+            # snow CLI has no bind variables; the values are our own dates
+            sql = sql % {name: f"'{value}'" for name, value in params.items()}
+        command = ["sql", "--format", "JSON", "-q", sql]
+        connection_name = connection_name or self._conn_name
+        if connection_name:
+            command[1:1] = ["-c", connection_name]
+        return command
+
+    @staticmethod
+    def _load_cli_json(data: bytes) -> List[Dict[str, Any]]:
+        """Load rows from snow CLI --format JSON output."""
+        return json.loads(data) if data.strip() else []
 
     def test_connectivity(self) -> bool:
-        """Test basic Snowflake connectivity using snow CLI."""
+        """Test basic Snowflake connectivity on the connector session or snow CLI."""
         self.console.print("[bold blue]Testing Snowflake Connectivity...[/bold blue]")
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=self.console,
-        ) as progress:
-            task = progress.add_task("Connecting to Snowflake...", total=None)
+        # Animate only on a terminal; logs and CI get no spinner redraws
+        status = (
+            self.console.status("Connecting to Snowflake...")
+            if self.console.is_terminal
+            else nullcontext()
+        )
+        with status:
 
-            # First, check available connections
-            conn_success, conn_stdout, conn_stderr = self.execute_snow_command(
-                ["connection", "list"]
-            )
+            # The connector session needs no snow CLI connection discovery
+            connections = self._list_connections() if self.conn is None else []
 
             # Test basic connection with simple query
-            success, stdout, stderr = self.execute_snow_command(
-                [
-                    "sql",
-                    "-q",
-                    "SELECT CURRENT_VERSION() as VERSION, CURRENT_USER() as USER, CURRENT_ROLE() as ROLE",
-                ]
-            )
+            success, rows, stderr = self._exec_sql(CONNECTIVITY_SQL)
 
             # If default connection fails, try other connections
-            if not success and conn_success:
+            if not success and connections:
                 self.console.print(
                     "[yellow]Default connection failed, trying alternative connections...[/yellow]"
                 )
-                connections = self._parse_connections(conn_stdout)
                 for conn_name in connections:
                     self.console.print(
                         f"[yellow]Trying connection: {conn_name}[/yellow]"
                     )
-                    alt_success, alt_stdout, alt_stderr = self.execute_snow_command(
-                        [
-                            "sql",
-                            "-c",
-                            conn_name,
-                            "-q",
-                            "SELECT CURRENT_VERSION() as VERSION, CURRENT_USER() as USER, CURRENT_ROLE() as ROLE",
-                        ]
+                    alt_success, alt_rows, alt_stderr = self._exec_sql(
+                        CONNECTIVITY_SQL, connection_name=conn_name
                     )
                     if alt_success:
-                        success, stdout, stderr = alt_success, alt_stdout, alt_stderr
+                        success, rows, stderr = alt_success, alt_rows, alt_stderr
+                        self._conn_name = conn_name
                         self.add_recommendation(
                             f"Use connection '{conn_name}' for reliable access", "high"
                         )
                         break
 
-            progress.stop()
+        if self.conn is not None:
+            available_connections = "Not needed (snowflake-connector session)"
+        elif connections is not None:
+            available_connections = connections
+        else:
+            available_connections = "Could not retrieve connections"
 
         if success:
             self.results["tests"]["connectivity"] = {
                 "status": "success",
                 "details": "Successfully connected to Snowflake",
-                "output": stdout.strip(),
-                "available_connections": (
-                    conn_stdout if conn_success else "Could not retrieve connections"
-                ),
+                "output": rows,
+                "available_connections": available_connections,
             }
             self.console.print("[green]✓[/green] Snowflake connectivity test passed")
             return True
         else:
+            troubleshooting = self._generate_auth_troubleshooting(stderr)
             self.results["tests"]["connectivity"] = {
                 "status": "failed",
                 "details": f"Connection failed: {stderr}",
                 "error": stderr,
-                "available_connections": (
-                    conn_stdout if conn_success else "Could not retrieve connections"
-                ),
-                "troubleshooting": self._generate_auth_troubleshooting(stderr),
+                "available_connections": available_connections,
+                "troubleshooting": troubleshooting,
             }
             self.console.print("[red]✗[/red] Snowflake connectivity test failed")
-            self.add_error("Connectivity test failed", stderr)
+            self.add_error("Connectivity test failed", stderr, test_name="connectivity")
 
             # Display troubleshooting information
-            self._display_auth_troubleshooting(stderr)
+            self._display_auth_troubleshooting(troubleshooting)
             return False
 
-    def _parse_connections(self, conn_output: str) -> List[str]:
-        """Parse connection names from snow CLI output."""
-        connections = []
-        lines = conn_output.split("\n")
-        for line in lines:
-            if "|" in line and "connection_name" not in line:
-                parts = line.split("|")
-                if len(parts) > 0:
-                    conn_name = parts[0].strip()
-                    if conn_name and conn_name != "-":
-                        connections.append(conn_name)
-        return connections
+    def _list_connections(self) -> Optional[List[str]]:
+        """Names of the configured snow CLI connections, or None if unavailable."""
+        success, stdout, _ = self.execute_snow_command(
+            ["connection", "list", "--format", "JSON"], capture=("stdout",)
+        )
+        if not success:
+            return None
+        try:
+            return [conn["connection_name"] for conn in self._load_cli_json(stdout)]
+        except (ValueError, KeyError, TypeError) as e:
+            self.logger.debug(f"Unexpected connection list output: {str(e)}")
+            return None
 
     def _generate_auth_troubleshooting(self, error_msg: str) -> Dict[str, Any]:
         """Generate specific troubleshooting steps based on error message."""
-        troubleshooting = {
-            "error_type": "unknown",
-            "likely_cause": "Unknown authentication issue",
-            "recommended_actions": [],
-        }
+        return _auth_troubleshooting(error_msg)
 
-        if "JWT token is invalid" in error_msg:
-            troubleshooting.update(
-                {
-                    "error_type": "jwt_authentication",
-                    "likely_cause": "RSA private key authentication failure",
-                    "recommended_actions": [
-                        "Verify RSA private key file exists and is readable",
-                        "Check if private key passphrase is required",
-                        "Ensure public key is properly registered in Snowflake user settings",
-                        "Regenerate RSA key pair if needed",
-                        "Try password authentication as fallback",
-                    ],
-                }
-            )
-        elif "Incorrect username or password" in error_msg:
-            troubleshooting.update(
-                {
-                    "error_type": "password_authentication",
-                    "likely_cause": "Invalid username/password combination",
-                    "recommended_actions": [
-                        "Verify SNOWFLAKE_USER and authentication method in .env",
-                        "Check if user account is locked or disabled",
-                        "Verify account name (SNOWFLAKE_ACCOUNT) is correct",
-                        "Test login through Snowflake web interface",
-                        "Switch to RSA key authentication for service accounts",
-                    ],
-                }
-            )
-        elif "Failed to connect" in error_msg:
-            troubleshooting.update(
-                {
-                    "error_type": "connection_failure",
-                    "likely_cause": "Network or account configuration issue",
-                    "recommended_actions": [
-                        "Verify SNOWFLAKE_ACCOUNT value is correct",
-                        "Check network connectivity to Snowflake",
-                        "Verify account is active and not suspended",
-                        "Check for regional-specific account URLs",
-                    ],
-                }
-            )
-
-        return troubleshooting
-
-    def _display_auth_troubleshooting(self, error_msg: str) -> None:
-        """Display authentication troubleshooting information."""
-        troubleshooting = self._generate_auth_troubleshooting(error_msg)
-
-        content = f"""
-🔍 **Error Type:** {troubleshooting['error_type'].replace('_', ' ').title()}
-
-🎯 **Likely Cause:** {troubleshooting['likely_cause']}
-
-🔧 **Recommended Actions:**
-"""
-        for i, action in enumerate(troubleshooting["recommended_actions"], 1):
-            content += f"\n   {i}. {action}"
-
-        content += f"""
-
-📋 **Quick Fixes to Try:**
-   • Run: uv run diagnose-auth (for detailed auth analysis)
-   • Check: snow connection list (see available connections)
-   • Test: snow sql -c [connection_name] -q "SELECT 1" (test specific connection)
-   • Verify: uv run test-env (check environment configuration)
-"""
+    def _display_auth_troubleshooting(self, troubleshooting: Dict[str, Any]) -> None:
+        """Display troubleshooting from _generate_auth_troubleshooting."""
+        header = _TROUBLESHOOTING_HEADER.format(
+            error_type=troubleshooting["error_type"].replace("_", " ").title(),
+            likely_cause=troubleshooting["likely_cause"],
+        )
+        actions = [
+            f"\n   {i}. {action}"
+            for i, action in enumerate(troubleshooting["recommended_actions"], 1)
+        ]
 
         self.console.print(
             Panel(
-                content, title="🚨 Authentication Troubleshooting", border_style="red"
+                "".join([header, *actions, _TROUBLESHOOTING_FOOTER]),
+                title="🚨 Authentication Troubleshooting",
+                border_style="red",
             )
         )
 
-    def check_existing_monitors(self) -> bool:
-        """Check existing resource monitors in Snowflake."""
+    def check_existing_monitors(self, result: Optional[QueryResult] = None) -> bool:
+        """
+        Check existing resource monitors in Snowflake.
+
+        Args:
+            result: Prefetched query result; the query runs now when omitted
+        """
         self.console.print(
             "[bold blue]Checking Existing Resource Monitors...[/bold blue]"
         )
 
         # Query for existing resource monitors
-        success, stdout, stderr = self.execute_snow_command(
-            [
-                "sql",
-                "-q",
-                """
-            SELECT
-                NAME,
-                CREDIT_QUOTA,
-                USED_CREDITS,
-                REMAINING_CREDITS,
-                LEVEL,
-                FREQUENCY,
-                START_TIME,
-                END_TIME,
-                SUSPEND_AT,
-                SUSPEND_IMMEDIATELY_AT,
-                NOTIFY_AT,
-                NOTIFY_USERS,
-                CREATED_ON,
-                OWNER
-            FROM SNOWFLAKE.ACCOUNT_USAGE.RESOURCE_MONITORS
-            WHERE DELETED IS NULL
-            ORDER BY CREATED_ON DESC
-            """,
-            ]
-        )
+        success, rows, stderr = result or self._exec_sql(MONITORS_SQL)
 
         if success:
             self.results["tests"]["existing_monitors"] = {
                 "status": "success",
                 "details": "Successfully retrieved resource monitor information",
-                "output": stdout.strip(),
+                "output": rows,
             }
 
-            # Parse and display results
-            if stdout.strip():
+            # Display results
+            if rows:
                 self.console.print("[green]✓[/green] Found existing resource monitors")
-                self._display_monitor_table(stdout)
+                self._display_monitor_table(rows)
             else:
                 self.console.print(
                     "[yellow]![/yellow] No existing resource monitors found"
@@ -409,53 +728,34 @@ class ResourceMonitorInvestigator:
             self.console.print(
                 "[red]✗[/red] Failed to check existing resource monitors"
             )
-            self.add_error("Monitor check failed", stderr)
+            self.add_error(
+                "Monitor check failed", stderr, test_name="existing_monitors"
+            )
             return False
 
-    def analyze_warehouse_status(self) -> bool:
-        """Analyze current warehouse configurations and resource monitor assignments."""
+    def analyze_warehouse_status(self, result: Optional[QueryResult] = None) -> bool:
+        """
+        Analyze current warehouse configurations and resource monitor assignments.
+
+        Args:
+            result: Prefetched query result; the query runs now when omitted
+        """
         self.console.print(
             "[bold blue]Analyzing Warehouse Configurations...[/bold blue]"
         )
 
         # Query warehouse information
-        success, stdout, stderr = self.execute_snow_command(
-            [
-                "sql",
-                "-q",
-                """
-            SELECT
-                w.NAME,
-                w.STATE,
-                w.TYPE,
-                w.SIZE,
-                w.RUNNING,
-                w.QUEUED,
-                w.IS_DEFAULT,
-                w.IS_CURRENT,
-                w.AUTO_SUSPEND,
-                w.AUTO_RESUME,
-                w.RESOURCE_MONITOR,
-                w.COMMENT,
-                w.CREATED_ON,
-                w.RESUMED_ON,
-                w.UPDATED_ON
-            FROM SNOWFLAKE.ACCOUNT_USAGE.WAREHOUSES w
-            WHERE w.DELETED IS NULL
-            ORDER BY w.CREATED_ON DESC
-            """,
-            ]
-        )
+        success, rows, stderr = result or self._exec_sql(WAREHOUSES_SQL)
 
         if success:
             self.results["tests"]["warehouse_analysis"] = {
                 "status": "success",
                 "details": "Successfully retrieved warehouse information",
-                "output": stdout.strip(),
+                "output": rows,
             }
 
             self.console.print("[green]✓[/green] Warehouse analysis completed")
-            self._display_warehouse_table(stdout)
+            self._display_warehouse_table(rows)
             return True
         else:
             self.results["tests"]["warehouse_analysis"] = {
@@ -464,48 +764,40 @@ class ResourceMonitorInvestigator:
                 "error": stderr,
             }
             self.console.print("[red]✗[/red] Failed to analyze warehouses")
-            self.add_error("Warehouse analysis failed", stderr)
+            self.add_error(
+                "Warehouse analysis failed", stderr, test_name="warehouse_analysis"
+            )
             return False
 
-    def analyze_credit_usage(self) -> bool:
-        """Analyze recent credit usage patterns."""
+    @cached_property
+    def _credit_usage_params(self) -> Dict[str, date]:
+        """Start and end dates of the credit usage analysis."""
+        end_date = date.today()
+        return {"start": end_date - timedelta(days=CREDIT_USAGE_DAYS), "end": end_date}
+
+    def analyze_credit_usage(self, result: Optional[QueryResult] = None) -> bool:
+        """
+        Analyze recent credit usage patterns.
+
+        Args:
+            result: Prefetched query result; the query runs now when omitted
+        """
         self.console.print("[bold blue]Analyzing Credit Usage Patterns...[/bold blue]")
 
-        # Get credit usage for last 30 days
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=30)
-
-        success, stdout, stderr = self.execute_snow_command(
-            [
-                "sql",
-                "-q",
-                f"""
-            SELECT
-                DATE(START_TIME) as USAGE_DATE,
-                WAREHOUSE_NAME,
-                SUM(CREDITS_USED) as DAILY_CREDITS,
-                COUNT(*) as QUERY_COUNT,
-                AVG(CREDITS_USED) as AVG_CREDITS_PER_QUERY,
-                MAX(CREDITS_USED) as MAX_CREDITS_SINGLE_QUERY
-            FROM SNOWFLAKE.ACCOUNT_USAGE.WAREHOUSE_METERING_HISTORY
-            WHERE START_TIME >= '{start_date.strftime('%Y-%m-%d')}'
-              AND START_TIME <= '{end_date.strftime('%Y-%m-%d')}'
-            GROUP BY DATE(START_TIME), WAREHOUSE_NAME
-            ORDER BY USAGE_DATE DESC, DAILY_CREDITS DESC
-            """,
-            ]
-        )
+        # Get credit usage for the last CREDIT_USAGE_DAYS days
+        params = self._credit_usage_params
+        success, rows, stderr = result or self._exec_sql(CREDIT_USAGE_SQL, params)
 
         if success:
             self.results["tests"]["credit_usage"] = {
                 "status": "success",
                 "details": "Successfully retrieved credit usage data",
-                "output": stdout.strip(),
-                "analysis_period": f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
+                "output": rows,
+                "analysis_period": f"{params['start']} to {params['end']}",
             }
 
             self.console.print("[green]✓[/green] Credit usage analysis completed")
-            self._display_credit_usage_table(stdout)
+            self._display_credit_usage_table(rows)
             return True
         else:
             self.results["tests"]["credit_usage"] = {
@@ -514,7 +806,9 @@ class ResourceMonitorInvestigator:
                 "error": stderr,
             }
             self.console.print("[red]✗[/red] Failed to analyze credit usage")
-            self.add_error("Credit usage analysis failed", stderr)
+            self.add_error(
+                "Credit usage analysis failed", stderr, test_name="credit_usage"
+            )
             return False
 
     def assess_deployment_safety(self) -> bool:
@@ -528,8 +822,7 @@ class ResourceMonitorInvestigator:
             "credit_usage" in self.results["tests"]
             and self.results["tests"]["credit_usage"]["status"] == "success"
         ):
-            usage_data = self.results["tests"]["credit_usage"]["output"]
-            if usage_data.strip():
+            if self.results["tests"]["credit_usage"]["output"]:
                 safety_checks.append("✓ Credit usage data available for analysis")
                 self.add_recommendation(
                     "Review credit usage patterns before setting monitor limits", "high"
@@ -543,8 +836,7 @@ class ResourceMonitorInvestigator:
         # Check 2: Verify existing monitors don't conflict
         if "existing_monitors" in self.results["tests"]:
             if self.results["tests"]["existing_monitors"]["status"] == "success":
-                monitor_data = self.results["tests"]["existing_monitors"]["output"]
-                if monitor_data.strip():
+                if self.results["tests"]["existing_monitors"]["output"]:
                     safety_checks.append(
                         "⚠ Existing resource monitors found - check for conflicts"
                     )
@@ -568,12 +860,8 @@ class ResourceMonitorInvestigator:
             )
 
         # Determine overall safety
-        failed_tests = [
-            k for k, v in self.results["tests"].items() if v.get("status") == "failed"
-        ]
-        critical_warnings = len(
-            [w for w in self.results["warnings"] if "failed" in w["message"].lower()]
-        )
+        failed_tests = list(self._failed_tests)
+        critical_warnings = self._critical_warning_count
 
         if failed_tests:
             self.results["safe_to_deploy"] = False
@@ -604,65 +892,66 @@ class ResourceMonitorInvestigator:
 
         return True
 
-    def _display_monitor_table(self, data: str) -> None:
+    @staticmethod
+    def _cell(value: Any) -> str:
+        """Render a query value as table cell text."""
+        return "" if value is None else str(value)
+
+    def _display_monitor_table(self, rows: List[Dict[str, Any]]) -> None:
         """Display resource monitors in a formatted table."""
-        if not data.strip():
+        if not rows:
             return
 
+        from rich.table import Table
+
         table = Table(title="Existing Resource Monitors")
-        lines = data.strip().split("\n")
 
-        if len(lines) > 1:
-            # Add columns based on first line (headers)
-            headers = lines[0].split("|")
-            for header in headers[:6]:  # Limit displayed columns
-                table.add_column(header.strip(), overflow="fold")
+        # Add columns based on the first row's keys
+        headers = list(rows[0])[:6]  # Limit displayed columns
+        for header in headers:
+            table.add_column(header, overflow="fold")
 
-            # Add data rows
-            for line in lines[1:]:
-                if line.strip():
-                    values = [val.strip() for val in line.split("|")]
-                    table.add_row(*values[:6])
+        # Add data rows
+        for row in rows:
+            table.add_row(*(self._cell(row.get(header)) for header in headers))
 
         self.console.print(table)
 
-    def _display_warehouse_table(self, data: str) -> None:
+    def _display_warehouse_table(self, rows: List[Dict[str, Any]]) -> None:
         """Display warehouse configurations in a formatted table."""
-        if not data.strip():
+        if not rows:
             return
 
+        from rich.table import Table
+
         table = Table(title="Warehouse Configurations")
-        lines = data.strip().split("\n")
-
-        if len(lines) > 1:
-            # Key columns to display
-            table.add_column("Name", style="bold")
-            table.add_column("State")
-            table.add_column("Size")
-            table.add_column("Auto Suspend")
-            table.add_column("Resource Monitor")
-
-            # Parse and add data
-            for line in lines[1:]:
-                if line.strip():
-                    values = [val.strip() for val in line.split("|")]
-                    if len(values) >= 11:
-                        table.add_row(
-                            values[0],  # NAME
-                            values[1],  # STATE
-                            values[3],  # SIZE
-                            values[8],  # AUTO_SUSPEND
-                            values[10] if values[10] else "None",  # RESOURCE_MONITOR
-                        )
+
+        # Key columns to display
+        table.add_column("Name", style="bold")
+        table.add_column("State")
+        table.add_column("Size")
+        table.add_column("Auto Suspend")
+        table.add_column("Resource Monitor")
+
+        for row in rows:
+            table.add_row(
+                self._cell(row.get("NAME")),
+                self._cell(row.get("STATE")),
+                self._cell(row.get("SIZE")),
+                self._cell(row.get("AUTO_SUSPEND")),
+                self._cell(row.get("RESOURCE_MONITOR")) or "None",
+            )
 
         self.console.print(table)
 
-    def _display_credit_usage_table(self, data: str) -> None:
+    def _display_credit_usage_table(self, rows: List[Dict[str, Any]]) -> None:
         """Display credit usage analysis in a formatted table."""
-        if not data.strip():
+        if not rows:
             self.console.print("[yellow]No credit usage data available[/yellow]")
             return
 
+        from rich.table import Table
+
         table = Table(title="Recent Credit Usage (Last 30 Days)")
         table.add_column("Date")
         table.add_column("Warehouse", style="bold")
@@ -670,12 +959,14 @@ class ResourceMonitorInvestigator:
         table.add_column("Query Count", justify="right")
         table.add_column("Avg Credits/Query", justify="right")
 
-        lines = data.strip().split("\n")
-        for line in lines[1:10]:  # Show top 10 entries
-            if line.strip():
-                values = [val.strip() for val in line.split("|")]
-                if len(values) >= 5:
-                    table.add_row(*values[:5])
+        for row in rows[:9]:  # Show top entries
+            table.add_row(
+                self._cell(row.get("USAGE_DATE")),
+                self._cell(row.get("WAREHOUSE_NAME")),
+                self._cell(row.get("DAILY_CREDITS")),
+                self._cell(row.get("QUERY_COUNT")),
+                self._cell(row.get("AVG_CREDITS_PER_QUERY")),
+            )
 
         self.console.print(table)
 
@@ -695,6 +986,89 @@ class ResourceMonitorInvestigator:
 
         self.console.print(Panel(panel_content, title=title, border_style=panel_style))
 
+    def _run_batched_queries(self) -> Dict[str, QueryResult]:
+        """
+        Fetch the analysis queries in one multi-statement round trip.
+
+        Without a connector session the batch runs in a single snow process.
+        If the batch fails, the queries run concurrently on their own so each
+        one reports its own error.
+
+        Returns:
+            Query results keyed by the test they feed
+        """
+        params = self._credit_usage_params
+
+        if self.conn is None:
+            results = self._run_cli_batch(
+                list(ANALYSIS_QUERIES), ANALYSIS_BATCH_SQL, params
+            )
+            return results if results is not None else self._prefetch_queries()
+
+        from snowflake.connector import DictCursor
+
+        cursor = self.conn.cursor(DictCursor)
+        try:
+            cursor.execute(
+                ANALYSIS_BATCH_SQL, params, num_statements=len(ANALYSIS_QUERIES)
+            )
+            results = {}
+            for name in ANALYSIS_QUERIES:
+                results[name] = (True, cursor.fetchall(), "")
+                cursor.nextset()
+            return results
+        except Exception as e:
+            self.logger.debug(f"Batched queries failed, running separately: {str(e)}")
+            return self._prefetch_queries()
+        finally:
+            cursor.close()
+
+    def _run_cli_batch(
+        self, names: List[str], sql: str, params: Dict[str, Any]
+    ) -> Optional[Dict[str, QueryResult]]:
+        """
+        Run several statements in one snow process, paying its startup once.
+
+        Returns:
+            Query results keyed by name, or None if the batch failed
+        """
+        success, stdout, _ = self.execute_snow_command(
+            self._snow_sql_command(sql, params),
+            timeout=30 * len(names),
+            capture=("stdout",),
+        )
+        if not success:
+            return None
+        try:
+            # Multi-statement JSON output is one row list per statement
+            result_sets = self._load_cli_json(stdout)
+        except ValueError:
+            return None
+        if len(result_sets) != len(names) or not all(
+            isinstance(rows, list) for rows in result_sets
+        ):
+            return None
+        return {name: (True, rows, "") for name, rows in zip(names, result_sets)}
+
+    def _prefetch_queries(self) -> Dict[str, QueryResult]:
+        """
+        Run the monitor, warehouse and credit usage queries concurrently.
+
+        Returns:
+            Query results keyed by the test they feed
+        """
+        with ThreadPoolExecutor(max_workers=len(ANALYSIS_QUERIES)) as executor:
+            futures = {
+                name: executor.submit(
+                    self._exec_sql,
+                    sql,
+                    # Only the credit usage query takes bind values
+                    self._credit_usage_params if name == "credit_usage" else None,
+                )
+                for name, sql in ANALYSIS_QUERIES.items()
+            }
+        return {name: future.result() for name, future in futures.items()}
+
     def run_investigation(self, mode: str = "full") -> Dict[str, Any]:
         """
         Run the complete investigation based on specified mode.
@@ -722,14 +1096,17 @@ class ResourceMonitorInvestigator:
                         "Connectivity test failed - some tests may not be reliable"
                     )
 
+            # Fetch the independent queries together; results are reported in order
+            prefetched = self._run_batched_queries() if mode == "full" else {}
+
             if mode in ["full", "monitors"]:
-                self.check_existing_monitors()
+                self.check_existing_monitors(prefetched.get("existing_monitors"))
 
             if mode in ["full", "warehouses"]:
-                self.analyze_warehouse_status()
+                self.analyze_warehouse_status(prefetched.get("warehouse_analysis"))
 
             if mode in ["full", "credits"]:
-                self.analyze_credit_usage()
+                self.analyze_credit_usage(prefetched.get("credit_usage"))
 
             if mode in ["full", "safety"]:
                 self.assess_deployment_safety()
@@ -746,89 +1123,91 @@ class ResourceMonitorInvestigator:
 
         return self.results
 
-    def save_results(self, output_path: Optional[Path] = None) -> Path:
-        """Save investigation results to a timestamped file."""
+    def save_results(
+        self, output_path: Optional[Path] = None, data: Optional[bytes] = None
+    ) -> Path:
+        """Save investigation results to a timestamped file.
+
+        Args:
+            output_path: File to write; defaults to a timestamped file
+            data: Results already serialized by _results_json, if available
+        """
         if output_path is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = (
                 Path(__file__).parent.parent / f"investigation_results_{timestamp}.json"
             )
 
-        with open(output_path, "w") as f:
-            json.dump(self.results, f, indent=2, default=str)
+        if data is None:
+            data = _results_json(self.results)
+        Path(output_path).write_bytes(data)
 
         self.console.print(f"[green]Results saved to:[/green] {output_path}")
         return output_path
 
+    def _sorted_recommendations(self) -> List[Dict[str, Any]]:
+        """Return recommendations sorted by priority, cached until the next add."""
+        with self._lock:
+            if self._sorted_recs is None:
+                self._sorted_recs = sorted(
+                    self.results["recommendations"],
+                    key=lambda rec: _PRIORITY_ORDER[rec["priority"]],
+                )
+            return self._sorted_recs
+
     def format_human_summary(self) -> str:
         """Generate human-readable summary of investigation results."""
-        summary = []
-        summary.append(f"# Resource Monitor Investigation Summary")
-        summary.append(f"**Investigation ID:** {self.results['investigation_id']}")
-        summary.append(f"**Timestamp:** {self.results['timestamp']}")
-        summary.append(f"**Status:** {self.results['status'].upper()}")
-        summary.append("")
+        return "\n".join(self._iter_summary_lines())
+
+    def _iter_summary_lines(self) -> Iterator[str]:
+        """Yield the lines of the human-readable summary."""
+        results = self.results
+        yield "# Resource Monitor Investigation Summary"
+        yield f"**Investigation ID:** {results['investigation_id']}"
+        yield f"**Timestamp:** {results['timestamp']}"
+        yield f"**Status:** {results['status'].upper()}"
+        yield ""
 
         # Test Results
-        summary.append("## Test Results")
-        for test_name, test_data in self.results["tests"].items():
+        yield "## Test Results"
+        for test_name, test_data in results["tests"].items():
             status = test_data.get("status", "unknown")
-            emoji = "✓" if status == "success" else "✗" if status == "failed" else "⚠"
-            summary.append(
-                f"- {emoji} **{test_name.replace('_', ' ').title()}:** {status}"
+            yield (
+                f"- {_STATUS_EMOJI.get(status, '⚠')} "
+                f"**{test_name.replace('_', ' ').title()}:** {status}"
             )
-        summary.append("")
+        yield ""
 
         # Safety Assessment
-        if self.results.get("safe_to_deploy") is not None:
-            summary.append("## Deployment Safety")
-            if self.results["safe_to_deploy"] is True:
-                summary.append("🟢 **APPROVED** - Deployment appears safe")
-            elif self.results["safe_to_deploy"] == "conditional":
-                summary.append(
-                    "🟡 **CONDITIONAL** - Address warnings before deployment"
-                )
-            else:
-                summary.append(
-                    "🔴 **NOT APPROVED** - Fix critical issues before deployment"
-                )
-            summary.append("")
+        safe_to_deploy = results.get("safe_to_deploy")
+        if safe_to_deploy is not None:
+            yield "## Deployment Safety"
+            yield _DEPLOY_VERDICT[safe_to_deploy]
+            yield ""
 
         # Warnings
-        if self.results["warnings"]:
-            summary.append("## ⚠️ Warnings")
-            for warning in self.results["warnings"]:
-                summary.append(f"- {warning['message']}")
-            summary.append("")
+        warnings = results["warnings"]
+        if warnings:
+            yield "## ⚠️ Warnings"
+            for warning in warnings:
+                yield f"- {warning['message']}"
+            yield ""
 
         # Recommendations
-        if self.results["recommendations"]:
-            summary.append("## 📋 Recommendations")
-            for rec in sorted(
-                self.results["recommendations"],
-                key=lambda x: {"critical": 0, "high": 1, "medium": 2, "low": 3}[
-                    x["priority"]
-                ],
-            ):
-                priority_emoji = {
-                    "critical": "🚨",
-                    "high": "🔥",
-                    "medium": "💡",
-                    "low": "📝",
-                }[rec["priority"]]
-                summary.append(
-                    f"- {priority_emoji} **{rec['priority'].upper()}:** {rec['message']}"
-                )
-            summary.append("")
+        recs = self._sorted_recommendations()
+        if recs:
+            yield "## 📋 Recommendations"
+            for rec in recs:
+                yield f"{_PRIORITY_PREFIX[rec['priority']]} {rec['message']}"
+            yield ""
 
         # Errors
-        if self.results["error_details"]:
-            summary.append("## ❌ Errors")
-            for error in self.results["error_details"]:
-                summary.append(f"- **{error['type']}:** {error['details']}")
-            summary.append("")
-
-        return "\n".join(summary)
+        errors = results["error_details"]
+        if errors:
+            yield "## ❌ Errors"
+            for error in errors:
+                yield f"- **{error['type']}:** {error['details']}"
+            yield ""
 
 
 def main():
@@ -858,21 +1237,22 @@ def main():
     # Setup console
     console = Console()
 
-    # Create investigator
-    investigator = ResourceMonitorInvestigator(console)
-
-    if args.debug:
-        investigator.logger.setLevel(logging.DEBUG)
+    # Create investigator; the connector session closes on exit
+    with ResourceMonitorInvestigator(console) as investigator:
+        if args.debug:
+            investigator.logger.setLevel(logging.DEBUG)
 
-    # Run investigation
-    results = investigator.run_investigation(args.mode)
+        # Run investigation
+        results = investigator.run_investigation(args.mode)
 
-    # Output results
-    if args.output_format in ["json", "both"]:
+    # Output results, serializing them at most once for display and saving
+    want_json = args.output_format != "human"
+    results_json = _results_json(results) if want_json or args.save_results else None
+    if want_json:
         console.print("\n[bold]JSON Results:[/bold]")
-        console.print_json(data=results)
+        console.print_json(results_json.decode("utf-8"))
 
-    if args.output_format in ["human", "both"]:
+    if args.output_format != "json":
         console.print("\n[bold]Summary Report:[/bold]")
         summary = investigator.format_human_summary()
         console.print(
@@ -881,15 +1261,11 @@ def main():
 
     # Save results if requested
     if args.save_results:
-        investigator.save_results()
+        investigator.save_results(data=results_json)
 
     # Exit with appropriate code
-    exit_code = 0
-    if results["status"] == "error":
-        exit_code = 1
-    elif results["status"] == "interrupted":
-        exit_code = 130
-    elif results.get("safe_to_deploy") is False:
+    exit_code = _EXIT_CODES.get(results["status"], 0)
+    if exit_code == 0 and results.get("safe_to_deploy") is False:
         exit_code = 2
 
     sys.exit(exit_code)
@@ -5,178 +5,127 @@ Management CLI wrapper for SnowDDL management scripts.
 This module provides entry points for all management commands.
 """
 
+import importlib
 import sys
 from pathlib import Path
 
+# Add the src directory to the path for the snowtower_snowddl package, once
+src_dir = str(Path(__file__).parent)
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
 # Add the parent directory to the path to access scripts
 scripts_dir = Path(__file__).parent.parent / "scripts"
 sys.path.insert(0, str(scripts_dir))
 
-
-def warehouses():
-    """Run warehouse management commands."""
-    from manage_warehouses import main
-
-    main()
-
-
-def costs():
-    """Run cost optimization commands."""
-    from cost_optimization import main
-
-    main()
-
-
-def security():
-    """Run security audit commands."""
-    from security_audit import main
-
-    main()
-
-
-def backup():
-    """Run backup and restore commands."""
-    from backup_restore import main
-
-    main()
-
-
-def users():
-    """Run user management commands."""
-    from manage_users import main
-
-    main()
-
-
-def apply_schema_grants():
-    """Apply schema-level USAGE grants that SnowDDL cannot manage."""
-    from apply_schema_grants import main
-
-    main()
-
-
-def validate_schema_grants():
-    """Validate schema grants consistency between tech_role.yaml and apply_schema_grants.py."""
-    from validate_schema_grants import main
-
-    main()
-
-
-def process_access_request():
-    """Process GitHub issue access requests."""
-    from generate_user_from_issue import main
-
-    main()
-
-
-def snowddl_plan():
-    """Run SnowDDL plan command."""
-    # Add src directory to path if not already there
-    import sys
-    from pathlib import Path
-
-    src_dir = Path(__file__).parent
-    if str(src_dir) not in sys.path:
-        sys.path.insert(0, str(src_dir))
-
-    from snowtower_snowddl.cli import plan
-
-    plan()
-
-
-def snowddl_validate():
-    """Run SnowDDL validate command."""
-    # Add src directory to path if not already there
-    import sys
-    from pathlib import Path
-
-    src_dir = Path(__file__).parent
-    if str(src_dir) not in sys.path:
-        sys.path.insert(0, str(src_dir))
-
-    from snowtower_snowddl.cli import validate_config
-
-    validate_config()
-
-
-def snowddl_apply():
-    """Run SnowDDL apply command."""
-    # Add src directory to path if not already there
-    import sys
-    from pathlib import Path
-
-    src_dir = Path(__file__).parent
-    if str(src_dir) not in sys.path:
-        sys.path.insert(0, str(src_dir))
-
-    from snowtower_snowddl.cli import apply
-
-    apply()
-
-
-def snowddl_diff():
-    """Run SnowDDL diff command."""
-    # Add src directory to path if not already there
-    import sys
-    from pathlib import Path
-
-    src_dir = Path(__file__).parent
-    if str(src_dir) not in sys.path:
-        sys.path.insert(0, str(src_dir))
-
-    from snowtower_snowddl.cli import diff
-
-    diff()
-
-
-def snowddl_lint():
-    """Run SnowDDL lint command."""
-    # Add src directory to path if not already there
-    import sys
-    from pathlib import Path
-
-    src_dir = Path(__file__).parent
-    if str(src_dir) not in sys.path:
-        sys.path.insert(0, str(src_dir))
-
-    from snowtower_snowddl.cli import lint_config
-
-    lint_config()
-
-
-def update_user_password():
-    """Update user password safely."""
-    # Add src directory to path if not already there
-    import sys
-    from pathlib import Path
-
-    src_dir = Path(__file__).parent
-    if str(src_dir) not in sys.path:
-        sys.path.insert(0, str(src_dir))
-
-    from snowtower_snowddl.cli import update_user_password
-
-    update_user_password()
-
-
-# === CONFIGURATION VALIDATION ===
-
-
-def validate_config():
-    """Validate SnowDDL YAML configuration files before deployment."""
-    from validate_config import main
-
-    main()
-
-
-# === STREAMLIT TESTING COMMANDS ===
-
-
-def validate_streamlit():
-    """Run comprehensive pre-deployment validation for Streamlit apps."""
-    from validate_streamlit import main
-
-    main()
+_snowddl_cli = None
+
+
+def _cli():
+    """Return the snowtower_snowddl.cli module, importing it on first use."""
+    global _snowddl_cli
+    if _snowddl_cli is None:
+        _snowddl_cli = importlib.import_module("snowtower_snowddl.cli")
+    return _snowddl_cli
+
+
+# Script-backed commands: entry point name -> (scripts module, description).
+# Each runs the module's main(); see _script_command.
+_SCRIPT_COMMANDS = {
+    "warehouses": ("manage_warehouses", "Run warehouse management commands."),
+    "costs": ("cost_optimization", "Run cost optimization commands."),
+    "security": ("security_audit", "Run security audit commands."),
+    "backup": ("backup_restore", "Run backup and restore commands."),
+    "users": ("manage_users", "Run user management commands."),
+    "apply_schema_grants": (
+        "apply_schema_grants",
+        "Apply schema-level USAGE grants that SnowDDL cannot manage.",
+    ),
+    "validate_schema_grants": (
+        "validate_schema_grants",
+        "Validate schema grants consistency between tech_role.yaml and "
+        "apply_schema_grants.py.",
+    ),
+    "process_access_request": (
+        "generate_user_from_issue",
+        "Process GitHub issue access requests.",
+    ),
+    # === CONFIGURATION VALIDATION ===
+    "validate_config": (
+        "validate_config",
+        "Validate SnowDDL YAML configuration files before deployment.",
+    ),
+    # === STREAMLIT TESTING COMMANDS ===
+    "validate_streamlit": (
+        "validate_streamlit",
+        "Run comprehensive pre-deployment validation for Streamlit apps.",
+    ),
+    "user_create": (
+        "user_create",
+        "Unified user creation command (consolidated from multiple scripts).",
+    ),
+    # === MONITORING COMMANDS ===
+    "monitor_health": ("monitor_health", "Check system health and display status."),
+    "monitor_logs": ("monitor_logs", "View and filter structured logs."),
+    "monitor_audit": ("monitor_audit", "Query and display audit trail events."),
+    "monitor_metrics": (
+        "monitor_metrics",
+        "Display operational metrics and statistics.",
+    ),
+    # === AUTOMATION COMMANDS ===
+    "github_to_snowddl": (
+        "github_issue_to_snowddl",
+        "Automate GitHub issue to SnowDDL user deployment with PR creation.",
+    ),
+    "generate_terraform": (
+        "generate_terraform",
+        "Generate Terraform HCL files from SnowDDL YAML configurations.",
+    ),
+}
+
+
+def _script_command(name, module_name, doc):
+    """Build the entry point that imports a scripts module and runs its main()."""
+
+    def command():
+        importlib.import_module(module_name).main()
+
+    command.__name__ = command.__qualname__ = name
+    command.__doc__ = doc
+    return command
+
+
+for _name, (_module_name, _doc) in _SCRIPT_COMMANDS.items():
+    globals()[_name] = _script_command(_name, _module_name, _doc)
+del _name, _module_name, _doc
+
+
+# SnowDDL commands: entry point name -> (snowtower_snowddl.cli function,
+# description). Each calls that function; see _snowddl_command.
+_SNOWDDL_COMMANDS = {
+    "snowddl_plan": ("plan", "Run SnowDDL plan command."),
+    "snowddl_validate": ("validate_config", "Run SnowDDL validate command."),
+    "snowddl_apply": ("apply", "Run SnowDDL apply command."),
+    "snowddl_diff": ("diff", "Run SnowDDL diff command."),
+    "snowddl_lint": ("lint_config", "Run SnowDDL lint command."),
+    "update_user_password": ("update_user_password", "Update user password safely."),
+}
+
+
+def _snowddl_command(name, function_name, doc):
+    """Build the entry point that calls a snowtower_snowddl.cli function."""
+
+    def command():
+        getattr(_cli(), function_name)()
+
+    command.__name__ = command.__qualname__ = name
+    command.__doc__ = doc
+    return command
+
+
+for _name, (_function_name, _doc) in _SNOWDDL_COMMANDS.items():
+    globals()[_name] = _snowddl_command(_name, _function_name, _doc)
+del _name, _function_name, _doc
 
 
 # === REMOVED FUNCTIONS (Missing Implementations) ===
@@ -188,61 +137,6 @@ def validate_streamlit():
 # - detect_streamlit_errors() - missing scripts/common_streamlit_errors.py
 
 
-def user_create():
-    """Unified user creation command (consolidated from multiple scripts)."""
-    from user_create import main
-
-    main()
-
-
-# === MONITORING COMMANDS ===
-
-
-def monitor_health():
-    """Check system health and display status."""
-    from monitor_health import main
-
-    main()
-
-
-def monitor_logs():
-    """View and filter structured logs."""
-    from monitor_logs import main
-
-    main()
-
-
-def monitor_audit():
-    """Query and display audit trail events."""
-    from monitor_audit import main
-
-    main()
-
-
-def monitor_metrics():
-    """Display operational metrics and statistics."""
-    from monitor_metrics import main
-
-    main()
-
-
-# === AUTOMATION COMMANDS ===
-
-
-def github_to_snowddl():
-    """Automate GitHub issue to SnowDDL user deployment with PR creation."""
-    from github_issue_to_snowddl import main
-
-    main()
-
-
-def generate_terraform():
-    """Generate Terraform HCL files from SnowDDL YAML configurations."""
-    from generate_terraform import main
-
-    main()
-
-
 if __name__ == "__main__":
     print("Use 'uv run <command>' where command includes:")
     print("  Core: warehouses, costs, security, backup, users")
@@ -7,6 +7,8 @@ SnowDDL configurations programmatically.
 
 from pathlib import Path
 
+import yaml
+
 from snowddl_core import (
     SnowDDLProject,
     User,
@@ -15,36 +17,41 @@ from snowddl_core import (
     ResourceMonitor,
 )
 
+_BANNER = "=" * 60
+
+
+def _print_header(title: str, blank_line: bool = True) -> None:
+    """Print an example title between banner lines"""
+    print(f"\n{_BANNER}" if blank_line else _BANNER, title, _BANNER, sep="\n")
+
 
 def example_load_and_inspect():
     """Example: Load existing configuration and inspect objects"""
-    print("=" * 60)
-    print("Example 1: Load and Inspect Configuration")
-    print("=" * 60)
+    _print_header("Example 1: Load and Inspect Configuration", blank_line=False)
 
     # Load existing project
     project = SnowDDLProject("./snowddl")
     project.load_all()
 
-    print(f"\n{project}")
-    print(f"\nProject Summary: {project.summary()}")
+    print(f"\n{project}", f"\nProject Summary: {project.summary()}", sep="\n")
 
     # Get specific user
     user = project.get_user("ALICE")
     if user:
-        print(f"\nUser Details:")
-        print(f"  Name: {user.name}")
-        print(f"  Login: {user.login_name}")
-        print(f"  Type: {user.type}")
-        print(f"  Email: {user.email}")
-        print(f"  Business Roles: {user.business_roles}")
+        print(
+            "\nUser Details:",
+            f"  Name: {user.name}",
+            f"  Login: {user.login_name}",
+            f"  Type: {user.type}",
+            f"  Email: {user.email}",
+            f"  Business Roles: {user.business_roles}",
+            sep="\n",
+        )
 
 
 def example_create_user():
     """Example: Create a new user programmatically"""
-    print("\n" + "=" * 60)
-    print("Example 2: Create New User")
-    print("=" * 60)
+    _print_header("Example 2: Create New User")
 
     # Create a new service account user
     service_user = User(
@@ -57,18 +64,17 @@ def example_create_user():
         comment="Service account for data pipeline automation",
     )
 
-    print(f"\nCreated user: {service_user}")
-    print(f"\nUser YAML representation:")
-    import yaml
-
-    print(yaml.dump(service_user.to_yaml(), default_flow_style=False))
+    print(
+        f"\nCreated user: {service_user}",
+        "\nUser YAML representation:",
+        yaml.dump(service_user.to_yaml(), default_flow_style=False),
+        sep="\n",
+    )
 
 
 def example_create_warehouse():
     """Example: Create a new warehouse with specific settings"""
-    print("\n" + "=" * 60)
-    print("Example 3: Create Warehouse")
-    print("=" * 60)
+    _print_header("Example 3: Create Warehouse")
 
     # Create a multi-cluster warehouse for production workloads
     prod_warehouse = Warehouse(
@@ -85,21 +91,20 @@ def example_create_warehouse():
         comment="Production warehouse with auto-scaling",
     )
 
-    print(f"\nCreated warehouse: {prod_warehouse}")
-    print(f"\nWarehouse configuration:")
-    print(f"  Size: {prod_warehouse.size}")
     print(
-        f"  Multi-cluster: {prod_warehouse.min_cluster_count}-{prod_warehouse.max_cluster_count}"
+        f"\nCreated warehouse: {prod_warehouse}",
+        "\nWarehouse configuration:",
+        f"  Size: {prod_warehouse.size}",
+        f"  Multi-cluster: {prod_warehouse.min_cluster_count}-{prod_warehouse.max_cluster_count}",
+        f"  Auto-suspend: {prod_warehouse.auto_suspend}s",
+        f"  Query Acceleration: {prod_warehouse.enable_query_acceleration}",
+        sep="\n",
     )
-    print(f"  Auto-suspend: {prod_warehouse.auto_suspend}s")
-    print(f"  Query Acceleration: {prod_warehouse.enable_query_acceleration}")
 
 
 def example_create_business_role():
     """Example: Create a business role with permissions"""
-    print("\n" + "=" * 60)
-    print("Example 4: Create Business Role")
-    print("=" * 60)
+    _print_header("Example 4: Create Business Role")
 
     # Create a data analyst role
     analyst_role = BusinessRole(
@@ -114,18 +119,19 @@ def example_create_business_role():
     analyst_role.add_warehouse_usage("ADHOC_WH")
     analyst_role.grant_schema_access("ANALYTICS_DB.STAGING", "read")
 
-    print(f"\nCreated role: {analyst_role}")
-    print(f"\nRole permissions:")
-    print(f"  Read databases: {analyst_role.database_read}")
-    print(f"  Read schemas: {analyst_role.schema_read}")
-    print(f"  Warehouse usage: {analyst_role.warehouse_usage}")
+    print(
+        f"\nCreated role: {analyst_role}",
+        "\nRole permissions:",
+        f"  Read databases: {analyst_role.database_read}",
+        f"  Read schemas: {analyst_role.schema_read}",
+        f"  Warehouse usage: {analyst_role.warehouse_usage}",
+        sep="\n",
+    )
 
 
 def example_resource_monitor():
     """Example: Create a resource monitor for cost control"""
-    print("\n" + "=" * 60)
-    print("Example 5: Create Resource Monitor")
-    print("=" * 60)
+    _print_header("Example 5: Create Resource Monitor")
 
     # Create a monthly resource monitor
     monitor = ResourceMonitor(
@@ -137,18 +143,19 @@ def example_resource_monitor():
         comment="Monthly credit monitor for dev team warehouses",
     )
 
-    print(f"\nCreated resource monitor: {monitor}")
-    print(f"  Credit quota: {monitor.credit_quota}")
-    print(f"  Frequency: {monitor.frequency}")
-    print(f"  Notify at: {monitor.notify_at}%")
-    print(f"  Suspend at: {monitor.suspend_at}%")
+    print(
+        f"\nCreated resource monitor: {monitor}",
+        f"  Credit quota: {monitor.credit_quota}",
+        f"  Frequency: {monitor.frequency}",
+        f"  Notify at: {monitor.notify_at}%",
+        f"  Suspend at: {monitor.suspend_at}%",
+        sep="\n",
+    )
 
 
 def example_validation():
     """Example: Validate configuration"""
-    print("\n" + "=" * 60)
-    print("Example 6: Validate Configuration")
-    print("=" * 60)
+    _print_header("Example 6: Validate Configuration")
 
     # Create a user with validation issues
     invalid_user = User(
@@ -167,9 +174,7 @@ def example_validation():
 
 def example_save_configuration():
     """Example: Create and save a complete configuration"""
-    print("\n" + "=" * 60)
-    print("Example 7: Save Configuration (Dry Run)")
-    print("=" * 60)
+    _print_header("Example 7: Save Configuration (Dry Run)")
 
     # Create a new project
     project = SnowDDLProject("./test_config")
@@ -205,8 +210,7 @@ def example_save_configuration():
     )
     project.add_business_role(admin_role)
 
-    print(f"\nCreated project: {project}")
-    print(f"Summary: {project.summary()}")
+    print(f"\nCreated project: {project}", f"Summary: {project.summary()}", sep="\n")
 
     # In a real scenario, you would call:
     # project.save_all()
@@ -223,9 +227,7 @@ def main():
     example_validation()
     example_save_configuration()
 
-    print("\n" + "=" * 60)
-    print("Examples Complete!")
-    print("=" * 60)
+    _print_header("Examples Complete!")
 
 
 if __name__ == "__main__":
@@ -14,47 +14,102 @@ Key Features:
 - Dependency graph management
 """
 
-from snowddl_core.base import (
-    SnowDDLObject,
-    AccountLevelObject,
-    DatabaseLevelObject,
-    SchemaLevelObject,
-)
-from snowddl_core.mixins import (
-    PolicyReferenceMixin,
-    TableLikeMixin,
-    TransientMixin,
-    EncryptedFieldMixin,
-)
-from snowddl_core.snowddl_types import (
-    WarehouseSize,
-    UserType,
-    ObjectType,
-    ValidationSeverity,
-)
-from snowddl_core.exceptions import (
-    SnowDDLError,
-    DependencyError,
-    SerializationError,
-    EncryptionError,
-    CircularDependencyError,
-    ConfigurationError,
-    ObjectNotFoundError,
-)
-from snowddl_core.validation import (
-    Validator,
-    ValidationContext,
-    ValidationRule,
-    ValidationError,
-)
-from snowddl_core.account_objects import (
-    User,
-    BusinessRole,
-    TechnicalRole,
-    Warehouse,
-    ResourceMonitor,
-)
-from snowddl_core.project import SnowDDLProject
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from snowddl_core.base import (
+        SnowDDLObject,
+        AccountLevelObject,
+        DatabaseLevelObject,
+        SchemaLevelObject,
+    )
+    from snowddl_core.mixins import (
+        PolicyReferenceMixin,
+        TableLikeMixin,
+        TransientMixin,
+        EncryptedFieldMixin,
+    )
+    from snowddl_core.snowddl_types import (
+        WarehouseSize,
+        UserType,
+        ObjectType,
+        ValidationSeverity,
+    )
+    from snowddl_core.exceptions import (
+        SnowDDLError,
+        DependencyError,
+        SerializationError,
+        EncryptionError,
+        CircularDependencyError,
+        ConfigurationError,
+        ObjectNotFoundError,
+    )
+    from snowddl_core.validation import (
+        Validator,
+        ValidationContext,
+        ValidationRule,
+        ValidationError,
+    )
+    from snowddl_core.account_objects import (
+        User,
+        BusinessRole,
+        TechnicalRole,
+        Warehouse,
+        ResourceMonitor,
+    )
+    from snowddl_core.project import SnowDDLProject
+
+# Public names and the submodule each lives in. They are imported on first
+# access (PEP 562) so that importing the package stays cheap for CLI commands
+# that only need one of them.
+_LAZY_IMPORTS = {
+    name: f"snowddl_core.{module}"
+    for module, names in {
+        "base": (
+            "SnowDDLObject",
+            "AccountLevelObject",
+            "DatabaseLevelObject",
+            "SchemaLevelObject",
+        ),
+        "mixins": (
+            "PolicyReferenceMixin",
+            "TableLikeMixin",
+            "TransientMixin",
+            "EncryptedFieldMixin",
+        ),
+        "snowddl_types": (
+            "WarehouseSize",
+            "UserType",
+            "ObjectType",
+            "ValidationSeverity",
+        ),
+        "exceptions": (
+            "SnowDDLError",
+            "DependencyError",
+            "SerializationError",
+            "EncryptionError",
+            "CircularDependencyError",
+            "ConfigurationError",
+            "ObjectNotFoundError",
+        ),
+        "validation": (
+            "Validator",
+            "ValidationContext",
+            "ValidationRule",
+            "ValidationError",
+        ),
+        "account_objects": (
+            "User",
+            "BusinessRole",
+            "TechnicalRole",
+            "Warehouse",
+            "ResourceMonitor",
+        ),
+        "project": ("SnowDDLProject",),
+    }.items()
+    for name in names
+}
 
 __version__ = "1.0.0"
 
@@ -96,3 +151,18 @@ __all__ = [
     # Project Management
     "SnowDDLProject",
 ]
+
+
+def __getattr__(name: str):
+    """Import a public name from its submodule on first access."""
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
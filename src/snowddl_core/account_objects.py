@@ -5,6 +5,7 @@ This module provides concrete implementations for account-level Snowflake object
 including Users, Roles, Warehouses, and Resource Monitors.
 """
 
+from itertools import chain
 from typing import Any, ClassVar, Optional
 
 from snowddl_core.base import AccountLevelObject
@@ -42,8 +43,54 @@ class User(PolicyReferenceMixin, EncryptedFieldMixin, AccountLevelObject):
         session_params: Session parameters
     """
 
+    # Mixin fields live here since mixins declare empty slots
+    __slots__ = (
+        "authentication_policy",
+        "network_policy",
+        "password",
+        "login_name",
+        "type",
+        "display_name",
+        "first_name",
+        "last_name",
+        "email",
+        "disabled",
+        "rsa_public_key",
+        "rsa_public_key_2",
+        "business_roles",
+        "default_warehouse",
+        "default_namespace",
+        "session_params",
+    )
+
     object_type: ClassVar[str] = "user"
 
+    _YAML_FIELDS: ClassVar[tuple[tuple[str, Any], ...]] = (
+        # Basic identity
+        ("type", "PERSON"),
+        ("first_name", None),
+        ("last_name", None),
+        ("login_name", None),
+        ("display_name", None),
+        ("comment", None),
+        ("email", None),
+        # Authentication
+        ("rsa_public_key", None),
+        ("rsa_public_key_2", None),
+        ("password", None),
+        # Authorization
+        ("business_roles", None),
+        ("default_warehouse", None),
+        ("default_namespace", None),
+        # Policies
+        ("authentication_policy", None),
+        ("network_policy", None),
+        # State
+        ("disabled", None),
+        # Session
+        ("session_params", None),
+    )
+
     def __init__(
         self,
         name: str,
@@ -134,58 +181,6 @@ class User(PolicyReferenceMixin, EncryptedFieldMixin, AccountLevelObject):
         if role_name in self.business_roles:
             self.business_roles.remove(role_name)
 
-    def to_yaml(self) -> dict[str, Any]:
-        """Convert to YAML format"""
-        data: dict[str, Any] = {}
-
-        # Basic identity
-        if self.type != "PERSON":
-            data["type"] = self.type
-        if self.first_name:
-            data["first_name"] = self.first_name
-        if self.last_name:
-            data["last_name"] = self.last_name
-        if self.login_name:
-            data["login_name"] = self.login_name
-        if self.display_name:
-            data["display_name"] = self.display_name
-        if self.comment:
-            data["comment"] = self.comment
-        if self.email:
-            data["email"] = self.email
-
-        # Authentication
-        if self.rsa_public_key:
-            data["rsa_public_key"] = self.rsa_public_key
-        if self.rsa_public_key_2:
-            data["rsa_public_key_2"] = self.rsa_public_key_2
-        if self.password:
-            data["password"] = self.password
-
-        # Authorization
-        if self.business_roles:
-            data["business_roles"] = self.business_roles
-        if self.default_warehouse:
-            data["default_warehouse"] = self.default_warehouse
-        if self.default_namespace:
-            data["default_namespace"] = self.default_namespace
-
-        # Policies
-        if self.authentication_policy:
-            data["authentication_policy"] = self.authentication_policy
-        if self.network_policy:
-            data["network_policy"] = self.network_policy
-
-        # State
-        if self.disabled:
-            data["disabled"] = self.disabled
-
-        # Session
-        if self.session_params:
-            data["session_params"] = self.session_params
-
-        return data
-
     @classmethod
     def from_yaml(cls, name: str, data: dict[str, Any]) -> "User":
         """Create User from YAML data"""
@@ -230,8 +225,7 @@ class User(PolicyReferenceMixin, EncryptedFieldMixin, AccountLevelObject):
                         f"User {self.name}: PERSON type requires authentication"
                     )
                 )
-
-        if self.type == "SERVICE":
+        elif self.type == "SERVICE":
             if not self.rsa_public_key:
                 errors.append(
                     ValidationError(
@@ -247,11 +241,10 @@ class User(PolicyReferenceMixin, EncryptedFieldMixin, AccountLevelObject):
 
     def get_dependencies(self) -> list[DependencyTuple]:
         """Get user dependencies"""
-        deps: list[DependencyTuple] = []
-
         # Role dependencies
-        for role in self.business_roles:
-            deps.append(("business_role", role))
+        deps: list[DependencyTuple] = [
+            ("business_role", role) for role in self.business_roles
+        ]
 
         # Warehouse dependency
         if self.default_warehouse:
@@ -283,8 +276,37 @@ class BusinessRole(AccountLevelObject):
         global_roles: Global Snowflake roles
     """
 
+    __slots__ = (
+        "database_owner",
+        "database_write",
+        "database_read",
+        "schema_owner",
+        "schema_write",
+        "schema_read",
+        "share_read",
+        "warehouse_usage",
+        "warehouse_monitor",
+        "tech_roles",
+        "global_roles",
+    )
+
     object_type: ClassVar[str] = "business_role"
 
+    _YAML_FIELDS: ClassVar[tuple[tuple[str, Any], ...]] = (
+        ("database_owner", None),
+        ("database_write", None),
+        ("database_read", None),
+        ("schema_owner", None),
+        ("schema_write", None),
+        ("schema_read", None),
+        ("share_read", None),
+        ("warehouse_usage", None),
+        ("warehouse_monitor", None),
+        ("tech_roles", None),
+        ("global_roles", None),
+        ("comment", None),
+    )
+
     def __init__(
         self,
         name: str,
@@ -360,37 +382,6 @@ class BusinessRole(AccountLevelObject):
         if role not in self.tech_roles:
             self.tech_roles.append(role)
 
-    def to_yaml(self) -> dict[str, Any]:
-        """Convert to YAML format"""
-        data: dict[str, Any] = {}
-
-        if self.database_owner:
-            data["database_owner"] = self.database_owner
-        if self.database_write:
-            data["database_write"] = self.database_write
-        if self.database_read:
-            data["database_read"] = self.database_read
-        if self.schema_owner:
-            data["schema_owner"] = self.schema_owner
-        if self.schema_write:
-            data["schema_write"] = self.schema_write
-        if self.schema_read:
-            data["schema_read"] = self.schema_read
-        if self.share_read:
-            data["share_read"] = self.share_read
-        if self.warehouse_usage:
-            data["warehouse_usage"] = self.warehouse_usage
-        if self.warehouse_monitor:
-            data["warehouse_monitor"] = self.warehouse_monitor
-        if self.tech_roles:
-            data["tech_roles"] = self.tech_roles
-        if self.global_roles:
-            data["global_roles"] = self.global_roles
-        if self.comment:
-            data["comment"] = self.comment
-
-        return data
-
     @classmethod
     def from_yaml(cls, name: str, data: dict[str, Any]) -> "BusinessRole":
         """Create BusinessRole from YAML"""
@@ -415,7 +406,7 @@ class BusinessRole(AccountLevelObject):
         errors: list[ValidationError] = []
 
         # Validate schema FQN format
-        for schema in self.schema_owner + self.schema_write + self.schema_read:
+        for schema in chain(self.schema_owner, self.schema_write, self.schema_read):
             if "." not in schema:
                 errors.append(
                     ValidationError(
@@ -428,19 +419,22 @@ class BusinessRole(AccountLevelObject):
 
     def get_dependencies(self) -> list[DependencyTuple]:
         """Get business role dependencies"""
-        deps: list[DependencyTuple] = []
-
         # Database dependencies
-        for db in self.database_owner + self.database_write + self.database_read:
-            deps.append(("database", db))
+        deps: list[DependencyTuple] = [
+            ("database", db)
+            for db in chain(
+                self.database_owner, self.database_write, self.database_read
+            )
+        ]
 
         # Warehouse dependencies
-        for wh in self.warehouse_usage + self.warehouse_monitor:
-            deps.append(("warehouse", wh))
+        deps.extend(
+            ("warehouse", wh)
+            for wh in chain(self.warehouse_usage, self.warehouse_monitor)
+        )
 
         # Technical role dependencies
-        for role in self.tech_roles:
-            deps.append(("tech_role", role))
+        deps.extend(("tech_role", role) for role in self.tech_roles)
 
         return deps
 
@@ -453,14 +447,9 @@ class TechnicalRole(AccountLevelObject):
         comment: Role description
     """
 
-    object_type: ClassVar[str] = "tech_role"
+    __slots__ = ()
 
-    def to_yaml(self) -> dict[str, Any]:
-        """Convert to YAML format"""
-        data: dict[str, Any] = {}
-        if self.comment:
-            data["comment"] = self.comment
-        return data
+    object_type: ClassVar[str] = "tech_role"
 
     @classmethod
     def from_yaml(cls, name: str, data: dict[str, Any]) -> "TechnicalRole":
@@ -494,8 +483,39 @@ class Warehouse(AccountLevelObject):
         warehouse_params: Additional warehouse parameters
     """
 
+    __slots__ = (
+        "size",
+        "type",
+        "min_cluster_count",
+        "max_cluster_count",
+        "scaling_policy",
+        "auto_suspend",
+        "resource_monitor",
+        "global_resource_monitor",
+        "enable_query_acceleration",
+        "query_acceleration_max_scale_factor",
+        "resource_constraint",
+        "warehouse_params",
+    )
+
     object_type: ClassVar[str] = "warehouse"
 
+    _YAML_FIELDS: ClassVar[tuple[tuple[str, Any], ...]] = (
+        ("size", "X-Small"),
+        ("type", "STANDARD"),
+        ("auto_suspend", 60),
+        ("min_cluster_count", 1),
+        ("max_cluster_count", 1),
+        ("scaling_policy", "STANDARD"),
+        ("resource_monitor", None),
+        ("global_resource_monitor", None),
+        ("enable_query_acceleration", None),
+        ("query_acceleration_max_scale_factor", 8),
+        ("resource_constraint", None),
+        ("warehouse_params", None),
+        ("comment", None),
+    )
+
     def __init__(
         self,
         name: str,
@@ -560,41 +580,6 @@ class Warehouse(AccountLevelObject):
         self.max_cluster_count = max_count
         self.scaling_policy = policy
 
-    def to_yaml(self) -> dict[str, Any]:
-        """Convert to YAML format"""
-        data: dict[str, Any] = {}
-
-        if self.size != "X-Small":
-            data["size"] = self.size
-        if self.type != "STANDARD":
-            data["type"] = self.type
-        if self.auto_suspend != 60:
-            data["auto_suspend"] = self.auto_suspend
-        if self.min_cluster_count != 1:
-            data["min_cluster_count"] = self.min_cluster_count
-        if self.max_cluster_count != 1:
-            data["max_cluster_count"] = self.max_cluster_count
-        if self.scaling_policy != "STANDARD":
-            data["scaling_policy"] = self.scaling_policy
-        if self.resource_monitor:
-            data["resource_monitor"] = self.resource_monitor
-        if self.global_resource_monitor:
-            data["global_resource_monitor"] = self.global_resource_monitor
-        if self.enable_query_acceleration:
-            data["enable_query_acceleration"] = self.enable_query_acceleration
-        if self.query_acceleration_max_scale_factor != 8:
-            data["query_acceleration_max_scale_factor"] = (
-                self.query_acceleration_max_scale_factor
-            )
-        if self.resource_constraint:
-            data["resource_constraint"] = self.resource_constraint
-        if self.warehouse_params:
-            data["warehouse_params"] = self.warehouse_params
-        if self.comment:
-            data["comment"] = self.comment
-
-        return data
-
     @classmethod
     def from_yaml(cls, name: str, data: dict[str, Any]) -> "Warehouse":
         """Create Warehouse from YAML"""
@@ -657,8 +642,29 @@ class ResourceMonitor(AccountLevelObject):
         suspend_immediately_at: Immediate suspend threshold percentage
     """
 
+    __slots__ = (
+        "credit_quota",
+        "frequency",
+        "start_timestamp",
+        "end_timestamp",
+        "notify_at",
+        "suspend_at",
+        "suspend_immediately_at",
+    )
+
     object_type: ClassVar[str] = "resource_monitor"
 
+    _YAML_FIELDS: ClassVar[tuple[tuple[str, Any], ...]] = (
+        ("credit_quota", None),
+        ("frequency", "MONTHLY"),
+        ("start_timestamp", None),
+        ("end_timestamp", None),
+        ("notify_at", None),
+        ("suspend_at", None),
+        ("suspend_immediately_at", None),
+        ("comment", None),
+    )
+
     def __init__(
         self,
         name: str,
@@ -694,29 +700,6 @@ class ResourceMonitor(AccountLevelObject):
         self.suspend_at = suspend_at
         self.suspend_immediately_at = suspend_immediately_at
 
-    def to_yaml(self) -> dict[str, Any]:
-        """Convert to YAML format"""
-        data: dict[str, Any] = {}
-
-        if self.credit_quota:
-            data["credit_quota"] = self.credit_quota
-        if self.frequency != "MONTHLY":
-            data["frequency"] = self.frequency
-        if self.start_timestamp:
-            data["start_timestamp"] = self.start_timestamp
-        if self.end_timestamp:
-            data["end_timestamp"] = self.end_timestamp
-        if self.notify_at:
-            data["notify_at"] = self.notify_at
-        if self.suspend_at:
-            data["suspend_at"] = self.suspend_at
-        if self.suspend_immediately_at:
-            data["suspend_immediately_at"] = self.suspend_immediately_at
-        if self.comment:
-            data["comment"] = self.comment
-
-        return data
-
     @classmethod
     def from_yaml(cls, name: str, data: dict[str, Any]) -> "ResourceMonitor":
         """Create ResourceMonitor from YAML"""
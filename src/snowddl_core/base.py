@@ -13,6 +13,31 @@ from typing import Any, ClassVar, Optional
 from snowddl_core.snowddl_types import DependencyTuple, FQN, ObjectType
 
 
+def _compile_to_yaml(fields: tuple[tuple[str, Any], ...]) -> Any:
+    """
+    Build a to_yaml function with one attribute check per field.
+
+    Args:
+        fields: (field, default) pairs as in AccountLevelObject._YAML_FIELDS
+
+    Returns:
+        Function equivalent to AccountLevelObject.to_yaml for these fields
+    """
+    lines = ["def to_yaml(self):", "    data = {}"]
+    namespace: dict[str, Any] = {}
+    for i, (field, default) in enumerate(fields):
+        lines.append(f"    value = self.{field}")
+        if default is None:
+            lines.append("    if value:")
+        else:
+            namespace[f"default_{i}"] = default
+            lines.append(f"    if value != default_{i}:")
+        lines.append(f"        data[{field!r}] = value")
+    lines.append("    return data")
+    exec(compile("\n".join(lines), "<to_yaml>", "exec"), namespace)
+    return namespace["to_yaml"]
+
+
 class SnowDDLObject(ABC):
     """
     Abstract base class for all SnowDDL configuration objects.
@@ -26,6 +51,9 @@ class SnowDDLObject(ABC):
         object_type: Class variable defining the object type (overridden in subclasses)
     """
 
+    # Fixed attribute layout; subclasses declare their own fields
+    __slots__ = ("name", "comment")
+
     # Class variable defining the object type (overridden in subclasses)
     object_type: ClassVar[str] = "snowddl_object"
 
@@ -140,6 +168,34 @@ class AccountLevelObject(SnowDDLObject, ABC):
         - Resource Monitors
     """
 
+    __slots__ = ()
+
+    # YAML fields in output order, each with the default value that is left
+    # out of the output (None: written only when truthy). Subclasses override it.
+    _YAML_FIELDS: ClassVar[tuple[tuple[str, Any], ...]] = (("comment", None),)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "to_yaml" not in cls.__dict__:
+            to_yaml = _compile_to_yaml(cls._YAML_FIELDS)
+            to_yaml.__doc__ = AccountLevelObject.to_yaml.__doc__
+            to_yaml.__qualname__ = f"{cls.__qualname__}.to_yaml"
+            cls.to_yaml = to_yaml
+
+    def to_yaml(self) -> dict[str, Any]:
+        """
+        Convert to YAML format, skipping empty and default-valued fields.
+
+        Returns:
+            Dictionary of the fields listed in _YAML_FIELDS
+        """
+        data: dict[str, Any] = {}
+        for field, default in self._YAML_FIELDS:
+            value = getattr(self, field)
+            if (value != default) if default is not None else value:
+                data[field] = value
+        return data
+
     def get_file_path(self, config_dir: Path) -> Path:
         """
         Account-level objects are stored as <object_type>.yaml
@@ -170,6 +226,8 @@ class DatabaseLevelObject(SnowDDLObject, ABC):
         database: Name of the database this object belongs to
     """
 
+    __slots__ = ("database",)
+
     def __init__(self, name: str, database: str = "", comment: Optional[str] = None):
         """
         Initialize a database-level object.
@@ -214,6 +272,8 @@ class SchemaLevelObject(DatabaseLevelObject, ABC):
         database: Name of the database (inherited from DatabaseLevelObject)
     """
 
+    __slots__ = ("schema",)
+
     def __init__(
         self,
         name: str,
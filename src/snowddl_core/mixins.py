@@ -25,6 +25,8 @@ class PolicyReferenceMixin:
         network_policy: Name of network policy
     """
 
+    __slots__ = ()
+
     def _get_policy_dependencies(self) -> list[DependencyTuple]:
         """Get dependencies on policies"""
         deps: list[DependencyTuple] = []
@@ -48,6 +50,8 @@ class TableLikeMixin:
         projection_policies: Column-level projection policies {column: policy}
     """
 
+    __slots__ = ()
+
     def apply_masking_policy(self, column: str, policy: str) -> None:
         """
         Apply masking policy to a column
@@ -98,6 +102,8 @@ class TransientMixin:
         retention_time: Time-travel retention period in days (0-90)
     """
 
+    __slots__ = ()
+
     def set_retention(self, days: int) -> None:
         """
         Set time-travel retention period
@@ -123,6 +129,8 @@ class EncryptedFieldMixin:
         password: Encrypted password (stored with !decrypt tag)
     """
 
+    __slots__ = ()
+
     def set_password(self, password: str, fernet_key: Optional[str] = None) -> None:
         """
         Set encrypted password using Fernet encryption.
@@ -26,8 +26,15 @@ def decrypt_constructor(loader, node):
     return f"!decrypt {loader.construct_scalar(node)}"
 
 
+# Parse with libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 # Register the !decrypt constructor for safe YAML loading
 yaml.SafeLoader.add_constructor("!decrypt", decrypt_constructor)
+_SafeLoader.add_constructor("!decrypt", decrypt_constructor)
 
 
 class SnowDDLProject:
@@ -79,7 +86,7 @@ class SnowDDLProject:
             return
 
         with open(user_file, "r") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_SafeLoader) or {}
 
         for name, user_data in data.items():
             if isinstance(user_data, dict):
@@ -92,7 +99,7 @@ class SnowDDLProject:
             return
 
         with open(warehouse_file, "r") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_SafeLoader) or {}
 
         for name, warehouse_data in data.items():
             if isinstance(warehouse_data, dict):
@@ -105,7 +112,7 @@ class SnowDDLProject:
             return
 
         with open(role_file, "r") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_SafeLoader) or {}
 
         for name, role_data in data.items():
             if isinstance(role_data, dict):
@@ -118,7 +125,7 @@ class SnowDDLProject:
             return
 
         with open(role_file, "r") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_SafeLoader) or {}
 
         for name, role_data in data.items():
             if isinstance(role_data, dict):
@@ -131,7 +138,7 @@ class SnowDDLProject:
             return
 
         with open(rm_file, "r") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_SafeLoader) or {}
 
         for name, rm_data in data.items():
             if isinstance(rm_data, dict):
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Environment Variable Loader
+
+Tests the env_loader module including:
+- .env discovery from the working directory and project root
+- Per-directory caching of the discovered path
+- Memoized .env loading and authentication checks
+"""
+
+import os
+import pytest
+from pathlib import Path
+
+# Add src to path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import env_loader
+from env_loader import find_env_file, load_env_file, validate_auth_config
+
+
+@pytest.fixture(autouse=True)
+def clear_env_cache():
+    """Reset module-level caches between tests"""
+    env_loader._ENV_PATH_CACHE.clear()
+    env_loader._ENV_LOAD_CACHE.clear()
+    env_loader._masked_view.cache_clear()
+    yield
+    env_loader._ENV_PATH_CACHE.clear()
+    env_loader._ENV_LOAD_CACHE.clear()
+
+
+class TestFindEnvFile:
+    """Test .env file discovery"""
+
+    def test_finds_env_in_current_directory(self, tmp_path, monkeypatch):
+        """A .env in the working directory is returned directly"""
+        (tmp_path / ".env").write_text("SNOWFLAKE_ACCOUNT=test\n")
+        monkeypatch.chdir(tmp_path)
+
+        assert find_env_file() == tmp_path / ".env"
+
+    def test_finds_env_at_project_root(self, tmp_path, monkeypatch):
+        """A .env next to a project indicator is found from a subdirectory"""
+        (tmp_path / ".env").write_text("SNOWFLAKE_ACCOUNT=test\n")
+        (tmp_path / "pyproject.toml").write_text("")
+        subdir = tmp_path / "src" / "pkg"
+        subdir.mkdir(parents=True)
+        monkeypatch.chdir(subdir)
+
+        assert find_env_file() == tmp_path / ".env"
+
+    def test_ignores_env_without_project_indicator(self, tmp_path, monkeypatch):
+        """An ancestor .env without a project indicator is not used"""
+        (tmp_path / ".env").write_text("SNOWFLAKE_ACCOUNT=test\n")
+        subdir = tmp_path / "nested"
+        subdir.mkdir()
+        monkeypatch.chdir(subdir)
+        monkeypatch.delenv("SNOWTOWER_ENV_PATH", raising=False)
+
+        assert find_env_file() is None
+
+    def test_env_override(self, tmp_path, monkeypatch):
+        """SNOWTOWER_ENV_PATH is used when no project .env exists"""
+        override = tmp_path / "custom.env"
+        override.write_text("SNOWFLAKE_ACCOUNT=test\n")
+        workdir = tmp_path / "work"
+        workdir.mkdir()
+        monkeypatch.chdir(workdir)
+        monkeypatch.setenv("SNOWTOWER_ENV_PATH", str(override))
+
+        assert find_env_file() == override
+
+    def test_result_is_cached_per_directory(self, tmp_path, monkeypatch):
+        """Repeat lookups from the same directory reuse the cached path"""
+        (tmp_path / ".env").write_text("SNOWFLAKE_ACCOUNT=test\n")
+        monkeypatch.chdir(tmp_path)
+
+        first = find_env_file()
+        assert env_loader._ENV_PATH_CACHE
+
+        monkeypatch.setattr(
+            env_loader,
+            "_find_project_env_file",
+            lambda current_dir: pytest.fail("cache was not used"),
+        )
+        assert find_env_file() == first
+
+    def test_stale_cache_entry_is_ignored(self, tmp_path, monkeypatch):
+        """A cached .env that has since been removed triggers a fresh lookup"""
+        env_file = tmp_path / ".env"
+        env_file.write_text("SNOWFLAKE_ACCOUNT=test\n")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("SNOWTOWER_ENV_PATH", raising=False)
+
+        assert find_env_file() == env_file
+        env_file.unlink()
+
+        assert find_env_file() is None
+
+
+class TestLoadEnvFile:
+    """Test memoized .env loading"""
+
+    def test_unchanged_file_is_loaded_once(self, tmp_path, monkeypatch):
+        """A second load of an unmodified .env skips load_dotenv"""
+        env_file = tmp_path / ".env"
+        env_file.write_text("SNOWTOWER_TEST_VAR=first\n")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("SNOWTOWER_TEST_VAR", "unset")
+
+        calls = []
+        real_load_dotenv = env_loader.load_dotenv
+
+        def counting_load_dotenv(*args, **kwargs):
+            calls.append(args)
+            return real_load_dotenv(*args, **kwargs)
+
+        monkeypatch.setattr(env_loader, "load_dotenv", counting_load_dotenv)
+
+        assert load_env_file() is True
+        assert load_env_file() is True
+        assert len(calls) == 1
+        assert os.environ["SNOWTOWER_TEST_VAR"] == "first"
+
+    def test_modified_file_is_reloaded(self, tmp_path, monkeypatch):
+        """Changing the .env mtime invalidates the cached load"""
+        env_file = tmp_path / ".env"
+        env_file.write_text("SNOWTOWER_TEST_VAR=first\n")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("SNOWTOWER_TEST_VAR", "unset")
+
+        load_env_file()
+        env_file.write_text("SNOWTOWER_TEST_VAR=second\n")
+        stat = env_file.stat()
+        os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        load_env_file()
+
+        assert os.environ["SNOWTOWER_TEST_VAR"] == "second"
+
+
+class TestValidateAuthConfig:
+    """Test authentication method validation"""
+
+    def test_rsa_key_preferred(self, tmp_path, monkeypatch):
+        """RSA key is recommended when both methods are configured"""
+        key_file = tmp_path / "key.p8"
+        key_file.write_text("key")
+        monkeypatch.setenv("SNOWFLAKE_PRIVATE_KEY_PATH", str(key_file))
+        monkeypatch.setenv("SNOWFLAKE_PASSWORD", "secret")
+
+        assert validate_auth_config() == (True, ["RSA_KEY", "PASSWORD"], "RSA_KEY")
+
+    def test_no_methods(self, monkeypatch):
+        """No configured credentials is invalid"""
+        monkeypatch.delenv("SNOWFLAKE_PRIVATE_KEY_PATH", raising=False)
+        monkeypatch.delenv("SNOWFLAKE_PASSWORD", raising=False)
+
+        assert validate_auth_config() == (False, [], "NONE")
+
+    def test_result_tracks_credential_changes(self, monkeypatch):
+        """The memoized check is keyed on the configured credentials"""
+        monkeypatch.delenv("SNOWFLAKE_PRIVATE_KEY_PATH", raising=False)
+        monkeypatch.delenv("SNOWFLAKE_PASSWORD", raising=False)
+        assert validate_auth_config()[0] is False
+
+        monkeypatch.setenv("SNOWFLAKE_PASSWORD", "secret")
+        assert validate_auth_config() == (True, ["PASSWORD"], "PASSWORD")
+
+    def test_returned_list_is_not_shared(self, monkeypatch):
+        """Callers can mutate the returned method list safely"""
+        monkeypatch.delenv("SNOWFLAKE_PRIVATE_KEY_PATH", raising=False)
+        monkeypatch.setenv("SNOWFLAKE_PASSWORD", "secret")
+
+        validate_auth_config()[1].append("BOGUS")
+        assert validate_auth_config()[1] == ["PASSWORD"]
+
+    def test_key_path_directory_is_not_a_key(self, tmp_path, monkeypatch):
+        """A key path pointing at a directory does not count as RSA auth"""
+        monkeypatch.setenv("SNOWFLAKE_PRIVATE_KEY_PATH", str(tmp_path))
+        monkeypatch.delenv("SNOWFLAKE_PASSWORD", raising=False)
+
+        assert validate_auth_config() == (False, [], "NONE")
+
+    def test_key_file_created_later_is_found(self, tmp_path, monkeypatch):
+        """A key generated after the first check is seen by the next one"""
+        key_file = tmp_path / "rsa_key.p8"
+        monkeypatch.setenv("SNOWFLAKE_PRIVATE_KEY_PATH", str(key_file))
+        monkeypatch.delenv("SNOWFLAKE_PASSWORD", raising=False)
+        assert validate_auth_config() == (False, [], "NONE")
+
+        key_file.write_text("key")
+
+        assert validate_auth_config() == (True, ["RSA_KEY"], "RSA_KEY")
+
+    def test_missing_key_warns_on_every_call(self, tmp_path, monkeypatch, caplog):
+        """Each validation logs the missing key file"""
+        key_file = tmp_path / "rsa_key.p8"
+        monkeypatch.setenv("SNOWFLAKE_PRIVATE_KEY_PATH", str(key_file))
+        monkeypatch.delenv("SNOWFLAKE_PASSWORD", raising=False)
+
+        with caplog.at_level("WARNING", logger=env_loader.logger.name):
+            validate_auth_config()
+            validate_auth_config()
+
+        assert caplog.text.count("file not found") == 2
+
+
+class TestRequiredVars:
+    """Test required variable validation"""
+
+    def test_missing_required_returns_first_missing(self, monkeypatch):
+        """The short-circuit check reports the first missing variable"""
+        for var in env_loader.REQUIRED_VARS:
+            monkeypatch.setenv(var, "value")
+        monkeypatch.setenv("SNOWFLAKE_ROLE", "  ")
+        monkeypatch.delenv("SNOWFLAKE_WAREHOUSE")
+
+        assert env_loader._missing_required() == "SNOWFLAKE_ROLE"
+
+    def test_missing_required_none_when_complete(self, monkeypatch):
+        """All required variables present yields None"""
+        for var in env_loader.REQUIRED_VARS:
+            monkeypatch.setenv(var, "value")
+
+        assert env_loader._missing_required() is None
+
+    def test_validate_required_vars_reports_all(self, monkeypatch):
+        """The detailed report still lists every missing variable"""
+        for var in env_loader.REQUIRED_VARS:
+            monkeypatch.setenv(var, "value")
+        monkeypatch.delenv("SNOWFLAKE_ROLE")
+        monkeypatch.delenv("SNOWFLAKE_WAREHOUSE")
+
+        present, missing = env_loader.validate_required_vars()
+        assert missing == ["SNOWFLAKE_ROLE", "SNOWFLAKE_WAREHOUSE"]
+        assert len(present) == len(env_loader.REQUIRED_VARS) - 2
+
+
+class TestGetConnectionInfo:
+    """Test masked connection info"""
+
+    def test_sensitive_values_masked(self, monkeypatch):
+        """Password/key/secret variables are masked, others shown as-is"""
+        monkeypatch.setattr(
+            env_loader,
+            "load_snowflake_env",
+            lambda: {
+                "SNOWFLAKE_ACCOUNT": "acct",
+                "SNOWFLAKE_PASSWORD": "supersecretpassword",
+                "SNOWFLAKE_PRIVATE_KEY_PATH": "/k.p8",
+                "SNOWFLAKE_CONFIG_FERNET_KEYS": "",
+                "SNOWFLAKE_DATABASE": "",
+            },
+        )
+
+        info = env_loader.get_connection_info()
+        assert info["SNOWFLAKE_ACCOUNT"] == "acct"
+        assert info["SNOWFLAKE_PASSWORD"] == "********"
+        assert info["SNOWFLAKE_PRIVATE_KEY_PATH"] == "*****"
+        assert info["SNOWFLAKE_CONFIG_FERNET_KEYS"] == "Not set"
+        assert info["SNOWFLAKE_DATABASE"] == "Not set"
+
+    def test_preloaded_env_skips_reload(self, monkeypatch):
+        """Passing env_vars avoids another load_snowflake_env() run"""
+        monkeypatch.setattr(
+            env_loader,
+            "load_snowflake_env",
+            lambda: pytest.fail("environment was reloaded"),
+        )
+
+        info = env_loader.get_connection_info({"SNOWFLAKE_USER": "me"})
+        assert info == {"SNOWFLAKE_USER": "me"}
+
+    def test_masked_view_is_reused(self):
+        """Repeat calls with the same environment hit the cache"""
+        env_vars = {"SNOWFLAKE_USER": "me", "SNOWFLAKE_PASSWORD": "pw"}
+
+        first = env_loader.get_connection_info(env_vars)
+        first["SNOWFLAKE_USER"] = "mutated"
+        second = env_loader.get_connection_info(dict(env_vars))
+
+        assert second == {"SNOWFLAKE_USER": "me", "SNOWFLAKE_PASSWORD": "**"}
+        assert env_loader._masked_view.cache_info().hits == 1
+
+
+class TestLoadSnowflakeEnv:
+    """Test the full environment load"""
+
+    def test_collects_required_and_present_optional(self, tmp_path, monkeypatch):
+        """Required vars are always returned; optional only when set"""
+        (tmp_path / ".env").write_text("")
+        monkeypatch.chdir(tmp_path)
+        for var in env_loader.REQUIRED_VARS:
+            monkeypatch.setenv(var, f"{var.lower()}_value")
+        for var in env_loader.OPTIONAL_VARS:
+            monkeypatch.delenv(var, raising=False)
+        monkeypatch.setenv("SNOWFLAKE_DATABASE", "")
+
+        env_vars = env_loader.load_snowflake_env(validate_auth=False)
+
+        assert set(env_vars) == set(env_loader.REQUIRED_VARS) | {"SNOWFLAKE_DATABASE"}
+        assert env_vars["SNOWFLAKE_ACCOUNT"] == "snowflake_account_value"
+        assert env_vars["SNOWFLAKE_DATABASE"] == ""
+
+    def test_missing_required_raises(self, tmp_path, monkeypatch):
+        """A missing required variable raises with the full report"""
+        (tmp_path / ".env").write_text("")
+        monkeypatch.chdir(tmp_path)
+        for var in env_loader.REQUIRED_VARS:
+            monkeypatch.setenv(var, "value")
+        monkeypatch.delenv("SNOWFLAKE_USER")
+
+        with pytest.raises(env_loader.SnowEnvError, match="SNOWFLAKE_USER"):
+            env_loader.load_snowflake_env(validate_auth=False)
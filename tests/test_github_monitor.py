@@ -0,0 +1,782 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the GitHub PR Monitor
+
+Tests the github_monitor module including:
+- Parsing pending requests returned by the Snowflake procedures
+- Batched request claiming in GitHubMonitor.run_once
+- Snowflake connection reuse across monitor cycles
+- GitHubClient request handling
+"""
+
+import importlib.util
+import json
+import os
+import pytest
+import requests
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock
+
+MONITOR_PATH = (
+    Path(__file__).parent.parent / "src" / "github_integration" / "github_monitor.py"
+)
+
+
+@pytest.fixture(scope="module")
+def gm(tmp_path_factory):
+    """Load github_monitor from a scratch directory (it opens a log file in cwd)
+
+    Loaded by path because scripts/github_integration.py can shadow the
+    src/github_integration namespace package depending on sys.path order.
+    """
+    spec = importlib.util.spec_from_file_location("github_monitor", MONITOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    previous_cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("github_monitor"))
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        os.chdir(previous_cwd)
+    return module
+
+
+def make_request_data(request_id="REQ-1", **overrides):
+    """Build a procedure result object for a single request"""
+    data = {
+        "REQUEST_ID": request_id,
+        "BRANCH_NAME": f"feature/{request_id.lower()}",
+        "PR_TITLE": f"Add {request_id}",
+        "PR_DESCRIPTION": "Adds a config file",
+        "TARGET_BRANCH": "main",
+        "FILE_NAME": "snowddl/user.yaml",
+        "FILE_CONTENT": {"content": "USER: {}\n"},
+        "CREATED_BY": "tester",
+        "PRIORITY": 5,
+        "CREATED_AT": "2025-01-14T10:30:00Z",
+        "STAGE_PATH": "@STAGE/req.yaml",
+    }
+    data.update(overrides)
+    return data
+
+
+@pytest.fixture
+def snowflake_config(gm):
+    return gm.SnowflakeConfig(account="acct", user="user", password="pw")
+
+
+@pytest.fixture
+def github_config(gm):
+    return gm.GitHubConfig(token="token", repo_owner="owner", repo_name="repo")
+
+
+class TestSnowflakeConnector:
+    """Test request retrieval from Snowflake"""
+
+    def test_parse_request(self, gm):
+        """Procedure result objects map onto PRRequest fields"""
+        request = gm.SnowflakeConnector._parse_request(make_request_data())
+
+        assert request.request_id == "REQ-1"
+        assert request.file_content == "USER: {}\n"
+        assert request.created_at == datetime(2025, 1, 14, 10, 30, tzinfo=timezone.utc)
+
+    def test_parse_request_with_encoded_content(self, gm):
+        """Batch results carry base64 content instead of FILE_CONTENT"""
+        data = make_request_data(FILE_CONTENT_B64="VVNFUjoge30K")
+        del data["FILE_CONTENT"]
+
+        request = gm.SnowflakeConnector._parse_request(data)
+
+        assert request.file_content is None
+        assert request.file_content_b64 == "VVNFUjoge30K"
+
+    def test_get_pending_batch(self, gm, snowflake_config):
+        """A batch call returns every claimed request in order"""
+        connector = gm.SnowflakeConnector(snowflake_config)
+        payload = {
+            "status": "SUCCESS",
+            "requests": [make_request_data("REQ-1"), make_request_data("REQ-2")],
+        }
+        connector.execute_procedure = MagicMock(return_value=json.dumps(payload))
+
+        batch = connector.get_pending_batch("proc-1", 5)
+
+        connector.execute_procedure.assert_called_once_with(
+            "SP_GET_PENDING_BATCH", ["proc-1", 5]
+        )
+        assert [r.request_id for r in batch] == ["REQ-1", "REQ-2"]
+
+    def test_get_pending_batch_empty(self, gm, snowflake_config):
+        """An empty or failed batch yields no requests"""
+        connector = gm.SnowflakeConnector(snowflake_config)
+        connector.execute_procedure = MagicMock(
+            return_value={"status": "SUCCESS", "requests": []}
+        )
+        assert connector.get_pending_batch("proc-1") == []
+
+        connector.execute_procedure.return_value = {
+            "status": "ERROR",
+            "message": "boom",
+        }
+        assert connector.get_pending_batch("proc-1") == []
+
+    def test_get_next_pending_request_claims_batch_of_one(self, gm, snowflake_config):
+        """The single-request lookup claims through SP_GET_PENDING_BATCH"""
+        connector = gm.SnowflakeConnector(snowflake_config)
+        connector.execute_procedure = MagicMock(
+            return_value={"status": "SUCCESS", "requests": [make_request_data()]}
+        )
+
+        request = connector.get_next_pending_request("proc-1")
+
+        connector.execute_procedure.assert_called_once_with(
+            "SP_GET_PENDING_BATCH", ["proc-1", 1]
+        )
+        assert request.request_id == "REQ-1"
+
+        connector.execute_procedure.return_value = {"status": "SUCCESS", "requests": []}
+        assert connector.get_next_pending_request("proc-1") is None
+
+    def test_update_request_statuses_batch(self, gm, snowflake_config):
+        """All updates are sent as one JSON array and rejected ids returned"""
+        connector = gm.SnowflakeConnector(snowflake_config)
+        connector.execute_procedure = MagicMock(
+            return_value={
+                "status": "SUCCESS",
+                "results": [
+                    {"request_id": "REQ-1", "result": "SUCCESS: Status updated"},
+                    {"request_id": "REQ-2", "result": "ERROR: Request ID not found"},
+                ],
+            }
+        )
+        updates = [
+            {"request_id": "REQ-1", "status": "COMPLETED"},
+            {"request_id": "REQ-2", "status": "FAILED"},
+            {"request_id": "REQ-3", "status": "FAILED"},
+        ]
+
+        failed = connector.update_request_statuses_batch(updates)
+
+        sent = connector.execute_procedure.call_args.args[1][0]
+        assert json.loads(sent) == updates
+        # REQ-3 is missing from the results, so it was not applied either
+        assert failed == ["REQ-2", "REQ-3"]
+
+    def test_update_request_statuses_batch_error(self, gm, snowflake_config):
+        """A failed batch call raises"""
+        connector = gm.SnowflakeConnector(snowflake_config)
+        connector.execute_procedure = MagicMock(
+            return_value={"status": "ERROR", "message": "boom"}
+        )
+
+        assert connector.update_request_statuses_batch([]) == []
+        with pytest.raises(gm.GitHubIntegrationError, match="boom"):
+            connector.update_request_statuses_batch([{"request_id": "REQ-1"}])
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_helpers_round_trip(self, gm, monkeypatch, use_orjson):
+        """JSON helpers work with and without orjson installed"""
+        if use_orjson and not gm.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(gm, "ORJSON_AVAILABLE", use_orjson)
+        payload = {"status": "SUCCESS", "requests": [make_request_data()]}
+
+        text = gm._json_dumps(payload)
+
+        assert isinstance(text, str)
+        assert gm._json_loads(text) == payload
+        assert gm._json_loads(text.encode()) == payload
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (
+                "2025-01-14T10:30:00Z",
+                datetime(2025, 1, 14, 10, 30, tzinfo=timezone.utc),
+            ),
+            (
+                "2025-01-14T10:30:00.250+00:00",
+                datetime(2025, 1, 14, 10, 30, 0, 250000, tzinfo=timezone.utc),
+            ),
+            ("2025-01-14 10:30:00", datetime(2025, 1, 14, 10, 30)),
+        ],
+    )
+    def test_parse_timestamp_fallback(self, gm, monkeypatch, value, expected):
+        """Timestamps parse without ciso8601 installed"""
+        monkeypatch.setattr(gm, "CISO8601_AVAILABLE", False)
+        assert gm._parse_timestamp(value) == expected
+
+
+class TestSnowflakeConnection:
+    """Test connection reuse"""
+
+    def test_ensure_connected_reuses_live_connection(self, gm, snowflake_config):
+        """A connection that answers a ping is kept"""
+        connector = gm.SnowflakeConnector(snowflake_config)
+        connection = MagicMock()
+        connector.connection = connection
+        connector.connect = MagicMock()
+
+        connector.ensure_connected()
+
+        connection.cursor.return_value.execute.assert_called_once_with("SELECT 1")
+        connector.connect.assert_not_called()
+        assert connector.connection is connection
+
+    def test_ensure_connected_reconnects_dead_connection(self, gm, snowflake_config):
+        """A failed ping drops the old connection and reconnects"""
+        connector = gm.SnowflakeConnector(snowflake_config)
+        connection = MagicMock()
+        connection.cursor.return_value.execute.side_effect = Exception("gone")
+        connector.connection = connection
+        connector.connect = MagicMock()
+
+        connector.ensure_connected()
+
+        connection.close.assert_called_once()
+        connector.connect.assert_called_once()
+
+    def test_private_key_is_loaded_once(
+        self, gm, tmp_path, snowflake_config, monkeypatch
+    ):
+        """Reconnecting reuses the DER-encoded key until the file changes"""
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        key_path = tmp_path / "rsa_key.p8"
+        key_path.write_bytes(
+            key.private_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PrivateFormat.PKCS8,
+                encryption_algorithm=serialization.NoEncryption(),
+            )
+        )
+        snowflake_config.private_key_path = str(key_path)
+        connect = MagicMock()
+        monkeypatch.setattr(gm.snowflake.connector, "connect", connect)
+        gm._load_private_key_der.cache_clear()
+
+        connector = gm.SnowflakeConnector(snowflake_config)
+        connector.connect()
+        connector.connect()
+
+        info = gm._load_private_key_der.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+        der = connect.call_args.kwargs["private_key"]
+        assert serialization.load_der_private_key(der, password=None)
+
+
+class TestSnowflakePool:
+    """Test connection sharing through SnowflakePool"""
+
+    def test_connectors_share_pooled_connection(
+        self, gm, snowflake_config, monkeypatch
+    ):
+        """A released connection is reused by the next connector"""
+        connect = MagicMock(return_value=MagicMock())
+        monkeypatch.setattr(gm.snowflake.connector, "connect", connect)
+        pool = gm.SnowflakePool(snowflake_config, size=1)
+
+        first = gm.SnowflakeConnector(snowflake_config, pool=pool)
+        first.connect()
+        connection = first.connection
+        first.disconnect()
+
+        second = gm.SnowflakeConnector(snowflake_config, pool=pool)
+        second.connect()
+
+        assert second.connection is connection
+        connect.assert_called_once()
+        connection.close.assert_not_called()
+
+    def test_dead_pooled_connection_is_replaced(
+        self, gm, snowflake_config, monkeypatch
+    ):
+        """Checkout pings idle connections and replaces dead ones"""
+        dead, fresh = MagicMock(), MagicMock()
+        dead.cursor.return_value.execute.side_effect = Exception("gone")
+        monkeypatch.setattr(
+            gm.snowflake.connector, "connect", MagicMock(return_value=fresh)
+        )
+        pool = gm.SnowflakePool(snowflake_config, size=1)
+        pool._idle.put(dead)
+
+        assert pool.acquire() is fresh
+        dead.close.assert_called_once()
+
+    def test_acquire_times_out_when_exhausted(self, gm, snowflake_config):
+        """No more than `size` connections are checked out at once"""
+        pool = gm.SnowflakePool(snowflake_config, size=1, timeout=0.01)
+        pool._idle.put(MagicMock())
+        pool.acquire()
+
+        with pytest.raises(gm.GitHubIntegrationError, match="Timed out"):
+            pool.acquire()
+
+
+def make_response(status_code=200, body=None, headers=None):
+    """Build a requests.Response-like mock"""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = json.dumps(body if body is not None else {}).encode()
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            f"{status_code} Error", response=response
+        )
+    return response
+
+
+def sent_json(call):
+    """Decode the JSON body of a recorded session.request call"""
+    return json.loads(call.kwargs["data"])
+
+
+class TestGitHubClient:
+    """Test GitHub API request handling"""
+
+    def test_session_negotiates_compression(self, gm, github_config):
+        """Responses are requested compressed, keeping the v3 media type"""
+        client = gm.GitHubClient(github_config)
+
+        assert "gzip" in client.session.headers["Accept-Encoding"]
+        assert client.session.headers["Accept"] == "application/vnd.github.v3+json"
+
+    def test_conditional_get_uses_cached_response(self, gm, github_config):
+        """A 304 for a known ETag returns the cached response"""
+        client = gm.GitHubClient(github_config)
+        first = make_response(body={"name": "repo"}, headers={"ETag": '"abc"'})
+        client.session.request = MagicMock(
+            side_effect=[first, make_response(status_code=304)]
+        )
+
+        assert client.get_repository_info() == {"name": "repo"}
+        assert client.get_repository_info() == {"name": "repo"}
+
+        second_call = client.session.request.call_args_list[1]
+        assert second_call.kwargs["headers"]["If-None-Match"] == '"abc"'
+
+    def test_non_get_requests_are_not_conditional(self, gm, github_config):
+        """Writes never send If-None-Match"""
+        client = gm.GitHubClient(github_config)
+        client.session.request = MagicMock(
+            return_value=make_response(body={}, headers={"ETag": '"abc"'})
+        )
+
+        client._make_request("POST", "repos/owner/repo/git/refs", json={})
+        client._make_request("POST", "repos/owner/repo/git/refs", json={})
+
+        for call in client.session.request.call_args_list:
+            assert "If-None-Match" not in call.kwargs.get("headers", {})
+        assert not client._etag_cache
+
+    def test_graphql_enterprise_endpoint(self, gm, github_config):
+        """GitHub Enterprise GraphQL lives beside, not under, /api/v3"""
+        github_config.api_url = "https://ghe.example.com/api/v3"
+        client = gm.GitHubClient(github_config)
+        client.session.request = MagicMock(
+            return_value=make_response(body={"data": {"viewer": {"login": "me"}}})
+        )
+
+        assert client.graphql("{ viewer { login } }") == {"viewer": {"login": "me"}}
+        assert (
+            client.session.request.call_args.args[1]
+            == "https://ghe.example.com/api/graphql"
+        )
+
+    def test_graphql_errors_raise(self, gm, github_config):
+        """GraphQL errors in a 200 response are surfaced"""
+        client = gm.GitHubClient(github_config)
+        client.session.request = MagicMock(
+            return_value=make_response(body={"errors": [{"message": "bad ref"}]})
+        )
+
+        with pytest.raises(gm.GitHubIntegrationError, match="bad ref"):
+            client.graphql("{ viewer { login } }")
+
+    def test_open_pull_request_uses_two_round_trips(self, gm, github_config):
+        """Branch, commit and PR are created with one query and one mutation"""
+        client = gm.GitHubClient(github_config)
+        context = {
+            "data": {
+                "repository": {
+                    "id": "R_1",
+                    "base": {"target": {"oid": "abc123"}},
+                    "head": None,
+                }
+            }
+        }
+        created = {
+            "data": {
+                "createRef": {"ref": {"id": "REF_1"}},
+                "createCommitOnBranch": {"commit": {"oid": "def456"}},
+                "createPullRequest": {
+                    "pullRequest": {"number": 7, "url": "https://github.com/pr/7"}
+                },
+            }
+        }
+        client.session.request = MagicMock(
+            side_effect=[make_response(body=context), make_response(body=created)]
+        )
+
+        result = client.open_pull_request(
+            "feature/x", "a.yaml", "A: 1\n", "Add a\n\nbody", "Title", "Desc"
+        )
+
+        assert result == {"number": 7, "html_url": "https://github.com/pr/7"}
+        assert client.session.request.call_count == 2
+        variables = sent_json(client.session.request.call_args)["variables"]
+        assert variables["baseOid"] == "abc123"
+        assert variables["message"] == {"headline": "Add a", "body": "body"}
+        assert variables["fileChanges"]["additions"][0]["contents"] == "QTogMQo="
+
+    def test_open_pull_request_forwards_encoded_content(self, gm, github_config):
+        """Pre-encoded content is committed without re-encoding"""
+        client = gm.GitHubClient(github_config)
+        client.graphql = MagicMock(
+            side_effect=[
+                {
+                    "repository": {
+                        "id": "R_1",
+                        "base": {"target": {"oid": "abc123"}},
+                        "head": None,
+                    }
+                },
+                {"createPullRequest": {"pullRequest": {"number": 1, "url": "u"}}},
+            ]
+        )
+        client._encode_content = MagicMock()
+
+        client.open_pull_request(
+            "feature/x", "a.yaml", None, "m", "t", "d", content_b64="QTogMQo="
+        )
+
+        variables = client.graphql.call_args.args[1]
+        assert variables["fileChanges"]["additions"][0]["contents"] == "QTogMQo="
+        client._encode_content.assert_not_called()
+
+    def test_open_pull_request_existing_branch(self, gm, github_config):
+        """An existing head branch fails before anything is created"""
+        client = gm.GitHubClient(github_config)
+        context = {
+            "data": {
+                "repository": {
+                    "id": "R_1",
+                    "base": {"target": {"oid": "abc123"}},
+                    "head": {"id": "REF_0"},
+                }
+            }
+        }
+        client.session.request = MagicMock(return_value=make_response(body=context))
+
+        with pytest.raises(gm.GitHubIntegrationError, match="already exists"):
+            client.open_pull_request("feature/x", "a.yaml", "", "m", "t", "d")
+        assert client.session.request.call_count == 1
+
+    def test_json_body_is_serialized_once(self, gm, github_config):
+        """json= bodies are sent as UTF-8 bytes with a JSON content type"""
+        client = gm.GitHubClient(github_config)
+        client.session.request = MagicMock(return_value=make_response(body={}))
+
+        client._make_request("POST", "repos/owner/repo/pulls", json={"title": "café"})
+
+        call = client.session.request.call_args
+        assert "json" not in call.kwargs
+        assert isinstance(call.kwargs["data"], bytes)
+        assert call.kwargs["headers"]["Content-Type"] == "application/json"
+        assert sent_json(call) == {"title": "café"}
+
+    def test_branch_exists_is_cached(self, gm, github_config):
+        """Repeated lookups and created branches skip the branches GET"""
+        client = gm.GitHubClient(github_config)
+        client.session.request = MagicMock(
+            side_effect=[
+                make_response(status_code=404),
+                make_response(body={"object": {"sha": "abc123"}}),
+                make_response(body={}),
+            ]
+        )
+
+        assert client.branch_exists("feature/a") is False
+        assert client.branch_exists("feature/a") is False
+        client.create_branch("feature/a")
+        assert client.branch_exists("feature/a") is True
+
+        assert client.session.request.call_count == 3
+
+    def test_branch_cache_expires(self, gm, github_config, monkeypatch):
+        """Cached answers are re-checked after the TTL"""
+        client = gm.GitHubClient(github_config)
+        client.session.request = MagicMock(return_value=make_response(body={}))
+        now = [1000.0]
+        monkeypatch.setattr(gm.time, "monotonic", lambda: now[0])
+
+        client.branch_exists("feature/a")
+        now[0] += gm.BRANCH_CACHE_TTL_SECONDS
+        client.branch_exists("feature/a")
+
+        assert client.session.request.call_count == 2
+
+    def test_encode_content(self, gm):
+        """Non-ASCII file content round-trips through base64"""
+        import base64
+
+        encoded = gm.GitHubClient._encode_content("COMMENT: café\n")
+        assert base64.b64decode(encoded).decode("utf-8") == "COMMENT: café\n"
+
+    def test_create_branch_reuses_base_sha(self, gm, github_config):
+        """Branches created off the same base resolve its SHA once"""
+        client = gm.GitHubClient(github_config)
+        base_ref = make_response(body={"object": {"sha": "abc123"}})
+        client.session.request = MagicMock(
+            side_effect=[base_ref, make_response(body={}), make_response(body={})]
+        )
+
+        client.create_branch("feature/a")
+        client.create_branch("feature/b")
+
+        methods = [c.args[0] for c in client.session.request.call_args_list]
+        assert methods == ["GET", "POST", "POST"]
+        for call in client.session.request.call_args_list[1:]:
+            assert sent_json(call)["sha"] == "abc123"
+
+    def test_create_branch_failure_drops_cached_sha(self, gm, github_config):
+        """A 422 reports an existing branch and drops the cached base SHA"""
+        client = gm.GitHubClient(github_config)
+        client.session.request = MagicMock(
+            side_effect=[
+                make_response(body={"object": {"sha": "abc123"}}),
+                make_response(status_code=422),
+            ]
+        )
+
+        with pytest.raises(gm.GitHubIntegrationError, match="already exists"):
+            client.create_branch("feature/a")
+        assert client._base_sha_cache == {}
+
+
+class TestGitHubMonitor:
+    """Test the monitor processing loop"""
+
+    def test_run_once_fetches_batches(self, gm, snowflake_config, github_config):
+        """Requests are drained from a local queue between batch fetches"""
+        monitor = gm.GitHubMonitor(snowflake_config, github_config, batch_size=2)
+        monitor.snowflake = MagicMock()
+        parse = gm.SnowflakeConnector._parse_request
+        monitor.snowflake.get_pending_batch.side_effect = [
+            [parse(make_request_data("REQ-1")), parse(make_request_data("REQ-2"))],
+            [parse(make_request_data("REQ-3"))],
+            [],
+        ]
+        processed = []
+        monitor._process_request = lambda request: processed.append(request.request_id)
+
+        stats = monitor.run_once()
+
+        assert sorted(processed) == ["REQ-1", "REQ-2", "REQ-3"]
+        assert stats["succeeded"] == 3
+        assert monitor.snowflake.get_pending_batch.call_count == 3
+
+    def test_run_once_stops_at_batch_max(self, gm, snowflake_config, github_config):
+        """No more than batch_max requests are claimed in one run"""
+        github_config.batch_max = 3
+        monitor = gm.GitHubMonitor(snowflake_config, github_config, batch_size=2)
+        monitor.snowflake = MagicMock()
+        parse = gm.SnowflakeConnector._parse_request
+        monitor.snowflake.get_pending_batch.side_effect = lambda pid, limit: [
+            parse(make_request_data(f"REQ-{i}")) for i in range(limit)
+        ]
+        monitor._process_request = lambda request: None
+
+        stats = monitor.run_once()
+
+        assert stats["processed"] == 3
+        assert stats["capped"] is True
+        limits = [c.args[1] for c in monitor.snowflake.get_pending_batch.call_args_list]
+        assert limits == [2, 1]
+
+    def test_run_once_processes_batch_concurrently(
+        self, gm, snowflake_config, github_config
+    ):
+        """Requests in a batch run in parallel and failures are recorded"""
+        monitor = gm.GitHubMonitor(snowflake_config, github_config, max_concurrency=3)
+        monitor.snowflake = MagicMock()
+        parse = gm.SnowflakeConnector._parse_request
+        monitor.snowflake.get_pending_batch.side_effect = [
+            [parse(make_request_data(f"REQ-{i}")) for i in range(3)],
+            [],
+        ]
+        # Every worker must be in flight at once for the barrier to release
+        barrier = threading.Barrier(3, timeout=5)
+
+        def process(request):
+            barrier.wait()
+            if request.request_id == "REQ-2":
+                raise gm.GitHubIntegrationError("boom")
+
+        monitor._process_request = process
+
+        stats = monitor.run_once()
+
+        assert stats["succeeded"] == 2
+        assert stats["failed"] == 1
+        monitor.snowflake.update_request_statuses_batch.assert_called_once_with(
+            [
+                {
+                    "request_id": "REQ-2",
+                    "status": "FAILED",
+                    "processor_id": monitor.processor_id,
+                    "error_message": "boom",
+                }
+            ]
+        )
+
+    def test_status_updates_flush_when_buffer_is_full(
+        self, gm, snowflake_config, github_config, monkeypatch
+    ):
+        """Queued status updates are written once the flush size is reached"""
+        monkeypatch.setattr(gm, "STATUS_FLUSH_SIZE", 2)
+        monitor = gm.GitHubMonitor(snowflake_config, github_config)
+        monitor.snowflake = MagicMock()
+
+        monitor._queue_status_update("REQ-1", "COMPLETED")
+        monitor.snowflake.update_request_statuses_batch.assert_not_called()
+
+        monitor._queue_status_update("REQ-2", "COMPLETED")
+        updates = monitor.snowflake.update_request_statuses_batch.call_args.args[0]
+        assert [u["request_id"] for u in updates] == ["REQ-1", "REQ-2"]
+        assert monitor._pending_updates == []
+
+    def test_failed_flush_keeps_status_updates(
+        self, gm, snowflake_config, github_config
+    ):
+        """Updates stay buffered when the batch call fails"""
+        monitor = gm.GitHubMonitor(snowflake_config, github_config)
+        monitor.snowflake = MagicMock()
+        monitor.snowflake.update_request_statuses_batch.side_effect = (
+            gm.GitHubIntegrationError("boom")
+        )
+        monitor._queue_status_update("REQ-1", "COMPLETED")
+
+        with pytest.raises(gm.GitHubIntegrationError):
+            monitor._flush_status_updates()
+        monitor._queue_status_update("REQ-2", "COMPLETED")
+
+        assert [u["request_id"] for u in monitor._pending_updates] == [
+            "REQ-1",
+            "REQ-2",
+        ]
+
+    def test_run_once_reports_rejected_status_updates(
+        self, gm, snowflake_config, github_config
+    ):
+        """Status updates Snowflake rejects are counted as errors"""
+        monitor = gm.GitHubMonitor(snowflake_config, github_config)
+        monitor.snowflake = MagicMock()
+        parse = gm.SnowflakeConnector._parse_request
+        monitor.snowflake.get_pending_batch.side_effect = [
+            [parse(make_request_data("REQ-1"))],
+            [],
+        ]
+        monitor.snowflake.update_request_statuses_batch.return_value = ["REQ-1"]
+        monitor._process_request = lambda request: monitor._queue_status_update(
+            request.request_id, "COMPLETED"
+        )
+
+        stats = monitor.run_once()
+
+        assert stats["succeeded"] == 1
+        assert stats["errors"] == ["Failed to update status of request REQ-1"]
+
+    def test_build_pr_description(self, gm, snowflake_config, github_config):
+        """The PR body carries the request description and its metadata"""
+        monitor = gm.GitHubMonitor(snowflake_config, github_config)
+        request = gm.SnowflakeConnector._parse_request(
+            make_request_data(PR_DESCRIPTION="")
+        )
+
+        description = monitor._build_pr_description(request)
+
+        assert description.startswith("Automated SnowDDL configuration update\n\n---\n")
+        assert "- Request ID: `REQ-1`\n" in description
+        assert "- Created: 2025-01-14 10:30:00 UTC\n" in description
+        assert description.endswith("SnowDDL GitHub integration system.\n")
+
+    def test_run_once_disconnects_by_default(self, gm, snowflake_config, github_config):
+        """A standalone run_once closes its connection"""
+        monitor = gm.GitHubMonitor(snowflake_config, github_config)
+        monitor.snowflake = MagicMock()
+        monitor.snowflake.get_pending_batch.return_value = []
+
+        monitor.run_once()
+
+        monitor.snowflake.disconnect.assert_called_once()
+
+    def test_persistent_session_keeps_connection(
+        self, gm, snowflake_config, github_config
+    ):
+        """Inside the context manager the connection survives run_once"""
+        monitor = gm.GitHubMonitor(snowflake_config, github_config)
+        monitor.snowflake = MagicMock()
+        monitor.snowflake.get_pending_batch.return_value = []
+
+        with monitor:
+            monitor.run_once()
+            monitor.run_once()
+            monitor.snowflake.disconnect.assert_not_called()
+
+        assert monitor.snowflake.ensure_connected.call_count == 2
+        monitor.snowflake.disconnect.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "idle_cycles,factor", [(0, 1), (1, 1), (2, 2), (3, 4), (4, 4), (50, 4)]
+    )
+    def test_backoff_interval(self, gm, idle_cycles, factor):
+        """Idle polling doubles the wait up to the cap, with jitter"""
+        wait = gm.GitHubMonitor._backoff_interval(100, idle_cycles)
+        assert 80 * factor <= wait <= 120 * factor
+
+    def test_run_continuous_backs_off_and_stops(
+        self, gm, snowflake_config, github_config, monkeypatch
+    ):
+        """Waits grow while idle and stop() ends the loop"""
+        monitor = gm.GitHubMonitor(snowflake_config, github_config)
+        monitor.snowflake = MagicMock()
+        monitor.run_once = MagicMock(return_value={"processed": 0, "capped": False})
+        monkeypatch.setattr(gm.random, "uniform", lambda a, b: 1.0)
+
+        waits = []
+
+        def fake_wait(timeout):
+            waits.append(timeout)
+            if len(waits) == 3:
+                monitor.stop()
+
+        monitor._stop_event.wait = fake_wait
+        monitor.run_continuous(10)
+
+        assert waits == [10, 20, 40]
+
+    def test_run_continuous_returns_quickly_when_capped(
+        self, gm, snowflake_config, github_config
+    ):
+        """A cycle cut short by batch_max polls again after a short wait"""
+        monitor = gm.GitHubMonitor(snowflake_config, github_config)
+        monitor.snowflake = MagicMock()
+        monitor.run_once = MagicMock(
+            return_value={"processed": 50, "succeeded": 50, "failed": 0, "capped": True}
+        )
+
+        waits = []
+
+        def fake_wait(timeout):
+            waits.append(timeout)
+            monitor.stop()
+
+        monitor._stop_event.wait = fake_wait
+        monitor.run_continuous(300)
+
+        assert waits == [gm.BACKLOG_POLL_SECONDS]
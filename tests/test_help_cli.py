@@ -0,0 +1,99 @@
+"""
+Test Suite for the Command Help System
+
+Tests the categorized command listing in help_cli.py including:
+- Rendering of every category and command
+- Reuse of the prebuilt renderables across calls
+- Shape of the category data
+- Plain-text output for pipes and scripts
+"""
+
+import io
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import help_cli
+
+
+@pytest.fixture
+def output(monkeypatch):
+    """Route help output to an in-memory console and return its buffer"""
+    buffer = io.StringIO()
+    monkeypatch.setattr(
+        help_cli, "console", Console(file=buffer, width=100, color_system=None)
+    )
+    return buffer
+
+
+class TestShowCommands:
+    """Test the rendered command listing"""
+
+    def test_lists_every_category_and_command(self, output):
+        """Each category title and command name appears in the output"""
+        help_cli.show_commands(plain=False)
+        text = output.getvalue()
+
+        assert "SnowTower - Snowflake Infrastructure Management" in text
+        for category in help_cli.CATEGORIES:
+            assert category.title in text
+            for command in category.commands:
+                assert command[0].strip() in text
+        assert "Quick Start:" in text
+
+    def test_repeat_calls_render_identically(self, output):
+        """Cached tables give the same output on every call"""
+        help_cli.show_commands(plain=False)
+        first = output.getvalue()
+        output.seek(0)
+        output.truncate()
+
+        help_cli.show_commands(plain=False)
+
+        assert output.getvalue() == first
+
+    def test_commands_are_name_description_pairs(self):
+        """Command entries hold only the rendered name and description"""
+        for category in help_cli.CATEGORIES:
+            for command in category.commands:
+                assert len(command) == 2
+
+    def test_renderables_are_built_once(self):
+        """Category tables and footer are reused rather than rebuilt"""
+        assert help_cli._build_renderables() is help_cli._build_renderables()
+
+    def test_import_does_not_load_rich(self):
+        """Reading CATEGORIES does not pay for importing Rich"""
+        src = Path(__file__).parent.parent / "src"
+        code = (
+            f"import sys; sys.path.insert(0, {str(src)!r}); import help_cli; "
+            "assert help_cli.CATEGORIES; "
+            "assert not any(m.split('.')[0] == 'rich' for m in sys.modules)"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestPlainOutput:
+    """Test the Rich-free plain-text listing"""
+
+    def test_plain_output_has_no_markup(self, capsys):
+        """Plain output lists every command without markup or ANSI codes"""
+        help_cli.show_commands(plain=True)
+        text = capsys.readouterr().out
+
+        assert "[cyan]" not in text and "\x1b[" not in text
+        assert text.startswith("SnowTower - Snowflake Infrastructure Management\n")
+        assert "  snowddl-plan        Preview infrastructure changes" in text
+        assert "uv run <command> --help" in text
+
+    def test_defaults_to_plain_when_piped(self, capsys, monkeypatch):
+        """Non-terminal stdout gets the plain listing by default"""
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: False, raising=False)
+        help_cli.show_commands()
+
+        assert capsys.readouterr().out == help_cli._build_plain_text()
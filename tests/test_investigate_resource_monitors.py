@@ -0,0 +1,556 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Resource Monitor Investigator
+
+Tests investigate_resource_monitors.py including:
+- Connector session setup and snow CLI fallback
+- Query execution and row handling
+- Authentication troubleshooting lookup
+- Batched and concurrent analysis queries in full mode
+- Table display from query rows
+- Human-readable summary
+- Saving results to JSON
+"""
+
+import io
+import json
+import sys
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from rich.console import Console
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import investigate_resource_monitors as irm
+
+ENV_VARS = {
+    "SNOWFLAKE_ACCOUNT": "test-account",
+    "SNOWFLAKE_USER": "test-user",
+    "SNOWFLAKE_ROLE": "SYSADMIN",
+    "SNOWFLAKE_WAREHOUSE": "COMPUTE_WH",
+    "SNOWFLAKE_PASSWORD": "secret",
+}
+
+
+@pytest.fixture
+def console():
+    """Console writing to an in-memory buffer"""
+    return Console(file=io.StringIO(), width=120, color_system=None)
+
+
+@pytest.fixture
+def connection():
+    """Mock connector session"""
+    return MagicMock()
+
+
+@pytest.fixture
+def investigator(console, connection, monkeypatch):
+    """Investigator connected through a mocked snowflake-connector"""
+    monkeypatch.setattr(irm, "load_snowflake_env", lambda validate_auth: ENV_VARS)
+    with patch("snowflake.connector.connect", return_value=connection):
+        yield irm.ResourceMonitorInvestigator(console)
+
+
+@pytest.fixture
+def cli_investigator(console, monkeypatch):
+    """Investigator without a connector session, using snow CLI"""
+    monkeypatch.setattr(irm, "load_snowflake_env", lambda validate_auth: ENV_VARS)
+    with patch("snowflake.connector.connect", side_effect=Exception("no network")):
+        yield irm.ResourceMonitorInvestigator(console)
+
+
+def set_rows(connection, rows):
+    """Make the mocked session's cursors return rows"""
+    connection.cursor.return_value.fetchall.return_value = rows
+
+
+class TestConnectorSession:
+    """Test the shared connector session"""
+
+    def test_connects_once_with_password(self, investigator, connection):
+        """Environment loading opens one password-authenticated session"""
+        assert investigator.conn is connection
+
+    def test_investigation_id_matches_timestamp(self, investigator):
+        """The investigation ID and timestamp come from the same instant"""
+        started = irm.datetime.fromisoformat(investigator.results["timestamp"])
+
+        assert investigator.results["investigation_id"] == (
+            f"rm_investigation_{int(started.timestamp())}"
+        )
+
+    def test_falls_back_to_cli_when_connect_fails(self, cli_investigator):
+        """A failed connect leaves queries to the snow CLI"""
+        assert cli_investigator.conn is None
+
+    def test_context_manager_closes_session(self, investigator, connection):
+        """Leaving the with-block closes the connector session"""
+        with investigator:
+            pass
+
+        connection.close.assert_called_once()
+        assert investigator.conn is None
+
+    def test_queries_share_the_session(self, investigator, connection):
+        """Every analysis runs on the same session without spawning snow"""
+        set_rows(connection, [{"NAME": "WH", "STATE": "STARTED"}])
+
+        with patch.object(irm.subprocess, "run") as run:
+            assert investigator.test_connectivity()
+            assert investigator.check_existing_monitors()
+            assert investigator.analyze_warehouse_status()
+            assert investigator.analyze_credit_usage()
+
+        run.assert_not_called()
+        assert connection.cursor.return_value.execute.call_count == 4
+
+    def test_no_spinner_when_not_a_terminal(self, investigator, connection, console):
+        """Connectivity output to a file or pipe skips the animated status"""
+        set_rows(connection, [])
+
+        with patch.object(console, "status") as status:
+            assert investigator.test_connectivity()
+
+        status.assert_not_called()
+
+    def test_credit_usage_query_uses_bind_params(self, investigator, connection):
+        """The credit query text stays constant; the dates are bound"""
+        set_rows(connection, [])
+
+        investigator.analyze_credit_usage()
+
+        sql, params = connection.cursor.return_value.execute.call_args.args
+        assert sql == irm.CREDIT_USAGE_SQL
+        assert (params["end"] - params["start"]).days == irm.CREDIT_USAGE_DAYS
+
+    def test_query_error_is_reported(self, investigator, connection):
+        """A failing query marks the test failed with the error text"""
+        connection.cursor.return_value.execute.side_effect = Exception(
+            "JWT token is invalid"
+        )
+
+        assert not investigator.test_connectivity()
+
+        connectivity = investigator.results["tests"]["connectivity"]
+        assert connectivity["status"] == "failed"
+        assert connectivity["troubleshooting"]["error_type"] == "jwt_authentication"
+
+    def test_troubleshooting_looked_up_once(self, investigator, connection):
+        """The stored troubleshooting entry is the one displayed"""
+        connection.cursor.return_value.execute.side_effect = Exception(
+            "Incorrect username or password was specified."
+        )
+
+        with patch.object(
+            investigator,
+            "_generate_auth_troubleshooting",
+            wraps=investigator._generate_auth_troubleshooting,
+        ) as generate:
+            investigator.test_connectivity()
+
+        generate.assert_called_once()
+        text = investigator.console.file.getvalue()
+        assert "1. Verify SNOWFLAKE_USER" in text
+        assert "5. Switch to RSA key" in text
+
+
+class TestLogging:
+    """Test log handler setup"""
+
+    def test_no_listener_when_not_a_terminal(self, investigator):
+        """Non-terminal output logs synchronously without a listener thread"""
+        assert investigator._log_listener is None
+
+    def test_queue_handler_drops_oldest_when_full(self):
+        """A full log queue discards the oldest record to admit the newest"""
+        log_queue = irm.queue.Queue(maxsize=2)
+        handler = irm._DropOldestQueueHandler(log_queue)
+
+        for msg in ("one", "two", "three"):
+            handler.handle(irm.logging.makeLogRecord({"msg": msg}))
+
+        assert [log_queue.get_nowait().msg for _ in range(2)] == ["two", "three"]
+
+
+class TestAuthTroubleshooting:
+    """Test troubleshooting lookup for authentication errors"""
+
+    @pytest.mark.parametrize(
+        "error_msg, error_type",
+        [
+            ("250001: JWT token is invalid.", "jwt_authentication"),
+            (
+                "Incorrect username or password was specified.",
+                "password_authentication",
+            ),
+            (
+                "Failed to connect to DB: acct.snowflakecomputing.com",
+                "connection_failure",
+            ),
+            ("Something else went wrong", "unknown"),
+        ],
+    )
+    def test_error_type_from_message(self, investigator, error_msg, error_type):
+        """Each known error message maps to its troubleshooting entry"""
+        troubleshooting = investigator._generate_auth_troubleshooting(error_msg)
+
+        assert troubleshooting["error_type"] == error_type
+
+    def test_earlier_entry_wins_over_earlier_position(self, investigator):
+        """A JWT error is reported even when a connect failure is mentioned first"""
+        troubleshooting = investigator._generate_auth_troubleshooting(
+            "Failed to connect: JWT token is invalid"
+        )
+
+        assert troubleshooting["error_type"] == "jwt_authentication"
+
+
+class TestCliFallback:
+    """Test query execution through the snow CLI"""
+
+    def test_cli_json_output_loaded_as_rows(self, cli_investigator):
+        """JSON output from snow sql is used as the rows directly"""
+        stdout = (
+            b'[{"NAME": "WH1", "STATE": "STARTED"}, {"NAME": "WH2", "STATE": null}]'
+        )
+
+        with patch.object(
+            cli_investigator, "execute_snow_command", return_value=(True, stdout, "")
+        ) as execute:
+            success, rows, _ = cli_investigator._exec_sql(
+                "SELECT 1", connection_name="dev"
+            )
+
+        assert success
+        assert rows == [
+            {"NAME": "WH1", "STATE": "STARTED"},
+            {"NAME": "WH2", "STATE": None},
+        ]
+        assert execute.call_args[0][0] == [
+            "sql",
+            "-c",
+            "dev",
+            "--format",
+            "JSON",
+            "-q",
+            "SELECT 1",
+        ]
+
+    def test_cli_binds_params_as_literals(self, cli_investigator):
+        """Bind values are quoted into the query text for snow CLI"""
+        with patch.object(
+            cli_investigator, "execute_snow_command", return_value=(True, b"", "")
+        ) as execute:
+            success, rows, _ = cli_investigator._exec_sql(
+                irm.CREDIT_USAGE_SQL, cli_investigator._credit_usage_params
+            )
+
+        sql = execute.call_args[0][0][-1]
+        start = cli_investigator._credit_usage_params["start"]
+        assert f"START_TIME >= '{start.isoformat()}'" in sql
+        assert success and rows == []
+
+    def test_unparseable_cli_output_fails_query(self, cli_investigator):
+        """Non-JSON output is reported as a query failure"""
+        with patch.object(
+            cli_investigator,
+            "execute_snow_command",
+            return_value=(True, b"| NAME |", ""),
+        ):
+            success, rows, error = cli_investigator._exec_sql("SELECT 1")
+
+        assert not success and rows == []
+        assert "Could not parse" in error
+
+    def test_working_connection_reused(self, cli_investigator):
+        """A connection found by the connectivity test is used for later queries"""
+        connection_list = b'[{"connection_name": "broken"}, {"connection_name": "dev"}]'
+
+        def execute(command, **kwargs):
+            if command[0] == "connection":
+                return True, connection_list, ""
+            if "-c" in command and command[command.index("-c") + 1] == "dev":
+                return True, b"[]", ""
+            return False, b"", "Failed to connect"
+
+        with patch.object(
+            cli_investigator, "execute_snow_command", side_effect=execute
+        ) as execute_snow:
+            assert cli_investigator.test_connectivity()
+            cli_investigator.analyze_warehouse_status()
+
+        assert execute_snow.call_args[0][0][1:3] == ["-c", "dev"]
+
+    def test_key_pair_login_passed_to_snow(self, console, monkeypatch):
+        """With a private key configured, snow runs with the JWT authenticator"""
+        env_vars = {**ENV_VARS, "SNOWFLAKE_PRIVATE_KEY_PATH": "/keys/rsa.p8"}
+        monkeypatch.setattr(irm, "load_snowflake_env", lambda validate_auth: env_vars)
+        with patch("snowflake.connector.connect", side_effect=Exception("offline")):
+            investigator = irm.ResourceMonitorInvestigator(console)
+
+        with patch.object(irm.subprocess, "run") as run:
+            run.return_value.returncode = 0
+            investigator.execute_snow_command(["sql", "-q", "SELECT 1"])
+
+        env = run.call_args.kwargs["env"]
+        assert env["SNOWFLAKE_AUTHENTICATOR"] == "SNOWFLAKE_JWT"
+        assert env["SNOWFLAKE_PRIVATE_KEY_FILE"] == "/keys/rsa.p8"
+
+    def test_stdout_kept_as_bytes_and_stderr_dropped(self, cli_investigator):
+        """Output is returned undecoded; uncaptured streams go to DEVNULL"""
+        with patch.object(irm.subprocess, "run") as run:
+            run.return_value.returncode = 0
+            run.return_value.stdout = b"[]"
+            run.return_value.stderr = None
+            success, stdout, stderr = cli_investigator.execute_snow_command(
+                ["connection", "list"], capture=("stdout",)
+            )
+
+        assert (success, stdout, stderr) == (True, b"[]", "")
+        assert run.call_args.kwargs["stdout"] == irm.subprocess.PIPE
+        assert run.call_args.kwargs["stderr"] == irm.subprocess.DEVNULL
+        assert "text" not in run.call_args.kwargs
+
+    def test_connection_names_listed(self, cli_investigator):
+        """Connection names come from the JSON connection list"""
+        stdout = (
+            b'[{"connection_name": "default", "is_default": true},'
+            b' {"connection_name": "dev", "is_default": false}]'
+        )
+
+        with patch.object(
+            cli_investigator, "execute_snow_command", return_value=(True, stdout, "")
+        ):
+            assert cli_investigator._list_connections() == ["default", "dev"]
+
+
+class TestRunInvestigation:
+    """Test investigation modes"""
+
+    def test_full_mode_batches_analysis_queries(self, investigator, connection):
+        """Full mode fetches the three analysis queries in one round trip"""
+        cursor = connection.cursor.return_value
+        cursor.fetchall.side_effect = [
+            [{"VERSION": "8.0"}],
+            [{"NAME": "RM_DAILY"}],
+            [{"NAME": "COMPUTE_WH"}],
+            [],
+        ]
+
+        results = investigator.run_investigation("full")
+
+        assert cursor.execute.call_count == 2
+        assert cursor.execute.call_args.kwargs == {"num_statements": 3}
+        assert cursor.execute.call_args.args[0] is irm.ANALYSIS_BATCH_SQL
+        assert cursor.execute.call_args.args[1] == investigator._credit_usage_params
+        assert results["status"] == "completed"
+        assert results["tests"]["existing_monitors"]["output"] == [{"NAME": "RM_DAILY"}]
+        assert results["tests"]["warehouse_analysis"]["output"] == [
+            {"NAME": "COMPUTE_WH"}
+        ]
+        assert results["tests"]["credit_usage"]["output"] == []
+
+    def test_failed_batch_falls_back_to_single_queries(self, investigator, connection):
+        """A failing batch reruns the queries one by one"""
+        set_rows(connection, [{"NAME": "WH", "STATE": "STARTED"}])
+
+        def execute(sql, params=None, num_statements=None):
+            if num_statements:
+                raise Exception("Multiple SQL statements are not allowed")
+
+        connection.cursor.return_value.execute.side_effect = execute
+
+        with patch.object(
+            investigator, "_exec_sql", wraps=investigator._exec_sql
+        ) as exec_sql:
+            results = investigator.run_investigation("full")
+
+        queried = [call.args[0] for call in exec_sql.call_args_list]
+        assert queried.count(irm.MONITORS_SQL) == 1
+        assert queried.count(irm.WAREHOUSES_SQL) == 1
+        for test in ("existing_monitors", "warehouse_analysis", "credit_usage"):
+            assert results["tests"][test]["status"] == "success"
+
+    def test_cli_full_mode_uses_one_snow_process(self, cli_investigator):
+        """Without a session, the analysis queries share one snow sql call"""
+        result_sets = b'[[{"NAME": "RM_DAILY"}], [{"NAME": "COMPUTE_WH"}], []]'
+
+        with patch.object(
+            cli_investigator,
+            "execute_snow_command",
+            return_value=(True, result_sets, ""),
+        ) as execute:
+            results = cli_investigator._run_batched_queries()
+
+        execute.assert_called_once()
+        assert results["existing_monitors"] == (True, [{"NAME": "RM_DAILY"}], "")
+        assert results["warehouse_analysis"] == (True, [{"NAME": "COMPUTE_WH"}], "")
+        assert results["credit_usage"] == (True, [], "")
+
+    def test_cli_batch_failure_runs_queries_separately(self, cli_investigator):
+        """A failed snow batch falls back to one call per query"""
+        with patch.object(
+            cli_investigator,
+            "execute_snow_command",
+            side_effect=[(False, b"", "error")] + [(True, b"[]", "")] * 3,
+        ) as execute:
+            results = cli_investigator._run_batched_queries()
+
+        assert execute.call_count == 4
+        assert all(result[0] for result in results.values())
+
+    def test_failed_test_blocks_deployment(self, investigator, connection):
+        """A failed analysis is named in the critical recommendation"""
+        connection.cursor.return_value.execute.side_effect = Exception("denied")
+
+        investigator.check_existing_monitors()
+        investigator.assess_deployment_safety()
+
+        assert investigator.results["safe_to_deploy"] is False
+        assert any(
+            rec["priority"] == "critical" and "existing_monitors" in rec["message"]
+            for rec in investigator.results["recommendations"]
+        )
+
+    def test_failure_warning_makes_deployment_conditional(self, investigator):
+        """A warning about a failure, with no failed tests, is conditional"""
+        investigator.add_warning("Connectivity test FAILED - results unreliable")
+        investigator.assess_deployment_safety()
+
+        assert investigator.results["safe_to_deploy"] == "conditional"
+
+    def test_single_mode_queries_directly(self, investigator, connection):
+        """A single-analysis mode skips the concurrent prefetch"""
+        set_rows(connection, [])
+
+        with patch.object(investigator, "_prefetch_queries") as prefetch:
+            investigator.run_investigation("credits")
+
+        prefetch.assert_not_called()
+        assert investigator.results["tests"]["credit_usage"]["status"] == "success"
+
+
+class TestDisplayTables:
+    """Test rendering of query rows"""
+
+    def test_warehouse_table_uses_named_columns(self, investigator, console):
+        """Warehouse rows render by column name with a None monitor placeholder"""
+        investigator._display_warehouse_table(
+            [
+                {
+                    "NAME": "COMPUTE_WH",
+                    "STATE": "SUSPENDED",
+                    "SIZE": "X-Small",
+                    "AUTO_SUSPEND": 60,
+                    "RESOURCE_MONITOR": None,
+                }
+            ]
+        )
+        text = console.file.getvalue()
+
+        assert "COMPUTE_WH" in text
+        assert "X-Small" in text
+        assert "None" in text
+
+
+class TestHumanSummary:
+    """Test the Markdown summary report"""
+
+    def test_recommendations_sorted_by_priority(self, investigator):
+        """Critical recommendations come first, each with its marker"""
+        investigator.add_recommendation("Tidy up later", "low")
+        investigator.add_recommendation("Fix now", "critical")
+        investigator.results["tests"]["connectivity"] = {"status": "failed"}
+
+        summary = investigator.format_human_summary()
+
+        assert "- ✗ **Connectivity:** failed" in summary
+        assert summary.index("🚨 **CRITICAL:** Fix now") < summary.index(
+            "📝 **LOW:** Tidy up later"
+        )
+
+    def test_sorted_recommendations_refresh_after_add(self, investigator):
+        """The cached priority order picks up recommendations added later"""
+        investigator.add_recommendation("Tidy up later", "low")
+        first = investigator._sorted_recommendations()
+
+        assert investigator._sorted_recommendations() is first
+
+        investigator.add_recommendation("Fix now", "critical")
+
+        assert [rec["message"] for rec in investigator._sorted_recommendations()] == [
+            "Fix now",
+            "Tidy up later",
+        ]
+
+
+class TestSaveResults:
+    """Test writing investigation results to disk"""
+
+    def test_saves_query_rows_with_decimals_and_dates(self, investigator, tmp_path):
+        """Connector values without a JSON type are saved as strings"""
+        investigator.results["tests"]["credit_usage"] = {
+            "status": "success",
+            "output": [
+                {
+                    "USAGE_DATE": irm.date(2024, 1, 31),
+                    "DAILY_CREDITS": Decimal("1.250000000"),
+                }
+            ],
+        }
+
+        path = investigator.save_results(tmp_path / "results.json")
+        saved = json.loads(path.read_text())
+
+        row = saved["tests"]["credit_usage"]["output"][0]
+        assert row["USAGE_DATE"] == "2024-01-31"
+        assert row["DAILY_CREDITS"] == "1.250000000"
+        assert saved["investigation_id"] == investigator.results["investigation_id"]
+
+    def test_saves_without_orjson(self, investigator, tmp_path, monkeypatch):
+        """The stdlib json fallback writes the same results"""
+        monkeypatch.setattr(irm, "ORJSON_AVAILABLE", False)
+
+        path = investigator.save_results(tmp_path / "results.json")
+
+        assert json.loads(path.read_text())["status"] == "started"
+
+    def test_saves_serialized_data_as_given(self, investigator, tmp_path):
+        """Already-serialized results are written without re-encoding"""
+        path = investigator.save_results(tmp_path / "results.json", data=b"{}")
+
+        assert path.read_bytes() == b"{}"
+
+
+class TestMain:
+    """Test the command-line entry point"""
+
+    def test_json_output_serializes_once_and_skips_summary(self, monkeypatch):
+        """JSON-only runs reuse one serialization and never build the summary"""
+        investigator = MagicMock()
+        investigator.__enter__.return_value = investigator
+        investigator.run_investigation.return_value = {
+            "status": "completed",
+            "safe_to_deploy": True,
+        }
+        monkeypatch.setattr(
+            irm, "ResourceMonitorInvestigator", MagicMock(return_value=investigator)
+        )
+        monkeypatch.setattr(
+            sys, "argv", ["irm", "--output-format", "json", "--save-results"]
+        )
+
+        with (
+            patch.object(irm, "_results_json", return_value=b"{}") as results_json,
+            pytest.raises(SystemExit) as exit_info,
+        ):
+            irm.main()
+
+        assert exit_info.value.code == 0
+        results_json.assert_called_once()
+        investigator.format_human_summary.assert_not_called()
+        investigator.save_results.assert_called_once_with(data=b"{}")
@@ -243,6 +243,23 @@ class TestCLIDocumentation:
         assert costs.__doc__ is not None
         assert security.__doc__ is not None
 
+    def test_entry_points_resolve(self):
+        """Test that every pyproject entry point names a command function"""
+        import management_cli
+
+        pyproject = Path(__file__).parent.parent / "pyproject.toml"
+        names = [
+            line.split(":")[-1].strip().strip('"')
+            for line in pyproject.read_text().splitlines()
+            if '"src.management_cli:' in line
+        ]
+
+        assert names
+        for name in names:
+            command = getattr(management_cli, name)
+            assert command.__name__ == name
+            assert command.__doc__
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--cov=src/management_cli.py"])
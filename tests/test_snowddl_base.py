@@ -15,7 +15,7 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from snowddl_core.base import SnowDDLObject
+from snowddl_core.base import AccountLevelObject, SnowDDLObject
 from snowddl_core.snowddl_types import DependencyTuple, FQN, ObjectType
 
 
@@ -181,6 +181,20 @@ class TestToYaml:
 
         assert yaml_dict["custom_field"] == "custom_value"
 
+    def test_compiled_to_yaml_matches_field_loop(self):
+        """Generated account object to_yaml agrees with the generic loop"""
+        from snowddl_core.account_objects import User, Warehouse
+
+        objects = [
+            User("ALICE", "alice", type="SERVICE", disabled=True, comment="c"),
+            Warehouse("WH", size="Large", auto_suspend=60, warehouse_params={}),
+        ]
+
+        for obj in objects:
+            assert type(obj).to_yaml is not AccountLevelObject.to_yaml
+            assert obj.to_yaml() == AccountLevelObject.to_yaml(obj)
+            assert list(obj.to_yaml()) == list(AccountLevelObject.to_yaml(obj))
+
 
 class TestFromYaml:
     """Test from_yaml deserialization"""
@@ -300,6 +300,37 @@ class TestBusinessRoleObject:
         assert "WH1" in role.warehouse_usage
         assert "WH2" in role.warehouse_usage
 
+    def test_business_role_grants_skip_duplicates(self):
+        """Repeated grants are ignored, even after the list is edited directly"""
+        role = BusinessRole(name="TEST_ROLE", warehouse_usage=["WH1"])
+
+        role.add_warehouse_usage("WH1")
+        role.add_warehouse_usage("WH2")
+        role.add_warehouse_usage("WH2")
+        assert role.warehouse_usage == ["WH1", "WH2"]
+
+        role.warehouse_usage.remove("WH2")
+        role.add_warehouse_usage("WH2")
+        assert role.warehouse_usage == ["WH1", "WH2"]
+
+        role.warehouse_usage = ["WH3"]
+        role.add_warehouse_usage("WH1")
+        assert role.warehouse_usage == ["WH3", "WH1"]
+
+        # Same-length edits in place
+        role.warehouse_usage.remove("WH1")
+        role.warehouse_usage.append("WH4")
+        role.add_warehouse_usage("WH4")
+        role.add_warehouse_usage("WH1")
+        assert role.warehouse_usage == ["WH3", "WH4", "WH1"]
+
+        user = User(name="TEST_USER", login_name="test_user", business_roles=["X"])
+        user.add_role("X")
+        user.business_roles[0] = "Y"
+        user.add_role("X")
+        user.add_role("Y")
+        assert user.business_roles == ["Y", "X"]
+
     def test_business_role_add_tech_role(self):
         """Test adding technical role"""
         role = BusinessRole(name="BUSINESS_ROLE")
@@ -578,5 +609,47 @@ class TestObjectIdentity:
         assert len(user_set) == 1  # Should be deduplicated
 
 
+class TestSlots:
+    """Test fixed attribute layout of account objects"""
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            User(name="U", login_name="u"),
+            BusinessRole(name="R"),
+            TechnicalRole(name="T"),
+            Warehouse(name="W"),
+            ResourceMonitor(name="M", credit_quota=10),
+        ],
+        ids=lambda obj: type(obj).__name__,
+    )
+    def test_objects_have_no_instance_dict(self, obj):
+        """Account objects store fields in slots, not a per-instance dict"""
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            obj.not_a_field = 1
+
+
+class TestPackageExports:
+    """Test lazy resolution of the package's public names"""
+
+    def test_all_names_resolve(self):
+        """Every name in __all__ resolves from its submodule"""
+        import importlib
+
+        import snowddl_core
+
+        for name in snowddl_core.__all__:
+            module = importlib.import_module(snowddl_core._LAZY_IMPORTS[name])
+            assert getattr(snowddl_core, name) is getattr(module, name)
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Names outside __all__ raise AttributeError"""
+        import snowddl_core
+
+        with pytest.raises(AttributeError):
+            snowddl_core.NotAnObject
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--cov=src/snowddl_core"])